@@ -3,6 +3,10 @@ Jace Berelen POC - Public Environment Configuration
 Configurações que podem ser commitadas no git (não sensíveis)
 """
 
+import re
+from types import MappingProxyType
+from typing import Optional
+
 # ============================================================================
 # APPLICATION SETTINGS (Public)
 # ============================================================================
@@ -69,16 +73,17 @@ DEFAULT_SESSION_TIMEOUT_MINUTES = 30
 DEFAULT_ENABLE_WEB_SCRAPING = True
 DEFAULT_ENABLE_FILE_UPLOADS = False
 DEFAULT_ENABLE_SYSTEM_COMMANDS = False
+DEFAULT_ENABLE_SYNC_DB = False  # Sync engine only needed for migrations/scripts
 
 # ============================================================================
 # API CONFIGURATION (Public)
 # ============================================================================
 
 # CORS settings
-CORS_ALLOW_ORIGINS = ["*"]  # Restringir em produção
+CORS_ALLOW_ORIGINS = ("*",)  # Restringir em produção
 CORS_ALLOW_CREDENTIALS = True
-CORS_ALLOW_METHODS = ["*"]
-CORS_ALLOW_HEADERS = ["*"]
+CORS_ALLOW_METHODS = ("*",)
+CORS_ALLOW_HEADERS = ("*",)
 
 # Health check settings
 HEALTH_CHECK_PATH = "/health"
@@ -89,7 +94,7 @@ HEALTH_CHECK_TIMEOUT = 300
 # ============================================================================
 
 # Custos aproximados por modelo (referência pública)
-MODEL_COSTS = {
+_MODEL_COSTS = {
     "anthropic/claude-3.5-sonnet": {
         "input_cost_per_token": 0.000003,
         "output_cost_per_token": 0.000015,
@@ -108,19 +113,24 @@ MODEL_COSTS = {
     }
 }
 
+# Read-only views; per-direction tables need a single lookup in billing paths
+MODEL_COSTS = MappingProxyType({k: MappingProxyType(v) for k, v in _MODEL_COSTS.items()})
+MODEL_INPUT_COST = MappingProxyType({k: v["input_cost_per_token"] for k, v in _MODEL_COSTS.items()})
+MODEL_OUTPUT_COST = MappingProxyType({k: v["output_cost_per_token"] for k, v in _MODEL_COSTS.items()})
+
 # ============================================================================
 # DEPLOYMENT CONFIGURATION (Public)
 # ============================================================================
 
 # Railway detection
-RAILWAY_ENVIRONMENTS = ["production", "staging"]
+RAILWAY_ENVIRONMENTS = ("production", "staging")
 
 # Allowed hosts for different environments
-ALLOWED_HOSTS = {
-    "development": ["localhost", "127.0.0.1", "*.ngrok.io", "*.loca.lt"],
-    "production": ["*.railway.app", "*.herokuapp.com"],
-    "staging": ["*.railway.app", "*.ngrok.io"]
-}
+ALLOWED_HOSTS = MappingProxyType({
+    "development": ("localhost", "127.0.0.1", "*.ngrok.io", "*.loca.lt"),
+    "production": ("*.railway.app", "*.herokuapp.com"),
+    "staging": ("*.railway.app", "*.ngrok.io")
+})
 
 # ============================================================================
 # LOGGING CONFIGURATION (Public)
@@ -141,9 +151,9 @@ LOG_LEVELS = {
 # TASK MANAGEMENT (Public Defaults)
 # ============================================================================
 
-DEFAULT_TASK_PRIORITIES = ["low", "medium", "high", "urgent"]
-DEFAULT_TASK_STATUSES = ["pending", "in_progress", "completed", "failed", "cancelled"]
-DEFAULT_JOB_TYPES = ["remote", "hybrid", "onsite"]
+DEFAULT_TASK_PRIORITIES = ("low", "medium", "high", "urgent")
+DEFAULT_TASK_STATUSES = ("pending", "in_progress", "completed", "failed", "cancelled")
+DEFAULT_JOB_TYPES = ("remote", "hybrid", "onsite")
 
 # ============================================================================
 # WORKSPACE CONFIGURATION (Public)
@@ -157,7 +167,7 @@ DEFAULT_TEMP_DIR = "./temp"
 # API ENDPOINTS (Public)
 # ============================================================================
 
-API_ENDPOINTS = {
+API_ENDPOINTS = MappingProxyType({
     "health": "/health",
     "docs": "/docs",
     "redoc": "/redoc",
@@ -170,7 +180,7 @@ API_ENDPOINTS = {
     "webhooks_github": "/webhooks/github",
     "metrics_usage": "/metrics/usage",
     "metrics_performance": "/metrics/performance"
-}
+})
 
 # ============================================================================
 # VALIDATION RULES (Public)
@@ -185,6 +195,19 @@ TOKEN_FORMATS = {
     "anthropic": "ant-"
 }
 
+# Prefixes tried longest first so "sk-or-" wins over "sk-"
+TOKEN_PREFIX_RE = re.compile("|".join(
+    re.escape(p) for p in sorted(TOKEN_FORMATS.values(), key=len, reverse=True)
+))
+TOKEN_PREFIX_MAP = {v: k for k, v in TOKEN_FORMATS.items()}
+
+
+def classify_token(token: str) -> Optional[str]:
+    """Return the TOKEN_FORMATS key whose prefix the token carries, if any"""
+    match = TOKEN_PREFIX_RE.match(token)
+    return TOKEN_PREFIX_MAP[match.group(0)] if match else None
+
+
 # Tamanhos mínimos/máximos
 VALIDATION_RULES = {
     "secret_key_min_length": 32,
@@ -229,14 +252,14 @@ __all__ = [
     
     # Costs
     "DEFAULT_MONTHLY_BUDGET_LIMIT", "DEFAULT_AI_COST_ALERT_THRESHOLD", 
-    "DEFAULT_CLIENT_BUDGET", "MODEL_COSTS",
+    "DEFAULT_CLIENT_BUDGET", "MODEL_COSTS", "MODEL_INPUT_COST", "MODEL_OUTPUT_COST",
     
     # Security
     "DEFAULT_RATE_LIMIT_PER_MINUTE", "DEFAULT_SESSION_TIMEOUT_MINUTES",
     
     # Features
     "DEFAULT_ENABLE_WEB_SCRAPING", "DEFAULT_ENABLE_FILE_UPLOADS", 
-    "DEFAULT_ENABLE_SYSTEM_COMMANDS",
+    "DEFAULT_ENABLE_SYSTEM_COMMANDS", "DEFAULT_ENABLE_SYNC_DB",
     
     # CORS
     "CORS_ALLOW_ORIGINS", "CORS_ALLOW_CREDENTIALS", "CORS_ALLOW_METHODS", 
@@ -261,7 +284,8 @@ __all__ = [
     "API_ENDPOINTS",
     
     # Validation
-    "TOKEN_FORMATS", "VALIDATION_RULES",
+    "TOKEN_FORMATS", "TOKEN_PREFIX_RE", "TOKEN_PREFIX_MAP", "classify_token",
+    "VALIDATION_RULES",
     
     # Development
     "DEVELOPMENT_DEFAULTS"
@@ -5,13 +5,14 @@ SQLite for development, PostgreSQL for Railway production
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from enum import Enum
 
 from sqlalchemy import (
     create_engine, Column, Integer, String, DateTime, Text, Boolean, 
-    Float, JSON, ForeignKey, Index, UniqueConstraint
+    Float, JSON, ForeignKey, Index, UniqueConstraint, bindparam, insert
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
@@ -171,8 +172,10 @@ class Task(Base):
     ai_interactions = relationship("AIInteraction", back_populates="task", cascade="all, delete-orphan")
     
     # Indexes
+    # idx_task_user_status_priority_created matches get_active_tasks'
+    # WHERE/ORDER BY so the planner can walk it pre-sorted and stop at LIMIT
     __table_args__ = (
-        Index('idx_task_user_status', 'user_id', 'status'),
+        Index('idx_task_user_status_priority_created', user_id, status, priority.desc(), created_at),
         Index('idx_task_job_status', 'job_id', 'status'),
         Index('idx_task_due_date', 'due_date'),
         Index('idx_task_priority', 'priority'),
@@ -358,7 +361,8 @@ class DatabaseManager:
             bind=self.async_engine,
             class_=AsyncSession,
             autocommit=False,
-            autoflush=False
+            autoflush=False,
+            expire_on_commit=False
         )
         
         logger.info(f"Initialized async database: {async_url}")
@@ -370,6 +374,28 @@ class DatabaseManager:
         
         Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created successfully")
+        
+        self.create_indexes()
+    
+    async def create_tables_async(self):
+        """Create all database tables and indexes through the async engine"""
+        if not self.async_engine:
+            self.initialize_async_db()
+        
+        async with self.async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables created successfully")
+            
+            await conn.run_sync(_create_missing_indexes)
+            logger.info("Database indexes verified")
+    
+    def create_indexes(self):
+        """Create any indexes missing from already-existing tables"""
+        if not self.engine:
+            self.initialize_sync_db()
+        
+        _create_missing_indexes(self.engine)
+        logger.info("Database indexes verified")
     
     def get_session(self) -> Session:
         """Get synchronous database session"""
@@ -390,13 +416,22 @@ class DatabaseManager:
                 self.initialize_async_db()
             
             async with self.async_session_factory() as session:
-                result = await session.execute(text("SELECT 1"))
+                result = await session.execute(_HEALTH_CHECK_SQL)
                 return result.scalar() == 1
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return False
 
 
+def _create_missing_indexes(bind):
+    """Create declared indexes that do not exist yet on bind"""
+    # create_all() only emits indexes alongside new tables, so databases
+    # created before an index was declared need it added explicitly
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
 # Global database manager instance
 db_manager = DatabaseManager()
 
@@ -405,12 +440,88 @@ db_manager = DatabaseManager()
 # DATABASE OPERATIONS
 # ============================================================================
 
-async def get_or_create_user(slack_user_id: str, username: str, email: str = None) -> User:
-    """Get existing user or create new one"""
+# Hot-path statements are built once at import rather than re-parsed on
+# every call; fixed bind types also keep SQLAlchemy's compiled cache warm
+_HEALTH_CHECK_SQL = text("SELECT 1")
+
+_USER_BY_SLACK_ID_SQL = text(
+    "SELECT * FROM users WHERE slack_user_id = :slack_user_id"
+).bindparams(bindparam("slack_user_id", type_=String))
+
+_TOUCH_USER_SQL = text(
+    "UPDATE users SET last_active = :now WHERE id = :user_id"
+).bindparams(bindparam("now", type_=DateTime), bindparam("user_id", type_=Integer))
+
+_DAILY_AI_COST_SQL = text("""
+    SELECT COALESCE(SUM(cost_usd), 0) 
+    FROM ai_interactions 
+    WHERE user_id = :user_id 
+    AND created_at >= :start_date 
+    AND created_at < :end_date
+""").bindparams(
+    bindparam("user_id", type_=Integer),
+    bindparam("start_date", type_=DateTime),
+    bindparam("end_date", type_=DateTime)
+)
+
+# full_count is computed before LIMIT, giving the real total in the same scan
+_ACTIVE_TASKS_SQL = text("""
+    SELECT *, COUNT(*) OVER() AS full_count FROM tasks 
+    WHERE user_id = :user_id 
+    AND status IN ('pending', 'in_progress')
+    ORDER BY priority DESC, created_at ASC
+    LIMIT :limit
+""").bindparams(bindparam("user_id", type_=Integer), bindparam("limit", type_=Integer))
+
+_ALL_ACTIVE_TASKS_SQL = text("""
+    SELECT * FROM tasks 
+    WHERE user_id = :user_id 
+    AND status IN ('pending', 'in_progress')
+    ORDER BY priority DESC, created_at ASC
+""").bindparams(bindparam("user_id", type_=Integer))
+
+_COUNT_USERS_SQL = text("SELECT COUNT(*) FROM users")
+
+_COUNT_ACTIVE_TASKS_SQL = text(
+    "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'in_progress')"
+)
+
+
+async def db_session() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency yielding one session per request
+    
+    All helpers called with this session share a single connection and
+    transaction, committed once when the request completes.
+    """
     async with db_manager.get_async_session() as session:
+        async with session.begin():
+            yield session
+
+
+@asynccontextmanager
+async def _session_scope(session: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+    """Reuse the caller's session, or open a short-lived transaction"""
+    if session is not None:
+        yield session
+        return
+    
+    async with db_manager.get_async_session() as own_session:
+        async with own_session.begin():
+            yield own_session
+
+
+async def get_or_create_user(
+    slack_user_id: str,
+    username: str,
+    email: str = None,
+    session: AsyncSession = None
+) -> User:
+    """Get existing user or create new one"""
+    async with _session_scope(session) as session:
         # Try to find existing user
         result = await session.execute(
-            text("SELECT * FROM users WHERE slack_user_id = :slack_user_id"),
+            _USER_BY_SLACK_ID_SQL,
             {"slack_user_id": slack_user_id}
         )
         user_data = result.fetchone()
@@ -418,10 +529,9 @@ async def get_or_create_user(slack_user_id: str, username: str, email: str = Non
         if user_data:
             # Update last active
             await session.execute(
-                text("UPDATE users SET last_active = :now WHERE id = :user_id"),
+                _TOUCH_USER_SQL,
                 {"now": datetime.utcnow(), "user_id": user_data[0]}
             )
-            await session.commit()
             
             # Convert to User object
             user = User(
@@ -447,7 +557,7 @@ async def get_or_create_user(slack_user_id: str, username: str, email: str = Non
             )
             
             session.add(new_user)
-            await session.commit()
+            await session.flush()
             await session.refresh(new_user)
             
             logger.info(f"Created new user: {username} ({slack_user_id})")
@@ -460,10 +570,11 @@ async def create_task(
     description: str = "",
     job_id: int = None,
     priority: str = "medium",
-    due_date: datetime = None
+    due_date: datetime = None,
+    session: AsyncSession = None
 ) -> Task:
     """Create a new task"""
-    async with db_manager.get_async_session() as session:
+    async with _session_scope(session) as session:
         task = Task(
             user_id=user_id,
             job_id=job_id,
@@ -474,7 +585,7 @@ async def create_task(
         )
         
         session.add(task)
-        await session.commit()
+        await session.flush()
         await session.refresh(task)
         
         logger.info(f"Created task: {title} (ID: {task.id})")
@@ -490,10 +601,11 @@ async def log_ai_interaction(
     tokens_used: int,
     cost_usd: float,
     response_time_ms: int,
-    task_id: int = None
+    task_id: int = None,
+    session: AsyncSession = None
 ) -> AIInteraction:
     """Log an AI interaction for tracking"""
-    async with db_manager.get_async_session() as session:
+    async with _session_scope(session) as session:
         interaction = AIInteraction(
             user_id=user_id,
             task_id=task_id,
@@ -507,13 +619,97 @@ async def log_ai_interaction(
         )
         
         session.add(interaction)
-        await session.commit()
+        await session.flush()
         await session.refresh(interaction)
         
         return interaction
 
 
-async def get_user_daily_ai_cost(user_id: int, date: datetime = None) -> float:
+class InteractionLogWriter:
+    """
+    Background writer that batches AI interaction rows
+    
+    Request handlers enqueue rows without awaiting the database; a single
+    task drains the queue and bulk-inserts up to max_batch_size rows per
+    flush_interval.
+    """
+    
+    def __init__(self, max_batch_size: int = 50, flush_interval: float = 0.1):
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def enqueue(self, **fields):
+        """Queue an interaction row (same fields as log_ai_interaction)"""
+        if self._task is None or self._task.done():
+            self.start()
+        
+        fields.setdefault("created_at", datetime.utcnow())
+        self._queue.put_nowait(fields)
+    
+    def start(self):
+        """Start the writer task on the running event loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        """Flush everything queued so far and stop the writer"""
+        if self._task is None or self._task.done():
+            return
+        
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            record = await self._queue.get()
+            if record is None:
+                return
+            
+            batch = [record]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            
+            await self._write(batch)
+            
+            if stopping:
+                return
+    
+    async def _write(self, batch: List[Dict[str, Any]]):
+        try:
+            async with _session_scope() as session:
+                await session.execute(insert(AIInteraction), batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} AI interactions: {e}")
+
+
+# Global interaction log writer
+interaction_log_writer = InteractionLogWriter()
+
+
+async def get_user_daily_ai_cost(
+    user_id: int,
+    date: datetime = None,
+    session: AsyncSession = None
+) -> float:
     """Get user's AI cost for a specific day"""
     if date is None:
         date = datetime.utcnow().date()
@@ -521,15 +717,9 @@ async def get_user_daily_ai_cost(user_id: int, date: datetime = None) -> float:
     start_date = datetime.combine(date, datetime.min.time())
     end_date = start_date + timedelta(days=1)
     
-    async with db_manager.get_async_session() as session:
+    async with _session_scope(session) as session:
         result = await session.execute(
-            text("""
-                SELECT COALESCE(SUM(cost_usd), 0) 
-                FROM ai_interactions 
-                WHERE user_id = :user_id 
-                AND created_at >= :start_date 
-                AND created_at < :end_date
-            """),
+            _DAILY_AI_COST_SQL,
             {
                 "user_id": user_id,
                 "start_date": start_date,
@@ -540,22 +730,33 @@ async def get_user_daily_ai_cost(user_id: int, date: datetime = None) -> float:
         return result.scalar() or 0.0
 
 
-async def get_active_tasks(user_id: int, limit: int = 10) -> List[Task]:
+async def get_active_tasks(
+    user_id: int,
+    limit: int = 10,
+    session: AsyncSession = None
+) -> List[Task]:
     """Get active tasks for a user"""
-    async with db_manager.get_async_session() as session:
+    tasks, _ = await get_active_tasks_with_total(user_id, limit=limit, session=session)
+    return tasks
+
+
+async def get_active_tasks_with_total(
+    user_id: int,
+    limit: int = 10,
+    session: AsyncSession = None
+) -> Tuple[List[Task], int]:
+    """Get a page of active tasks plus the user's total active task count"""
+    async with _session_scope(session) as session:
         result = await session.execute(
-            text("""
-                SELECT * FROM tasks 
-                WHERE user_id = :user_id 
-                AND status IN ('pending', 'in_progress')
-                ORDER BY priority DESC, created_at ASC
-                LIMIT :limit
-            """),
+            _ACTIVE_TASKS_SQL,
             {"user_id": user_id, "limit": limit}
         )
         
+        rows = result.fetchall()
+        total = rows[0].full_count if rows else 0
+        
         tasks = []
-        for row in result.fetchall():
+        for row in rows:
             task = Task(
                 id=row[0],
                 user_id=row[1],
@@ -583,16 +784,55 @@ async def get_active_tasks(user_id: int, limit: int = 10) -> List[Task]:
             )
             tasks.append(task)
         
-        return tasks
+        return tasks, total
+
+
+async def stream_active_tasks(user_id: int) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a user's active tasks as row mappings
+    
+    Rows are yielded as the driver receives them instead of being
+    materialized with fetchall(), so memory stays flat regardless of how
+    many tasks the user has.
+    """
+    if not db_manager.async_engine:
+        db_manager.initialize_async_db()
+    
+    async with db_manager.async_engine.connect() as conn:
+        result = await conn.stream(
+            _ALL_ACTIVE_TASKS_SQL,
+            {"user_id": user_id}
+        )
+        
+        async for row in result.mappings():
+            yield row
+
+
+async def count_users(session: AsyncSession = None) -> int:
+    """Count registered users"""
+    async with _session_scope(session) as session:
+        result = await session.execute(_COUNT_USERS_SQL)
+        return result.scalar() or 0
+
+
+async def count_active_tasks(session: AsyncSession = None) -> int:
+    """Count pending and in-progress tasks across all users"""
+    async with _session_scope(session) as session:
+        result = await session.execute(_COUNT_ACTIVE_TASKS_SQL)
+        return result.scalar() or 0
 
 
 # Initialize database on import
-def init_database():
+async def init_database():
     """Initialize database connection and create tables"""
     try:
-        db_manager.initialize_sync_db()
+        # The app only talks to the database through the async engine; the
+        # sync engine is opt-in for migrations and scripts
+        if settings.enable_sync_db:
+            db_manager.initialize_sync_db()
+        
         db_manager.initialize_async_db()
-        db_manager.create_tables()
+        await db_manager.create_tables_async()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -611,10 +851,17 @@ __all__ = [
     "JobPriority",
     "DatabaseManager",
     "db_manager",
+    "db_session",
     "get_or_create_user",
     "create_task",
     "log_ai_interaction",
+    "InteractionLogWriter",
+    "interaction_log_writer",
     "get_user_daily_ai_cost",
     "get_active_tasks",
+    "get_active_tasks_with_total",
+    "stream_active_tasks",
+    "count_users",
+    "count_active_tasks",
     "init_database"
 ] 
\ No newline at end of file
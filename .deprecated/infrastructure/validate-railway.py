@@ -5,105 +5,121 @@ Checks if everything is ready for deployment
 """
 
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-def check_file_exists(filepath, description):
+REQUIRED_PACKAGES = [
+    "fastapi",
+    "uvicorn",
+    "gunicorn",
+    "asyncpg",
+    "psycopg2-binary",
+    "sqlalchemy",
+    "slack-sdk",
+    "openai"
+]
+_REQUIRED_PACKAGES_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(REQUIRED_PACKAGES, key=len, reverse=True))
+)
+
+def snapshot_files(*dirs):
+    """List the given directories once so existence checks are set lookups"""
+    present = set()
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    present.add(os.path.normpath(os.path.join(directory, entry.name)))
+        except FileNotFoundError:
+            pass
+    return present
+
+def read_files(paths):
+    """Read files concurrently; missing files map to None"""
+    def read(path):
+        try:
+            return Path(path).read_text()
+        except FileNotFoundError:
+            return None
+    
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = {executor.submit(read, path): path for path in paths}
+        return {futures[f]: f.result() for f in as_completed(futures)}
+
+def check_file_exists(filepath, description, present=None):
     """Check if a file exists"""
-    if Path(filepath).exists():
+    exists = os.path.normpath(filepath) in present if present is not None else Path(filepath).exists()
+    if exists:
         print(f"✅ {description}: {filepath}")
         return True
     else:
         print(f"❌ {description}: {filepath} - MISSING")
         return False
 
-def check_requirements():
+def check_requirements(content):
     """Check if requirements.txt has Railway dependencies"""
-    try:
-        with open("requirements.txt", "r") as f:
-            content = f.read()
-        
-        required_packages = [
-            "fastapi",
-            "uvicorn",
-            "gunicorn",
-            "asyncpg",
-            "psycopg2-binary",
-            "sqlalchemy",
-            "slack-sdk",
-            "openai"
-        ]
-        
-        missing = []
-        for package in required_packages:
-            if package not in content:
-                missing.append(package)
-        
-        if not missing:
-            print("✅ Requirements.txt has all Railway dependencies")
-            return True
-        else:
-            print(f"❌ Requirements.txt missing: {', '.join(missing)}")
-            return False
-            
-    except FileNotFoundError:
+    if content is None:
         print("❌ requirements.txt not found")
         return False
+    
+    found = {m.group(0) for m in _REQUIRED_PACKAGES_RE.finditer(content)}
+    missing = [package for package in REQUIRED_PACKAGES if package not in found]
+    
+    if not missing:
+        print("✅ Requirements.txt has all Railway dependencies")
+        return True
+    else:
+        print(f"❌ Requirements.txt missing: {', '.join(missing)}")
+        return False
 
-def check_config_imports():
+def check_config_imports(content):
     """Check if src/config.py has Railway functions"""
-    try:
-        with open("src/config.py", "r") as f:
-            content = f.read()
-        
-        required_functions = [
-            "is_railway",
-            "get_port", 
-            "get_database_url"
-        ]
-        
-        missing = []
-        for func in required_functions:
-            if f"def {func}" not in content:
-                missing.append(func)
-        
-        if not missing:
-            print("✅ Config.py has all Railway functions")
-            return True
-        else:
-            print(f"❌ Config.py missing functions: {', '.join(missing)}")
-            return False
-            
-    except FileNotFoundError:
+    if content is None:
         print("❌ src/config.py not found")
         return False
+    
+    required_functions = [
+        "is_railway",
+        "get_port", 
+        "get_database_url"
+    ]
+    
+    missing = []
+    for func in required_functions:
+        if f"def {func}" not in content:
+            missing.append(func)
+    
+    if not missing:
+        print("✅ Config.py has all Railway functions")
+        return True
+    else:
+        print(f"❌ Config.py missing functions: {', '.join(missing)}")
+        return False
 
-def validate_run_script():
+def validate_run_script(content):
     """Check if run.py is Railway-ready"""
-    try:
-        with open("run.py", "r") as f:
-            content = f.read()
-        
-        checks = [
-            ("is_railway", "Railway detection"),
-            ("get_port", "Port detection"),
-            ("host = \"0.0.0.0\"", "Host binding"),
-            ("workers=1", "Single worker config")
-        ]
-        
-        all_good = True
-        for check, description in checks:
-            if check in content:
-                print(f"✅ Run.py {description}")
-            else:
-                print(f"❌ Run.py missing {description}")
-                all_good = False
-                
-        return all_good
-        
-    except FileNotFoundError:
+    if content is None:
         print("❌ run.py not found")
         return False
+    
+    checks = [
+        ("is_railway", "Railway detection"),
+        ("get_port", "Port detection"),
+        ("host = \"0.0.0.0\"", "Host binding"),
+        ("workers=1", "Single worker config")
+    ]
+    
+    all_good = True
+    for check, description in checks:
+        if check in content:
+            print(f"✅ Run.py {description}")
+        else:
+            print(f"❌ Run.py missing {description}")
+            all_good = False
+            
+    return all_good
 
 def main():
     """Main validation function"""
@@ -111,27 +127,29 @@ def main():
     print("="*60)
     
     all_checks = []
+    present = snapshot_files(".", "src")
+    contents = read_files(["requirements.txt", "src/config.py", "run.py"])
     
     # Check required files
     print("\n📁 CHECKING FILES:")
-    all_checks.append(check_file_exists("railway.toml", "Railway config"))
-    all_checks.append(check_file_exists("Procfile", "Process file"))
-    all_checks.append(check_file_exists("requirements.txt", "Python dependencies"))
-    all_checks.append(check_file_exists("run.py", "Main entry point"))
-    all_checks.append(check_file_exists("src/config.py", "Configuration module"))
-    all_checks.append(check_file_exists("src/database.py", "Database module"))
-    all_checks.append(check_file_exists("src/main.py", "FastAPI app"))
-    all_checks.append(check_file_exists("RAILWAY-DEPLOY.md", "Deploy guide"))
-    all_checks.append(check_file_exists("generate-secrets.py", "Secret generator"))
+    all_checks.append(check_file_exists("railway.toml", "Railway config", present))
+    all_checks.append(check_file_exists("Procfile", "Process file", present))
+    all_checks.append(check_file_exists("requirements.txt", "Python dependencies", present))
+    all_checks.append(check_file_exists("run.py", "Main entry point", present))
+    all_checks.append(check_file_exists("src/config.py", "Configuration module", present))
+    all_checks.append(check_file_exists("src/database.py", "Database module", present))
+    all_checks.append(check_file_exists("src/main.py", "FastAPI app", present))
+    all_checks.append(check_file_exists("RAILWAY-DEPLOY.md", "Deploy guide", present))
+    all_checks.append(check_file_exists("generate-secrets.py", "Secret generator", present))
     
     # Check dependencies
     print("\n📦 CHECKING DEPENDENCIES:")
-    all_checks.append(check_requirements())
+    all_checks.append(check_requirements(contents["requirements.txt"]))
     
     # Check configuration
     print("\n⚙️ CHECKING CONFIGURATION:")
-    all_checks.append(check_config_imports())
-    all_checks.append(validate_run_script())
+    all_checks.append(check_config_imports(contents["src/config.py"]))
+    all_checks.append(validate_run_script(contents["run.py"]))
     
     # Final verdict
     print("\n" + "="*60)
@@ -1,10 +1,37 @@
 import os
 import json
+import queue
 import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from typing import Deque, Dict, List, Set
 from datetime import datetime
 
+# watchdog is optional; without it the orchestrator falls back to polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# Seconds to wait for a filesystem event (watchdog) or between polls (fallback)
+EVENT_WAIT_SECONDS = 60
+IDLE_POLL_SECONDS = 10
+COMPLETION_POLL_SECONDS = 5
+
+
+class _TaskDirHandler(FileSystemEventHandler):
+    """Wakes the orchestrator loop on any change in TODO or DONE"""
+    
+    def __init__(self, events: queue.Queue):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event) -> None:
+        self.events.put(event.src_path)
+
+
 class TaskOrchestrator:
     def __init__(self):
         self.root_dir = Path(os.getcwd())
@@ -16,6 +43,107 @@ class TaskOrchestrator:
         # Create necessary directories
         for dir_path in [self.todo_dir, self.done_dir, self.in_progress_dir, self.agents_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # In-memory dependency graph, built once and updated incrementally
+        self._done: Set[str] = set()
+        self._known: Set[Path] = set()
+        self._contents: Dict[Path, str] = {}
+        self._blocked: Dict[Path, Set[str]] = {}
+        self._ready: Deque[Path] = deque()
+        
+        self._refresh_done()
+        self._load_todo()
+        
+        self._events: queue.Queue = queue.Queue()
+        self._observer = None
+
+    def _start_watching(self) -> None:
+        """Subscribes to TODO/DONE changes when watchdog is installed"""
+        if Observer is None or self._observer is not None:
+            return
+        
+        handler = _TaskDirHandler(self._events)
+        self._observer = Observer()
+        self._observer.schedule(handler, str(self.todo_dir))
+        self._observer.schedule(handler, str(self.done_dir))
+        self._observer.daemon = True
+        self._observer.start()
+
+    def _wait(self, poll_seconds: int) -> None:
+        """Blocks until a directory event arrives, or sleeps when polling"""
+        if self._observer is None:
+            time.sleep(poll_seconds)
+            return
+        
+        try:
+            self._events.get(timeout=EVENT_WAIT_SECONDS)
+        except queue.Empty:
+            return
+        
+        # Collapse bursts of events into a single wakeup
+        while not self._events.empty():
+            self._events.get_nowait()
+
+    def _register_task(self, task_path: Path, content: str) -> None:
+        """Adds a TODO task to the ready queue or the blocked map"""
+        # Already queued (e.g. regenerated agent task): keep the latest content only
+        if task_path in self._known:
+            self._contents[task_path] = content
+            return
+        
+        self._known.add(task_path)
+        self._contents[task_path] = content
+        
+        deps = set()
+        if "dependencies:" in content:
+            line = content.split("dependencies:")[1].split("\n")[0]
+            deps = {d.strip() for d in line.split(",") if d.strip()}
+        
+        pending = {d for d in deps if not self.is_task_completed(d)}
+        if pending:
+            self._blocked[task_path] = pending
+        else:
+            self._ready.append(task_path)
+
+    def _forget(self, task_path: Path) -> None:
+        """Drops a task from the graph so the same path can be registered again"""
+        self._known.discard(task_path)
+        self._contents.pop(task_path, None)
+        self._blocked.pop(task_path, None)
+        if task_path in self._ready:
+            self._ready.remove(task_path)
+
+    def _load_todo(self) -> None:
+        """Registers TODO tasks not seen before and forgets ones that disappeared"""
+        with os.scandir(self.todo_dir) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+        
+        present = {self.todo_dir / name for name in names}
+        for task_path in self._known - present:
+            self._forget(task_path)
+        
+        for name in names:
+            task_path = self.todo_dir / name
+            if task_path not in self._known:
+                self._register_task(task_path, task_path.read_text())
+
+    def _mark_done(self, stem: str) -> None:
+        """Records a finished task and promotes tasks it was blocking"""
+        if stem in self._done:
+            return
+        self._done.add(stem)
+        
+        for task_path, pending in list(self._blocked.items()):
+            pending.difference_update({d for d in pending if stem.startswith(d)})
+            if not pending:
+                del self._blocked[task_path]
+                self._ready.append(task_path)
+
+    def _refresh_done(self) -> None:
+        """Picks up tasks moved to DONE outside this orchestrator"""
+        with os.scandir(self.done_dir) as entries:
+            for entry in entries:
+                self._mark_done(Path(entry.name).stem)
 
     def create_agent_tasks(self, task_id: str) -> None:
         """Creates subtasks for each agent based on main task"""
@@ -30,29 +158,25 @@ class TaskOrchestrator:
                 
                 agent_task_file = self.todo_dir / f"{task_id}_{agent}.md"
                 agent_task_file.write_text(new_task)
+                self._register_task(agent_task_file, new_task)
 
     def get_next_task(self) -> Dict:
         """Gets the next task to be processed based on dependencies"""
-        tasks = list(self.todo_dir.glob("*.md"))
-        if not tasks:
-            return None
-            
-        # Read task metadata and check dependencies
-        for task_path in tasks:
-            with open(task_path, 'r') as f:
-                content = f.read()
-                if "dependencies:" in content:
-                    deps = [d.strip() for d in content.split("dependencies:")[1].split("\n")[0].split(",")]
-                    if all(self.is_task_completed(d) for d in deps):
-                        return {"path": task_path, "content": content}
-                else:
-                    return {"path": task_path, "content": content}
+        self._refresh_done()
+        self._load_todo()
+        
+        while self._ready:
+            task_path = self._ready.popleft()
+            self._known.discard(task_path)
+            content = self._contents.pop(task_path)
+            if task_path.exists():
+                return {"path": task_path, "content": content}
         
         return None
 
     def is_task_completed(self, task_id: str) -> bool:
         """Checks if a task is completed"""
-        return any((self.done_dir / f"{task_id}*").glob("*"))
+        return task_id in self._done or any(s.startswith(task_id) for s in self._done)
 
     def move_to_in_progress(self, task_path: Path) -> None:
         """Moves task to IN_PROGRESS folder"""
@@ -64,16 +188,18 @@ class TaskOrchestrator:
         for task_file in self.in_progress_dir.glob(f"{task_id}*"):
             dest = self.done_dir / task_file.name
             task_file.rename(dest)
+            self._mark_done(task_file.stem)
 
     def run(self) -> None:
         """Main orchestration loop"""
         print("Starting task orchestration...")
+        self._start_watching()
         
         while True:
             next_task = self.get_next_task()
             if not next_task:
                 print("No tasks available. Waiting...")
-                time.sleep(10)
+                self._wait(IDLE_POLL_SECONDS)
                 continue
 
             task_path = next_task["path"]
@@ -89,7 +215,8 @@ class TaskOrchestrator:
             
             # Wait for completion signal (task moved to DONE)
             while not self.is_task_completed(task_path.stem):
-                time.sleep(5)
+                self._wait(COMPLETION_POLL_SECONDS)
+                self._refresh_done()
             
             print(f"Task completed: {task_path.name}")
 
@@ -20,6 +20,7 @@ from src import (
     init_database, 
     display_startup_banner,
     setup_logging,
+    init,
     get_port,
     is_railway
 )
@@ -61,7 +62,7 @@ async def startup_checks():
     # Database initialization
     logger.info("Initializing database...")
     try:
-        init_database()
+        await init_database()
         logger.info("Database initialization completed")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -75,6 +76,8 @@ async def startup_checks():
 def main():
     """Main entry point"""
     
+    init()
+    
     # Setup signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -108,7 +111,7 @@ def main():
                 reload=False,  # Never reload in production
                 log_level="info",
                 access_log=True,
-                loop="asyncio",
+                loop="auto",  # uvloop when installed, asyncio otherwise (e.g. Windows)
                 workers=1  # Railway works better with single worker
             )
         else:
@@ -120,7 +123,7 @@ def main():
                 reload=settings.environment == "development",
                 log_level=settings.log_level.lower(),
                 access_log=True,
-                loop="asyncio"
+                loop="auto",  # uvloop when installed, asyncio otherwise (e.g. Windows)
             )
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
@@ -1,24 +1,142 @@
 import os
 import json
+import mmap
 import time
+import atexit
+import bisect
+import functools
+import math
 import hashlib
+from collections import Counter, defaultdict
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Union
+from datetime import datetime
 import difflib
 import re
 
+# BLAKE3 for cache keys when installed; SHA-256 (OpenSSL, SHA-NI where available) otherwise
+try:
+    from blake3 import blake3 as _key_hasher
+except ImportError:
+    _key_hasher = hashlib.sha256
+
+# orjson parses and serializes in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Advisory locks on the log let several processes share one cache directory (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# YAML front-matter block at the top of a task file (group 1 is the header)
+_FRONTMATTER_RE = re.compile(r"^---\s*(.*?)---\s*", re.DOTALL)
+
+# Pending cache/stats changes are written at most this often (and at exit)
+CACHE_FLUSH_INTERVAL = 5.0
+
+# The log is folded into the snapshot once it outgrows the snapshot by this factor
+WAL_COMPACT_RATIO = 4
+WAL_COMPACT_MIN_BYTES = 64 * 1024
+
+# Snapshots at least this large are parsed straight from a read-only mmap (orjson only)
+SNAPSHOT_MMAP_MIN_BYTES = 1 << 20
+
+# Full similarity scoring moves to a process pool above this many candidates
+# (SequenceMatcher is pure Python and holds the GIL, so threads would not help);
+# below it, pickling candidates to workers costs about as much as scoring them
+PARALLEL_SCORE_THRESHOLD = 10_000
+
+def _score_candidate(task_text: str, cached_text: str) -> float:
+    """Worker entry point: similarity of one cached task to the query"""
+    return difflib.SequenceMatcher(None, task_text, cached_text).ratio()
+
+# Shared empty namespace for lookups that miss at the outer level
+_EMPTY = MappingProxyType({})
+
+def _split_key(key: str) -> Tuple[str, str]:
+    """Split "analysis_<hash>" into ("analysis", "<hash>"); keys without a prefix use ""."""
+    namespace, sep, rest = key.partition("_")
+    if not namespace or not sep:
+        return "", key
+    return namespace, rest
+
+def _join_key(namespace: str, rest: str) -> str:
+    return f"{namespace}_{rest}" if namespace else rest
+
+def _jloads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _jdumps(obj: Any, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+def _split_frontmatter(text: str) -> Tuple[str, str]:
+    """Split a task into (front-matter header, body) with a single anchored match"""
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return "", text
+    return match.group(1), text[match.end():]
+
+def _entry_time(entry: Dict[str, Any]) -> float:
+    """Store time of an entry as a Unix timestamp; older entries only carry the ISO string"""
+    stored = entry.get("t")
+    if stored is None:
+        stored = datetime.fromisoformat(entry["timestamp"]).timestamp()
+    return stored
+
+def _hash_key(text: str) -> str:
+    """Fingerprint of task content, used for cache keys and exact-duplicate checks"""
+    return _key_hasher(text.encode()).hexdigest()
+
+@functools.lru_cache(maxsize=4096)
+def _task_fingerprint(text: str) -> str:
+    """Memoized _hash_key; the same task text is looked up and stored repeatedly"""
+    return _hash_key(text)
+
+@functools.lru_cache(maxsize=4096)
+def _task_features(task_content: str) -> Tuple[str, Counter]:
+    """Similarity features of a task: text without front-matter and its character counts.
+    
+    Computed once per distinct task and shared by the index and queries; callers must
+    not mutate the returned Counter.
+    """
+    text = _split_frontmatter(task_content)[1].strip()
+    return text, Counter(text)
+
 class CachingSystem:
     def __init__(self, cache_dir: Optional[Path] = None, max_age_days: float = 7.0):
         """Initialize the caching system"""
         self.cache_dir = cache_dir or Path(os.getcwd()) / "cache"
         self.cache_dir.mkdir(exist_ok=True, parents=True)
         
+        # cache.json is the snapshot; cache.wal logs changes made since it was written
         self.cache_db_path = self.cache_dir / "cache.json"
+        self.wal_path = self.cache_dir / "cache.wal"
         self.max_age_days = max_age_days
         
-        # Initialize cache
+        # Initialize cache; entries live in memory as {namespace: {rest: entry}},
+        # changes are buffered and appended to the log on flush
         self._init_cache_db()
+        self._wal = open(self.wal_path, 'ab')
+        self._wal_pending: List[bytes] = []
+        with self._wal_lock(exclusive=False):
+            self._reload()
+        self._version = 0  # bumped on every change, lets readers keep derived indexes
+        self._stats_dirty = False
+        self._last_flush = time.monotonic()
+        self._flush_interval = CACHE_FLUSH_INTERVAL
         
         # Stats tracking
         self.stats = {
@@ -31,56 +149,164 @@ class CachingSystem:
         # Load stats if they exist
         stats_path = self.cache_dir / "stats.json"
         if stats_path.exists():
-            with open(stats_path, 'r') as f:
-                self.stats = json.load(f)
+            self.stats = _jloads(stats_path.read_bytes())
+        
+        atexit.register(self.flush)
     
     def _init_cache_db(self):
         """Initialize the cache database file if it doesn't exist"""
         if not self.cache_db_path.exists():
-            with open(self.cache_db_path, 'w') as f:
-                json.dump({}, f)
+            self.cache_db_path.write_bytes(_jdumps({}))
     
     def _load_cache(self) -> Dict[str, Any]:
-        """Load the current cache from disk"""
-        with open(self.cache_db_path, 'r') as f:
-            return json.load(f)
+        """Load the current cache snapshot; large ones parse from the page cache without a bytes copy"""
+        with open(self.cache_db_path, 'rb') as fh:
+            if orjson is None or os.fstat(fh.fileno()).st_size < SNAPSHOT_MMAP_MIN_BYTES:
+                return _jloads(fh.read())
+            
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
     
-    def _save_cache(self, cache_data: Dict[str, Any]):
-        """Save the cache to disk"""
-        with open(self.cache_db_path, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+    def _save_cache(self, cache_data: Dict[str, Dict[str, Any]]):
+        """Save the cache snapshot to disk atomically (flat keys on disk)"""
+        cache_data = {
+            _join_key(namespace, rest): entry
+            for namespace, bucket in cache_data.items()
+            for rest, entry in bucket.items()
+        }
+        tmp_path = self.cache_db_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_jdumps(cache_data, indent=True))
+        os.replace(tmp_path, self.cache_db_path)
+    
+    @contextmanager
+    def _wal_lock(self, exclusive: bool):
+        """
+        Hold a lock on the log: shared for appends and reads, exclusive for compaction
+        
+        Without fcntl there is no locking and the cache directory must have a single writer.
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        fcntl.flock(self._wal.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._wal.fileno(), fcntl.LOCK_UN)
+    
+    def _reload(self):
+        """Rebuild the in-memory cache from the snapshot plus the log; call with the lock held"""
+        self._cache: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for key, entry in self._load_cache().items():
+            namespace, rest = _split_key(key)
+            self._cache[namespace][rest] = entry
+        self._replay_wal()
+    
+    def _replay_wal(self):
+        """Apply logged changes on top of the loaded snapshot"""
+        if not self.wal_path.exists():
+            return
+        
+        with open(self.wal_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = _jloads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted write
+                
+                op = record.get("op")
+                if op == "clear":
+                    self._cache.pop(record["ns"], None)
+                    continue
+                
+                namespace, rest = _split_key(record["k"])
+                if op == "put":
+                    self._cache[namespace][rest] = record["v"]
+                elif op == "del":
+                    self._cache.get(namespace, {}).pop(rest, None)
+    
+    def _append_wal(self, record: Dict[str, Any]):
+        """Log one change; written out on the next flush"""
+        self._wal_pending.append(_jdumps(record) + b"\n")
+        self._maybe_flush()
+    
+    def _write_wal(self):
+        """Append buffered records in one write; call with the lock held"""
+        self._wal.write(b"".join(self._wal_pending))
+        self._wal.flush()
+        self._wal_pending.clear()
+    
+    def _compact(self, reset: bool = False):
+        """
+        Fold the log into a fresh snapshot and truncate it
+        
+        Other instances may have appended to the log since this one loaded,
+        so the snapshot is rebuilt from disk under the exclusive lock rather
+        than from memory. With reset, the cache is emptied instead.
+        """
+        with self._wal_lock(exclusive=True):
+            if reset:
+                self._wal_pending.clear()
+                self._cache = defaultdict(dict)
+            else:
+                self._write_wal()
+                self._reload()
+            self._save_cache(self._cache)
+            self._wal.seek(0)
+            self._wal.truncate()
+        self._version += 1
     
     def _save_stats(self):
         """Save the stats to disk"""
         stats_path = self.cache_dir / "stats.json"
-        with open(stats_path, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        stats_path.write_bytes(_jdumps(self.stats, indent=True))
+    
+    def flush(self):
+        """Write pending cache and stats changes to disk"""
+        if self._wal_pending:
+            with self._wal_lock(exclusive=False):
+                self._write_wal()
+                wal_size = self._wal.tell()
+            
+            if wal_size > WAL_COMPACT_MIN_BYTES and \
+                    wal_size > WAL_COMPACT_RATIO * self.cache_db_path.stat().st_size:
+                self._compact()
+        if self._stats_dirty:
+            self._save_stats()
+            self._stats_dirty = False
+        self._last_flush = time.monotonic()
+    
+    def _maybe_flush(self):
+        """Flush if changes are pending and the flush interval has passed"""
+        if time.monotonic() - self._last_flush > self._flush_interval:
+            self.flush()
     
     def store(self, key: str, data: Any):
         """Store data in the cache"""
-        cache = self._load_cache()
-        
-        # Add timestamp for expiration
+        # Add timestamp for expiration; "t" is the same instant as a float for cheap comparisons
+        now = datetime.now()
         entry = {
             "data": data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat(),
+            "t": now.timestamp()
         }
         
-        cache[key] = entry
-        self._save_cache(cache)
+        namespace, rest = _split_key(key)
+        self._cache[namespace][rest] = entry
+        self._version += 1
+        self._append_wal({"op": "put", "k": key, "v": entry})
     
     def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve data from the cache"""
-        cache = self._load_cache()
-        
-        if key not in cache:
+        namespace, rest = _split_key(key)
+        entry = self._cache.get(namespace, _EMPTY).get(rest)
+        if entry is None:
             return None
         
-        entry = cache[key]
-        
         # Check if entry has expired
-        timestamp = datetime.fromisoformat(entry["timestamp"])
-        if (datetime.now() - timestamp) > timedelta(days=self.max_age_days):
+        if time.time() - _entry_time(entry) > self.max_age_days * 86400:
             self.invalidate(key)
             return None
         
@@ -88,32 +314,40 @@ class CachingSystem:
     
     def invalidate(self, key: str):
         """Invalidate a specific cache entry"""
-        cache = self._load_cache()
-        
-        if key in cache:
-            del cache[key]
-            self._save_cache(cache)
+        namespace, rest = _split_key(key)
+        bucket = self._cache.get(namespace)
+        if bucket is not None and bucket.pop(rest, None) is not None:
+            self._version += 1
+            self._append_wal({"op": "del", "k": key})
     
-    def invalidate_all(self):
-        """Invalidate all cache entries"""
-        self._save_cache({})
+    def invalidate_all(self, namespace: Optional[str] = None):
+        """Invalidate all cache entries, or only those under one key prefix (e.g. "analysis")"""
+        self._version += 1
+        if namespace is not None:
+            if self._cache.pop(namespace, None) is not None:
+                self._append_wal({"op": "clear", "ns": namespace})
+            return
+        
+        self._compact(reset=True)
     
     def cleanup(self):
         """Remove expired entries from the cache"""
-        cache = self._load_cache()
-        now = datetime.now()
+        cutoff = time.time() - self.max_age_days * 86400
         
         to_delete = []
-        for key, entry in cache.items():
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            if (now - timestamp) > timedelta(days=self.max_age_days):
-                to_delete.append(key)
-        
-        # Remove expired entries
-        for key in to_delete:
-            del cache[key]
-        
-        self._save_cache(cache)
+        for namespace, bucket in self._cache.items():
+            for rest, entry in bucket.items():
+                if _entry_time(entry) < cutoff:
+                    to_delete.append((namespace, rest))
+        
+        # Log the deletions so they survive the compaction's reload from disk
+        for namespace, rest in to_delete:
+            del self._cache[namespace][rest]
+            self._wal_pending.append(_jdumps({"op": "del", "k": _join_key(namespace, rest)}) + b"\n")
+        if to_delete:
+            self._version += 1
+            self._compact()
+        self.flush()
         return len(to_delete)
     
     def record_api_call(self, call_type: str, tokens: int, cached: bool):
@@ -126,7 +360,8 @@ class CachingSystem:
         else:
             self.stats["tokens_used"] += tokens
         
-        self._save_stats()
+        self._stats_dirty = True
+        self._maybe_flush()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get current caching statistics"""
@@ -151,16 +386,85 @@ class CacheSimilarityDetector:
         """Initialize the similarity detector"""
         self.cache = cache_system
         self.similarity_threshold = similarity_threshold
+        
+        # Extracted text (and its character counts) of every cached task with an
+        # analysis, keyed by task hash; rebuilt only when the cache changed behind our back
+        self._index: Dict[str, Tuple[str, Counter]] = {}
+        self._index_version = -1
+        
+        # Task hashes ordered by text length, so a lookup only visits the length
+        # window that can reach the threshold (_lengths is the parallel sort key)
+        self._lengths: List[int] = []
+        self._length_hashes: List[str] = []
+        
+        # Scoring pool for very large candidate sets; started on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    def _score_pool(self) -> ProcessPoolExecutor:
+        """The detector's scoring pool, created once and reused across lookups"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor()
+            atexit.register(self.close)
+        return self._pool
+    
+    def close(self):
+        """Shut down the scoring pool, if one was started"""
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        atexit.unregister(self.close)
+    
+    def _candidates(self) -> Dict[str, Tuple[str, Counter]]:
+        """Cached task texts to compare against, from the prebuilt index"""
+        if self._index_version != self.cache._version:
+            tasks = self.cache._cache.get("task", _EMPTY)
+            self._index = {}
+            for task_hash in self.cache._cache.get("analysis", _EMPTY):
+                task_entry = tasks.get(task_hash)
+                if task_entry is not None:
+                    self._index[task_hash] = _task_features(task_entry["data"])
+            
+            by_length = sorted((len(text), task_hash) for task_hash, (text, _) in self._index.items())
+            self._lengths = [length for length, _ in by_length]
+            self._length_hashes = [task_hash for _, task_hash in by_length]
+            self._index_version = self.cache._version
+        return self._index
+    
+    def _index_task(self, task_hash: str, task_content: str):
+        """Add or replace one task in the index"""
+        old = self._index.get(task_hash)
+        if old is not None:
+            i = bisect.bisect_left(self._lengths, len(old[0]))
+            while self._length_hashes[i] != task_hash:
+                i += 1
+            del self._lengths[i], self._length_hashes[i]
+        
+        features = _task_features(task_content)
+        self._index[task_hash] = features
+        i = bisect.bisect_right(self._lengths, len(features[0]))
+        self._lengths.insert(i, len(features[0]))
+        self._length_hashes.insert(i, task_hash)
+    
+    def _length_window(self, task_len: int) -> List[str]:
+        """Indexed task hashes whose length allows a ratio of at least the threshold"""
+        self._candidates()
+        # 2*min(a, b)/(a + b) >= t  <=>  a*t/(2 - t) <= b <= a*(2 - t)/t
+        threshold = min(self.similarity_threshold, 1.0)
+        if threshold <= 0:
+            return list(self._length_hashes)
+        lo = math.floor(task_len * threshold / (2 - threshold))
+        hi = math.ceil(task_len * (2 - threshold) / threshold)
+        return self._length_hashes[bisect.bisect_left(self._lengths, lo):bisect.bisect_right(self._lengths, hi)]
     
     def _compute_task_hash(self, task_content: str) -> str:
         """Compute a hash for the task content"""
-        return hashlib.md5(task_content.encode()).hexdigest()
+        return _task_fingerprint(task_content)
     
     def _extract_task_text(self, task_content: str) -> str:
         """Extract meaningful text from task content, removing frontmatter"""
         # Remove YAML frontmatter
-        content = re.sub(r"^---\s*.*?---\s*", "", task_content, flags=re.DOTALL)
-        return content.strip()
+        return _split_frontmatter(task_content)[1].strip()
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
@@ -176,39 +480,49 @@ class CacheSimilarityDetector:
         if self.cache.retrieve(cache_key) is not None:
             return None  # Task is already in cache
         
-        # Extract meaningful text
-        task_text = self._extract_task_text(task_content)
-        
-        # Load all cached analyses
-        cache_data = self.cache._load_cache()
-        
-        best_match = None
-        best_similarity = 0
-        
-        for key, entry in cache_data.items():
-            # Only look at analysis entries
-            if not key.startswith("analysis_"):
+        # Extract meaningful text and its features
+        task_text, task_counts = _task_features(task_content)
+        
+        # Score indexed tasks in the feasible length window; the length and
+        # character-count upper bounds (difflib's real_quick_ratio/quick_ratio, using
+        # the precomputed counts) screen out most of the rest before the full
+        # (quadratic) ratio is computed
+        threshold = self.similarity_threshold
+        task_len = len(task_text)
+        survivors = []
+        for cached_hash in self._length_window(task_len):
+            cached_text, cached_counts = self._index[cached_hash]
+            total = task_len + len(cached_text)
+            if total and 2.0 * min(task_len, len(cached_text)) / total < threshold:
                 continue
-            
-            # Get cached task content
-            cached_hash = key.replace("analysis_", "")
-            cached_task_key = f"task_{cached_hash}"
-            cached_task = self.cache.retrieve(cached_task_key)
-            
-            if cached_task is None:
+            # Multiset intersection size without building an intermediate Counter
+            shared = sum(map(min, task_counts.values(), map(cached_counts.__getitem__, task_counts)))
+            if total and 2.0 * shared / total < threshold:
                 continue
-            
-            # Calculate similarity
-            cached_text = self._extract_task_text(cached_task)
-            similarity = self._calculate_similarity(task_text, cached_text)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = entry["data"]
+            survivors.append((cached_hash, cached_text))
         
-        # Return best match if it's above threshold
-        if best_similarity >= self.similarity_threshold:
-            return best_match
+        if len(survivors) > PARALLEL_SCORE_THRESHOLD:
+            chunksize = max(1, len(survivors) // ((os.cpu_count() or 1) * 4))
+            ratios = self._score_pool().map(_score_candidate, repeat(task_text),
+                                            [text for _, text in survivors], chunksize=chunksize)
+            scores = [(ratio, cached_hash) for ratio, (cached_hash, _) in zip(ratios, survivors)]
+        else:
+            matcher = difflib.SequenceMatcher(None, task_text)
+            scores = []
+            for cached_hash, cached_text in survivors:
+                matcher.set_seq2(cached_text)
+                scores.append((matcher.ratio(), cached_hash))
+        
+        # Best match above threshold whose entries have not expired
+        scores.sort(reverse=True)
+        for similarity, cached_hash in scores:
+            if similarity < self.similarity_threshold:
+                break
+            if self.cache.retrieve(f"task_{cached_hash}") is None:
+                continue
+            analysis = self.cache.retrieve(f"analysis_{cached_hash}")
+            if analysis is not None:
+                return analysis
         
         return None
     
@@ -216,11 +530,20 @@ class CacheSimilarityDetector:
         """Cache task content and its analysis"""
         task_hash = self._compute_task_hash(task_content)
         
+        # Checked before our own writes bump the cache version
+        version = self.cache._version
+        
         # Store task content
         self.cache.store(f"task_{task_hash}", task_content)
         
         # Store analysis
         self.cache.store(f"analysis_{task_hash}", analysis)
+        
+        # Keep the index current instead of rebuilding it on the next lookup,
+        # unless a flush reloaded the cache from disk in between
+        if self._index_version == version and self.cache._version == version + 2:
+            self._index_task(task_hash, task_content)
+            self._index_version = self.cache._version
 
 class TaskCache:
     def __init__(self, root_dir: Optional[Path] = None):
@@ -150,8 +150,13 @@ None - task complete
     def commit_changes(self, task_id):
         """Commit changes to git"""
         try:
-            subprocess.run(["git", "add", "."], check=True)
-            subprocess.run(["git", "commit", "-m", f"Task {task_id} completed"], check=True)
+            git = ["git", "-C", str(self.root_dir)]
+            subprocess.run([*git, "add", "."], check=True, capture_output=True)
+            subprocess.run(
+                [*git, "commit", "-m", f"Task {task_id} completed"],
+                check=True,
+                capture_output=True
+            )
             print(f"Changes committed for task: {task_id}")
         except Exception as e:
             print(f"Failed to commit changes: {e}")
@@ -0,0 +1,49 @@
+"""
+Long-lived pytest worker for the validation system.
+
+Reads one JSON command per line on stdin ({"args": [...]}), runs
+pytest.main(args) in-process and answers with {"exit_code": n} on a
+single line. The interpreter and pytest stay imported between runs;
+modules imported by a run are dropped afterwards (and import finder
+caches invalidated) so the next run sees fresh test and source code.
+Exits when stdin closes.
+"""
+
+import importlib
+import json
+import os
+import sys
+
+import pytest
+
+
+def main():
+    # Keep the real stdout for the protocol; pytest's own output goes nowhere
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+    baseline = set(sys.modules)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        command = json.loads(line)
+        try:
+            exit_code = int(pytest.main(command['args']))
+        except Exception:
+            exit_code = -1
+
+        # Forget modules the run imported so edits are picked up next time, and
+        # drop cached directory listings so newly written test files are found
+        for name in set(sys.modules) - baseline:
+            del sys.modules[name]
+        importlib.invalidate_caches()
+
+        protocol.write(json.dumps({'exit_code': exit_code}) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,175 @@
 import os
 import sys
 import json
-import pytest
+import mmap
 import subprocess
 import re
+import tempfile
+import uuid
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import importlib.util
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import coverage
+from coverage.misc import join_regex
+from coverage.parser import PythonParser
+
+# SlipCover is the preferred coverage backend; coverage.py is the fallback
+SLIPCOVER_AVAILABLE = importlib.util.find_spec("slipcover") is not None
+
+# orjson reads and writes reports in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional multi-pattern matcher for requirement keywords
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# RE2 (linear-time, no backtracking) for large keyword alternations when installed
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+RE2_KEYWORD_THRESHOLD = 64
+
+# Requirements section of a task file, up to the next heading
+_REQ_RE = re.compile(r'## Requirements\s+(.+?)(?=##|\Z)', re.DOTALL)
+
+# Words ignored when extracting requirement keywords
+_COMMON_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'then', 'else', 'when',
+    'at', 'from', 'by', 'for', 'with', 'about', 'to'
+})
+
+# Buffer size for reading implementation sources
+READ_BUFFER_SIZE = 16 * 1024
+
+# Sources at least this large are decoded straight from a read-only mmap
+MMAP_MIN_BYTES = 1 << 20
+
+# Worker count passed to pytest-xdist's -n; "auto" uses every core
+XDIST_WORKERS_ENV = "JACE_XDIST_WORKERS"
+
+# Tests run in parallel workers when pytest-xdist is installed, serially otherwise
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+# With pytest-cov and xdist, tests and coverage share a single pytest run
+COMBINED_RUN_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("pytest_cov", "xdist")
+)
+
+# PEP 669 sys.monitoring is far cheaper than the settrace tracer; coverage.py
+# supports it from 7.4 on Python 3.12+, otherwise force the C tracer
+COVERAGE_CORE = (
+    "sysmon" if sys.version_info >= (3, 12) and coverage.version_info >= (7, 4) else "ctrace"
+)
+
+# Long-lived process that runs pytest.main for each test run
+PYTEST_WORKER = Path(__file__).with_name("pytest_worker.py")
+
+# Per-task content hashes and reports, kept next to the validation reports
+VALIDATION_CACHE_FILE = "_cache.json"
+
+# Evidence search moves to a process pool above this many satisfied requirements
+PARALLEL_TRACE_THRESHOLD = 20
+
+# Implementation text held by each evidence worker process
+_TRACE_TEXT = None
+
+def _init_trace_worker(implementation_text: str) -> None:
+    """Receive the implementation text once per worker"""
+    global _TRACE_TEXT
+    _TRACE_TEXT = implementation_text
+
+def _trace_evidence(keywords: tuple) -> List[str]:
+    """Worker entry point: evidence for one requirement's keywords"""
+    return RequirementTracer._find_evidence(_TRACE_TEXT, keywords)
+
+# Scratch reports go to tmpfs when available so they never touch disk
+_REPORT_TMP_DIR = (
+    Path("/dev/shm") if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else Path(tempfile.gettempdir())
+)
+
+def _temp_report_path(prefix: str) -> Path:
+    """Unique, not-yet-created path for a tool's JSON report"""
+    return _REPORT_TMP_DIR / f"{prefix}_{uuid.uuid4().hex}.json"
+
+def _read_source(path: Path) -> str:
+    """Read a source file; large files decode from the page cache without a bytes copy"""
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size < MMAP_MIN_BYTES:
+            with open(path, 'r', buffering=READ_BUFFER_SIZE) as text_fh:
+                return text_fh.read()
+        
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+            # Match text-mode newline handling
+            if mm.find(b'\r') != -1:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
+
+def _read_json(path: Path) -> Any:
+    payload = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def _coverage_env() -> Dict[str, str]:
+    """Environment for subprocesses measured by coverage.py"""
+    env = os.environ.copy()
+    env["COVERAGE_CORE"] = COVERAGE_CORE
+    return env
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Serialize to a sibling temp file and swap it in, so readers never see a partial file"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, path)
+
+@lru_cache(maxsize=128)
+def _scan_dir(dir_path: str, mtime_ns: int) -> tuple:
+    """Entry names of a directory; keyed on mtime so changes rescan"""
+    with os.scandir(dir_path) as entries:
+        return tuple(sorted(e.name for e in entries))
+
+def _files_in(dir_path: Path, pattern: str) -> List[Path]:
+    """Files in dir_path matching a glob pattern, from the cached scan"""
+    try:
+        mtime_ns = dir_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return [dir_path / name for name in _scan_dir(str(dir_path), mtime_ns)
+            if fnmatch.fnmatchcase(name, pattern)]
+
+@lru_cache(maxsize=256)
+def _statement_lines(file_path: str, mtime_ns: int, exclude: str) -> frozenset:
+    """Measurable statement lines as coverage.py counts them; parsed once per file version"""
+    parser = PythonParser(filename=file_path, exclude=exclude)
+    parser.parse_source()
+    return frozenset(parser.statements)
+
+@lru_cache(maxsize=256)
+def _requirement_texts(file_path: str, mtime_ns: int) -> tuple:
+    """Requirement bullet texts of a task file; parsed once per file version"""
+    req_match = _REQ_RE.search(Path(file_path).read_text())
+    if not req_match:
+        return ()
+    req_lines = [line.strip() for line in req_match.group(1).split('\n') if line.strip().startswith('-')]
+    return tuple(line[1:].strip() for line in req_lines)
 
 class RequirementTracer:
     def __init__(self, task_dir: Path):
@@ -19,62 +181,98 @@ class RequirementTracer:
         if not task_file:
             return []
         
-        content = task_file.read_text()
-        requirements = []
-        
-        # Extract requirements section
-        req_match = re.search(r'## Requirements\s+(.+?)(?=##|\Z)', content, re.DOTALL)
-        if req_match:
-            req_text = req_match.group(1)
-            req_lines = [line.strip() for line in req_text.split('\n') if line.strip().startswith('-')]
-            requirements = [{'id': f'REQ{i+1}', 'text': line[1:].strip(), 'satisfied': False} 
-                           for i, line in enumerate(req_lines)]
-        
-        return requirements
+        # Parsed requirements are cached per file version; callers get fresh dicts
+        texts = _requirement_texts(str(task_file), task_file.stat().st_mtime_ns)
+        return [{'id': f'REQ{i+1}', 'text': text, 'satisfied': False}
+                for i, text in enumerate(texts)]
     
     def trace_requirements(self, task_id: str, implementation_text: str) -> List[Dict[str, Any]]:
         """Check if implementation satisfies requirements"""
         requirements = self.extract_requirements(task_id)
         
+        # One scan of the lowered implementation for every requirement's keywords
+        all_keywords = {
+            k for req in requirements for k in self._extract_keywords(req['text']) if len(k) > 3
+        }
+        found = self._keywords_present(implementation_text.lower(), all_keywords)
+        
         for req in requirements:
             # Basic keyword matching - this would be more sophisticated in real implementation
             keywords = self._extract_keywords(req['text'])
-            req['satisfied'] = all(k.lower() in implementation_text.lower() for k in keywords if len(k) > 3)
+            req['satisfied'] = all(k in found for k in keywords if len(k) > 3)
             
             # Reason for satisfaction/non-satisfaction
             if req['satisfied']:
                 req['reason'] = "Keywords found in implementation"
             else:
                 req['reason'] = "Some keywords missing from implementation"
-                
-            # Evidence - code snippets that satisfy the requirement
-            if req['satisfied']:
-                req['evidence'] = self._find_evidence(implementation_text, keywords)
+        
+        # Evidence - code snippets that satisfy the requirement
+        satisfied = [req for req in requirements if req['satisfied']]
+        keyword_sets = [self._extract_keywords(req['text']) for req in satisfied]
+        
+        if len(satisfied) > PARALLEL_TRACE_THRESHOLD:
+            with ProcessPoolExecutor(initializer=_init_trace_worker,
+                                     initargs=(implementation_text,)) as executor:
+                evidence = list(executor.map(_trace_evidence, keyword_sets))
+        else:
+            evidence = [self._find_evidence(implementation_text, kws) for kws in keyword_sets]
+        
+        for req, req_evidence in zip(satisfied, evidence):
+            req['evidence'] = req_evidence
         
         return requirements
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _keywords_present(self, text_lower: str, keywords: set) -> set:
+        """Return the subset of (lowercase) keywords occurring in text_lower"""
+        if not keywords:
+            return set()
+        
+        if ahocorasick is None:
+            return {k for k in keywords if k in text_lower}
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return {keyword for _, keyword in automaton.iter(text_lower)}
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_keywords(text: str) -> tuple:
         """Extract important keywords from requirement text"""
         # Remove common words and keep only significant terms
-        common_words = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'then', 'else', 'when', 'at', 'from', 'by', 'for', 'with', 'about', 'to'}
         words = text.lower().split()
-        return [w for w in words if w not in common_words and len(w) > 2]
+        return tuple(w for w in words if len(w) > 2 and w not in _COMMON_WORDS)
     
-    def _find_evidence(self, implementation_text: str, keywords: List[str]) -> List[str]:
+    @staticmethod
+    def _find_evidence(implementation_text: str, keywords: List[str]) -> List[str]:
         """Find code snippets that provide evidence for requirement satisfaction"""
-        lines = implementation_text.split('\n')
+        significant = [k for k in keywords if len(k) > 3]
+        if not significant:
+            return []
+        
+        engine = _re_engine if len(significant) > RE2_KEYWORD_THRESHOLD else re
+        pattern = engine.compile('(?i)' + '|'.join(engine.escape(k) for k in significant))
+        text = implementation_text
         evidence = []
         
-        for i, line in enumerate(lines):
-            if any(k.lower() in line.lower() for k in keywords if len(k) > 3):
-                # Get context (line before and after)
-                start = max(0, i-1)
-                end = min(len(lines), i+2)
-                context = '\n'.join(lines[start:end])
-                evidence.append(context)
+        # Limit to 3 pieces of evidence, one per matching line
+        match = pattern.search(text)
+        while match and len(evidence) < 3:
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end < 0:
+                line_end = len(text)
+            
+            # Get context (line before and after)
+            start = text.rfind('\n', 0, line_start - 1) + 1 if line_start > 0 else 0
+            end = text.find('\n', line_end + 1) if line_end < len(text) else -1
+            evidence.append(text[start:end if end >= 0 else len(text)])
+            
+            match = pattern.search(text, line_end + 1)
         
-        # Limit to 3 pieces of evidence
-        return evidence[:3]
+        return evidence
     
     def _find_task_file(self, task_id: str) -> Optional[Path]:
         """Find task file in various locations"""
@@ -85,22 +283,32 @@ class RequirementTracer:
         ]
         
         for loc in locations:
-            if loc.exists():
-                for file in loc.glob(f"{task_id}*.md"):
-                    return file
+            for file in _files_in(loc, f"{task_id}*.md"):
+                return file
         
         return None
 
 class CoverageAnalyzer:
     def __init__(self, task_dir: Path):
         self.task_dir = task_dir
-        self.cov = coverage.Coverage()
+        
+        # One instance for every task; each run erases and combines worker data
+        self.data_file = task_dir / ".coverage.validation"
+        self.cov = coverage.Coverage(
+            data_file=str(self.data_file),
+            source=[str(task_dir / "src")],
+            concurrency=["multiprocessing"]
+        )
+        
+        # Same exclusions (pragma: no cover, exclude_lines) as the coverage reports
+        self._exclude_regex = join_regex(self.cov.config.exclude_list)
     
-    def analyze_coverage(self, task_id: str) -> Dict[str, Any]:
+    def analyze_coverage(self, task_id: str, implementation_files: List[Path] = None,
+                         test_files: List[Path] = None) -> Dict[str, Any]:
         """Analyze code coverage for a specific task"""
         # Find implementation files
-        src_dir = self.task_dir / "src"
-        implementation_files = list(src_dir.glob(f"*{task_id}*.py"))
+        if implementation_files is None:
+            implementation_files = _files_in(self.task_dir / "src", f"*{task_id}*.py")
         
         if not implementation_files:
             return {
@@ -112,8 +320,8 @@ class CoverageAnalyzer:
             }
         
         # Find test files
-        test_dir = self.task_dir / "tests"
-        test_files = list(test_dir.glob(f"*{task_id}*.py"))
+        if test_files is None:
+            test_files = _files_in(self.task_dir / "tests", f"*{task_id}*.py")
         
         if not test_files:
             return {
@@ -125,28 +333,22 @@ class CoverageAnalyzer:
             }
         
         # Run coverage
-        self.cov = coverage.Coverage(source=[str(f) for f in implementation_files])
-        self.cov.start()
-        
-        # Run the tests
-        pytest.main([str(f) for f in test_files])
-        
-        self.cov.stop()
-        self.cov.save()
+        if SLIPCOVER_AVAILABLE:
+            measured = self._run_slipcover(implementation_files, test_files)
+        else:
+            measured = self._run_coverage_py(implementation_files, test_files)
         
-        # Get coverage data
-        data = self.cov.get_data()
+        return self.summarize(implementation_files, measured)
+    
+    def summarize(self, implementation_files: List[Path], measured: Dict[Path, tuple]) -> Dict[str, Any]:
+        """Aggregate per-file (statements, covered) into the coverage result"""
         total_statements = 0
         total_covered = 0
         
         file_coverage = {}
         for file_path in implementation_files:
-            file_str = str(file_path)
-            if file_str in data.measured_files():
-                analysis = self.cov.analysis2(file_str)
-                statements = len(analysis[1])
-                missing = len(analysis[2])
-                covered = statements - missing
+            if file_path in measured:
+                statements, covered = measured[file_path]
                 
                 total_statements += statements
                 total_covered += covered
@@ -167,16 +369,118 @@ class CoverageAnalyzer:
             'files_analyzed': file_coverage,
             'timestamp': datetime.now().isoformat()
         }
+    
+    def _run_slipcover(self, implementation_files: List[Path], test_files: List[Path]) -> Dict[Path, tuple]:
+        """Run the tests under SlipCover; returns (statements, covered) per file"""
+        report_file = _temp_report_path("jace_coverage")
+        cmd = [
+            sys.executable,
+            "-m", "slipcover",
+            "--json",
+            "--out", str(report_file),
+            "--source", str(self.task_dir / "src"),
+            "-m", "pytest",
+            *[str(f) for f in test_files]
+        ]
+        subprocess.run(cmd, check=False, capture_output=True, cwd=self.task_dir)
+        
+        return self.read_json_report(report_file, implementation_files)
+    
+    def read_json_report(self, report_file: Path, implementation_files: List[Path]) -> Dict[Path, tuple]:
+        """Read a SlipCover or coverage.py JSON report; returns (statements, covered) per file"""
+        if not report_file.exists():
+            return {}
+        
+        report = _read_json(report_file)
+        report_file.unlink()
+        
+        wanted = {f.resolve(): f for f in implementation_files}
+        measured = {}
+        for file_str, data in report.get('files', {}).items():
+            file_path = wanted.get((self.task_dir / file_str).resolve())
+            if file_path is not None:
+                covered = len(data.get('executed_lines', []))
+                measured[file_path] = (covered + len(data.get('missing_lines', [])), covered)
+        
+        return measured
+    
+    def _run_coverage_py(self, implementation_files: List[Path], test_files: List[Path]) -> Dict[Path, tuple]:
+        """Run the tests under coverage.py; returns (statements, covered) per file"""
+        self.cov.erase()
+        cmd = [
+            sys.executable,
+            "-m", "coverage", "run",
+            "--parallel-mode",
+            "--concurrency=multiprocessing",
+            f"--data-file={self.data_file}",
+            f"--source={self.task_dir / 'src'}",
+            "-m", "pytest",
+            *[str(f) for f in test_files]
+        ]
+        
+        # A fresh interpreter per run, so repeated validations see fresh imports
+        subprocess.run(cmd, check=False, capture_output=True, cwd=self.task_dir, env=_coverage_env())
+        
+        # Merge the per-process data files written in parallel mode
+        try:
+            self.cov.combine()
+        except coverage.CoverageException:
+            return {}
+        self.cov.save()
+        
+        # Executed lines come straight from the data; statements from a cached parse
+        data = self.cov.get_data()
+        measured = {}
+        measured_files = set(data.measured_files())
+        for file_path in implementation_files:
+            file_str = str(file_path.resolve())
+            if file_str in measured_files:
+                statements = _statement_lines(file_str, os.stat(file_str).st_mtime_ns, self._exclude_regex)
+                executed = statements.intersection(data.lines(file_str) or ())
+                measured[file_path] = (len(statements), len(executed))
+        
+        return measured
 
 class TestValidator:
     def __init__(self, task_dir: Path):
         self.task_dir = task_dir
+        self._worker = None
+    
+    def _run_pytest(self, args: List[str]) -> int:
+        """Run pytest in the long-lived worker process and return its exit code"""
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [sys.executable, str(PYTEST_WORKER)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        
+        self._worker.stdin.write(json.dumps({'args': args}) + "\n")
+        self._worker.stdin.flush()
+        line = self._worker.stdout.readline()
+        if not line:
+            self._worker = None
+            raise RuntimeError("pytest worker exited unexpectedly")
+        return json.loads(line)['exit_code']
+    
+    def close(self):
+        """Stop the pytest worker; it exits once its stdin is closed"""
+        if self._worker is None:
+            return
+        try:
+            self._worker.stdin.close()
+            self._worker.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._worker.kill()
+        self._worker = None
     
-    def run_tests(self, task_id: str) -> Dict[str, Any]:
+    def run_tests(self, task_id: str, test_files: List[Path] = None) -> Dict[str, Any]:
         """Run tests for a specific task and capture results"""
         # Find test files
-        test_dir = self.task_dir / "tests"
-        test_files = list(test_dir.glob(f"*{task_id}*.py"))
+        if test_files is None:
+            test_files = _files_in(self.task_dir / "tests", f"*{task_id}*.py")
         
         if not test_files:
             return {
@@ -190,59 +494,20 @@ class TestValidator:
             }
         
         # Run pytest with JSON output
-        temp_result_file = self.task_dir / "temp_test_results.json"
+        temp_result_file = _temp_report_path("jace_test_results")
         
-        cmd = [
-            sys.executable, 
-            "-m", "pytest", 
+        parallel = ["-n", os.environ.get(XDIST_WORKERS_ENV, "auto"), "--dist=loadfile"] if XDIST_AVAILABLE else []
+        args = [
+            *parallel,
+            "-p", "no:cacheprovider",
             "--json-report", 
             f"--json-report-file={temp_result_file}",
             *[str(f) for f in test_files]
         ]
         
         try:
-            subprocess.run(cmd, check=False, capture_output=True)
-            
-            # Read results
-            if temp_result_file.exists():
-                with open(temp_result_file, 'r') as f:
-                    report = json.load(f)
-                
-                # Clean up
-                temp_result_file.unlink()
-                
-                # Extract key information
-                summary = report.get('summary', {})
-                test_details = []
-                
-                for test_id, test_data in report.get('tests', {}).items():
-                    test_details.append({
-                        'id': test_id,
-                        'name': test_data.get('name', ''),
-                        'outcome': test_data.get('outcome', ''),
-                        'message': test_data.get('call', {}).get('longrepr', '')
-                    })
-                
-                return {
-                    'total': summary.get('total', 0),
-                    'passed': summary.get('passed', 0),
-                    'failed': summary.get('failed', 0),
-                    'error': summary.get('error', 0),
-                    'skipped': summary.get('skipped', 0),
-                    'details': test_details,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                return {
-                    'total': 0,
-                    'passed': 0,
-                    'failed': 0,
-                    'error': 0,
-                    'skipped': 0,
-                    'details': [],
-                    'error_message': "Failed to generate test report"
-                }
-                
+            self._run_pytest(args)
+            return self.read_report(temp_result_file)
         except Exception as e:
             return {
                 'total': 0,
@@ -254,12 +519,54 @@ class TestValidator:
                 'error_message': str(e)
             }
 
+    def read_report(self, report_file: Path) -> Dict[str, Any]:
+        """Read a pytest-json-report file into the test result shape"""
+        if not report_file.exists():
+            return {
+                'total': 0,
+                'passed': 0,
+                'failed': 0,
+                'error': 0,
+                'skipped': 0,
+                'details': [],
+                'error_message': "Failed to generate test report"
+            }
+        
+        report = _read_json(report_file)
+        
+        # Clean up
+        report_file.unlink()
+        
+        # Extract key information
+        summary = report.get('summary', {})
+        test_details = []
+        
+        for test_id, test_data in report.get('tests', {}).items():
+            test_details.append({
+                'id': test_id,
+                'name': test_data.get('name', ''),
+                'outcome': test_data.get('outcome', ''),
+                'message': test_data.get('call', {}).get('longrepr', '')
+            })
+        
+        return {
+            'total': summary.get('total', 0),
+            'passed': summary.get('passed', 0),
+            'failed': summary.get('failed', 0),
+            'error': summary.get('error', 0),
+            'skipped': summary.get('skipped', 0),
+            'details': test_details,
+            'timestamp': datetime.now().isoformat()
+        }
+
 class ValidationRunner:
     def __init__(self, task_dir: Path = None):
         self.task_dir = task_dir or Path(os.getcwd())
         self.todo_dir = self.task_dir / "TASKS" / "TODO"
         self.done_dir = self.task_dir / "TASKS" / "DONE"
         self.in_progress_dir = self.task_dir / "TASKS" / "IN_PROGRESS"
+        self.validation_dir = self.task_dir / "TASKS" / "VALIDATION"
+        self._cache = None
         
         self.test_validator = TestValidator(self.task_dir)
         self.coverage_analyzer = CoverageAnalyzer(self.task_dir)
@@ -267,9 +574,9 @@ class ValidationRunner:
     
     def run_validation(self, task_id: str) -> Dict[str, Any]:
         """Run full validation for a task"""
-        # Find implementation files
-        src_dir = self.task_dir / "src"
-        implementation_files = list(src_dir.glob(f"*{task_id}*.py"))
+        # Find implementation and test files once for all validators
+        implementation_files = self._files_for_task("src", task_id)
+        test_files = self._files_for_task("tests", task_id)
         
         if not implementation_files:
             return {
@@ -279,16 +586,30 @@ class ValidationRunner:
                 'timestamp': datetime.now().isoformat()
             }
         
+        # Unchanged sources, tests and task file reuse the previous report
+        content_hash = self._content_hash(task_id, implementation_files, test_files)
+        cached = self._load_cache().get(task_id)
+        if cached and cached.get('hash') == content_hash:
+            return cached['report']
+        
         # Read implementation code
-        implementation_text = ""
+        parts = []
         for file in implementation_files:
-            implementation_text += file.read_text() + "\n\n"
-        
-        # Run tests
-        test_results = self.test_validator.run_tests(task_id)
+            parts.append(_read_source(file))
+            parts.append("\n\n")
+        implementation_text = "".join(parts)
         
-        # Analyze coverage
-        coverage_results = self.coverage_analyzer.analyze_coverage(task_id)
+        if test_files and COMBINED_RUN_AVAILABLE:
+            # Run tests and coverage in one pytest process
+            test_results, coverage_results = self._combined_run(implementation_files, test_files)
+        else:
+            # Run tests
+            test_results = self.test_validator.run_tests(task_id, test_files)
+            
+            # Analyze coverage
+            coverage_results = self.coverage_analyzer.analyze_coverage(
+                task_id, implementation_files, test_files
+            )
         
         # Trace requirements
         requirement_results = self.requirement_tracer.trace_requirements(task_id, implementation_text)
@@ -326,61 +647,126 @@ class ValidationRunner:
         
         # Save report
         self._save_validation_report(task_id, validation_report)
+        self._store_cached_report(task_id, content_hash, validation_report)
         
         return validation_report
     
+    def _combined_run(self, implementation_files: List[Path], test_files: List[Path]) -> tuple:
+        """Run tests once with JSON report and coverage; returns (test_results, coverage_results)"""
+        test_report_file = _temp_report_path("jace_test_results")
+        coverage_report_file = _temp_report_path("jace_coverage")
+        
+        cmd = [
+            sys.executable,
+            "-m", "pytest",
+            "-n", os.environ.get(XDIST_WORKERS_ENV, "auto"),
+            "--dist=loadfile",
+            "-p", "no:cacheprovider",
+            "--json-report",
+            f"--json-report-file={test_report_file}",
+            f"--cov={self.task_dir / 'src'}",
+            f"--cov-report=json:{coverage_report_file}",
+            *[str(f) for f in test_files]
+        ]
+        
+        subprocess.run(cmd, check=False, capture_output=True, cwd=self.task_dir, env=_coverage_env())
+        
+        test_results = self.test_validator.read_report(test_report_file)
+        measured = self.coverage_analyzer.read_json_report(coverage_report_file, implementation_files)
+        return test_results, self.coverage_analyzer.summarize(implementation_files, measured)
+    
+    def _content_hash(self, task_id: str, implementation_files: List[Path], test_files: List[Path]) -> str:
+        """Hash everything a validation result depends on"""
+        digest = hashlib.blake2b(digest_size=16)
+        task_file = self.requirement_tracer._find_task_file(task_id)
+        
+        for file in [*implementation_files, *test_files, *([task_file] if task_file else [])]:
+            digest.update(str(file).encode())
+            digest.update(file.read_bytes())
+        
+        return digest.hexdigest()
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the validation cache on first use"""
+        if self._cache is None:
+            cache_file = self.validation_dir / VALIDATION_CACHE_FILE
+            try:
+                self._cache = _read_json(cache_file)
+            except (FileNotFoundError, ValueError):
+                self._cache = {}
+        return self._cache
+    
+    def close(self):
+        """Release long-lived helper processes"""
+        self.test_validator.close()
+    
+    def _store_cached_report(self, task_id: str, content_hash: str, report: Dict[str, Any]) -> None:
+        """Record a task's report under its content hash"""
+        cache = self._load_cache()
+        cache[task_id] = {'hash': content_hash, 'report': report}
+        _write_json_atomic(self.validation_dir / VALIDATION_CACHE_FILE, cache)
+    
+    def _files_for_task(self, subdir: str, task_id: str) -> List[Path]:
+        """Python files for a task under task_dir/subdir"""
+        return _files_in(self.task_dir / subdir, f"*{task_id}*.py")
+    
     def _save_validation_report(self, task_id: str, report: Dict[str, Any]) -> Path:
         """Save validation report to file"""
         # Ensure directory exists
-        validation_dir = self.task_dir / "TASKS" / "VALIDATION"
+        validation_dir = self.validation_dir
         validation_dir.mkdir(exist_ok=True, parents=True)
         
         # Create report file
         report_file = validation_dir / f"{task_id}_validation.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json_atomic(report_file, report)
         
         # Also create a markdown summary
         summary_file = validation_dir / f"{task_id}_validation.md"
         
         # Format markdown summary
-        summary = f"""# Validation Report: {task_id}
-
-## Status: {report['validation_status'].upper()}
-
-Generated: {report['timestamp']}
-
-## Issues
-"""
-        if report['issues']:
-            for issue in report['issues']:
-                summary += f"- {issue}\n"
+        tests = report['test_results']
+        cov = report['coverage']
+        issues = report['issues']
+        parts = [
+            f"# Validation Report: {task_id}",
+            "",
+            f"## Status: {report['validation_status'].upper()}",
+            "",
+            f"Generated: {report['timestamp']}",
+            "",
+            "## Issues",
+        ]
+        if issues:
+            parts.extend(f"- {issue}" for issue in issues)
         else:
-            summary += "- No issues found\n"
-        
-        summary += f"""
-## Test Results
-- Total: {report['test_results']['total']}
-- Passed: {report['test_results']['passed']}
-- Failed: {report['test_results']['failed']}
-- Errors: {report['test_results']['error']}
-- Skipped: {report['test_results']['skipped']}
-
-## Coverage
-- Overall: {report['coverage']['percentage']:.1f}%
-- Lines Covered: {report['coverage']['lines_covered']}
-- Lines Missed: {report['coverage']['lines_missed']}
-
-## Requirements
-"""
+            parts.append("- No issues found")
+        
+        parts.extend([
+            "",
+            "## Test Results",
+            f"- Total: {tests['total']}",
+            f"- Passed: {tests['passed']}",
+            f"- Failed: {tests['failed']}",
+            f"- Errors: {tests['error']}",
+            f"- Skipped: {tests['skipped']}",
+            "",
+            "## Coverage",
+            f"- Overall: {cov['percentage']:.1f}%",
+            f"- Lines Covered: {cov['lines_covered']}",
+            f"- Lines Missed: {cov['lines_missed']}",
+            "",
+            "## Requirements",
+        ])
         for req in report['requirements']:
             status = "✓" if req['satisfied'] else "✗"
-            summary += f"- [{status}] {req['text']}\n"
+            parts.append(f"- [{status}] {req['text']}")
             if not req['satisfied']:
-                summary += f"  - Reason: {req.get('reason', 'Not specified')}\n"
+                parts.append(f"  - Reason: {req.get('reason', 'Not specified')}")
+        
+        parts.append("")
+        summary = "\n".join(parts)
         
-        with open(summary_file, 'w') as f:
-            f.write(summary)
+        summary_file.write_text(summary, encoding='utf-8')
         
         return report_file
 
@@ -394,7 +780,10 @@ if __name__ == "__main__":
     args = parser.parse_args()
     
     validator = ValidationRunner(Path(args.dir))
-    result = validator.run_validation(args.task)
+    try:
+        result = validator.run_validation(args.task)
+    finally:
+        validator.close()
     
     print(f"Validation result: {result['validation_status']}")
     if result['issues']:
@@ -14,16 +14,50 @@ __version__ = "0.1.0"
 __author__ = "Jace Berelen Team"
 __description__ = "AI-driven workflow automation platform for overemployment support"
 
-# Import core components
+import importlib
+
+# Import core components; everything else loads on first attribute access
 from .config import settings, validate_environment
-from .database import init_database, db_manager
-from .ai_client import ai_client, ask_ai, generate_code, break_down_task
-from .slack_handler import slack_handler, send_notification
-from .command_executor import command_executor, run_command, run_aws_command
-from .utils import setup_logging, display_startup_banner
 
-# Initialize logging on import
-setup_logging()
+_LAZY_ATTRS = {
+    "init_database": ".database",
+    "db_manager": ".database",
+    "ai_client": ".ai_client",
+    "ask_ai": ".ai_client",
+    "generate_code": ".ai_client",
+    "break_down_task": ".ai_client",
+    "slack_handler": ".slack_handler",
+    "send_notification": ".slack_handler",
+    "send_notifications": ".slack_handler",
+    "command_executor": ".command_executor",
+    "run_command": ".command_executor",
+    "run_aws_command": ".command_executor",
+    "setup_logging": ".utils",
+    "display_startup_banner": ".utils",
+}
+
+_initialized = False
+
+
+def __getattr__(name):
+    """Import heavy submodules only when one of their names is used (PEP 562)"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def init():
+    """Initialize logging once; called by entry points rather than on import"""
+    global _initialized
+    
+    if not _initialized:
+        from .utils import setup_logging
+        setup_logging()
+        _initialized = True
 
 __all__ = [
     # Core components
@@ -40,10 +74,12 @@ __all__ = [
     "generate_code", 
     "break_down_task",
     "send_notification",
+    "send_notifications",
     "run_command",
     "run_aws_command",
     "setup_logging",
     "display_startup_banner",
+    "init",
     
     # Package info
     "__version__",
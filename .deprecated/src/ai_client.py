@@ -6,6 +6,7 @@ Handles communication with Claude via OpenRouter's unified API
 import asyncio
 import json
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Any, AsyncGenerator
 from dataclasses import dataclass
 from datetime import datetime
@@ -63,6 +64,7 @@ class OpenRouterClient:
             default_headers=self.config["headers"]
         )
         self.usage_tracker = {}
+        self.daily_cost = Counter()
         
     async def chat_completion(
         self,
@@ -200,6 +202,7 @@ class OpenRouterClient:
         self.usage_tracker[today][model]["requests"] += 1
         self.usage_tracker[today][model]["tokens"] += tokens
         self.usage_tracker[today][model]["cost"] += cost
+        self.daily_cost[today] += cost
         
         logger.info(f"AI Usage - Model: {model}, Tokens: {tokens}, Cost: ${cost:.4f}")
     
@@ -224,9 +227,15 @@ class OpenRouterClient:
         """
         messages = []
         
-        # Add system prompt if provided
+        # Add system prompt if provided, marked cacheable so the provider
+        # bills the repeated prefix once per cache lifetime
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append({
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+                ]
+            })
         
         # Add conversation context if provided
         if context:
@@ -315,17 +324,22 @@ class OpenRouterClient:
             date: Date in YYYY-MM-DD format (defaults to today)
             
         Returns:
-            Usage statistics dictionary
+            Snapshot of the usage statistics dictionary
         """
         if date is None:
             date = datetime.utcnow().date().isoformat()
         
-        return self.usage_tracker.get(date, {})
+        # Copy so callers never hold a view that _track_usage keeps mutating;
+        # tracking runs synchronously on the event loop, so no lock is needed
+        stats = self.usage_tracker.get(date, {})
+        return {model: dict(model_stats) for model, model_stats in stats.items()}
     
     def get_total_cost(self, date: Optional[str] = None) -> float:
         """Get total cost for a specific date"""
-        stats = self.get_usage_stats(date)
-        return sum(model_stats["cost"] for model_stats in stats.values())
+        if date is None:
+            date = datetime.utcnow().date().isoformat()
+        
+        return self.daily_cost[date]
 
 
 # Global client instance
@@ -4,29 +4,136 @@ Allows running AWS CLI and other commands within task folder scope only
 """
 
 import asyncio
+import fnmatch
+import functools
+import itertools
 import logging
 import os
+import re
+import stat
 import subprocess
 import shlex
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
-from dataclasses import dataclass
-from datetime import datetime
-import tempfile
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Union, Tuple
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 import shutil
 
 from .config import settings
-from .database import log_ai_interaction
+from .database import interaction_log_writer
 
 logger = logging.getLogger(__name__)
 
+# Command history is a ring buffer; stored entries keep only the head (in bytes) of their output
+COMMAND_HISTORY_MAX = 1000
+HISTORY_OUTPUT_LIMIT = 4096
+
+# Subprocess output is read in chunks; past STREAM_OUTPUT_LIMIT only the head and tail are kept
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_OUTPUT_LIMIT = 10 * 1024 * 1024
+
+# `export KEY=VALUE` lines printed by `aws configure export-credentials --format env`
+_EXPORT_LINE_RE = re.compile(r"^export ([A-Z_][A-Z0-9_]*)=(.*)$", re.MULTILINE)
+
+# Keys written by that export; scrubbed before a refresh so the CLI re-resolves the chain
+_AWS_EXPORTED_KEYS = ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_CREDENTIAL_EXPIRATION")
+
+# Optional multi-pattern matcher for blocked command patterns
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_blocked_matcher(patterns: List[str]):
+    """Single-pass matcher over all patterns; returns the first hit or None"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern.lower(), pattern)
+        automaton.make_automaton()
+        return lambda text: next((pattern for _, pattern in automaton.iter(text)), None)
+    
+    regex = re.compile("|".join(re.escape(pattern.lower()) for pattern in patterns))
+    return lambda text: (match := regex.search(text)) and match.group()
+
+
+@functools.lru_cache(maxsize=64)
+def _glob_matcher(pattern: str):
+    """Compiled name matcher for a single-level glob pattern"""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+async def _read_stream(stream: asyncio.StreamReader) -> bytes:
+    """
+    Drain a subprocess pipe, retaining at most about STREAM_OUTPUT_LIMIT bytes
+    
+    The first and last half of the limit are kept with a marker in between;
+    everything else is read and dropped so the child never blocks on a full pipe.
+    """
+    half = STREAM_OUTPUT_LIMIT // 2
+    head = bytearray()
+    tail: deque = deque()
+    tail_size = 0
+    dropped = 0
+    
+    while chunk := await stream.read(STREAM_CHUNK_SIZE):
+        if len(head) < half:
+            take = half - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+            if not chunk:
+                continue
+        
+        tail.append(chunk)
+        tail_size += len(chunk)
+        while tail_size - len(tail[0]) >= half:
+            size = len(tail.popleft())
+            tail_size -= size
+            dropped += size
+    
+    # Whole chunks were dropped above; trim the oldest kept chunk down to the limit
+    excess = max(0, tail_size - half)
+    dropped += excess
+    kept = b"".join(tail)[excess:]
+    if not dropped:
+        return bytes(head) + kept
+    return bytes(head) + b"\n... [%d bytes omitted] ...\n" % dropped + kept
+
+
+async def _spawn_in_executor(argv: List[str], cwd: Path, env: Dict[str, str]):
+    """Fork/exec in a worker thread so the event loop never stalls on a large fork"""
+    loop = asyncio.get_running_loop()
+    process = await loop.run_in_executor(None, functools.partial(
+        subprocess.Popen,
+        argv,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=True,
+        start_new_session=True
+    ))
+    
+    # Re-attach the pipes to the loop for async reads
+    readers = []
+    for pipe in (process.stdout, process.stderr):
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+        readers.append(reader)
+    
+    return process, readers[0], readers[1]
+
 
 @dataclass
 class CommandResult:
-    """Result from command execution"""
+    """Result from command execution; stdout/stderr decode lazily from raw bytes"""
     success: bool
-    stdout: str
-    stderr: str
+    stdout_bytes: bytes
+    stderr_bytes: bytes
     return_code: int
     execution_time_ms: int
     command: str
@@ -36,6 +143,24 @@ class CommandResult:
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
+    
+    @functools.cached_property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode('utf-8', errors='replace')
+    
+    @functools.cached_property
+    def stderr(self) -> str:
+        return self.stderr_bytes.decode('utf-8', errors='replace')
+    
+    def truncated_for_history(self) -> "CommandResult":
+        """Copy with stdout/stderr cut to HISTORY_OUTPUT_LIMIT bytes"""
+        if len(self.stdout_bytes) <= HISTORY_OUTPUT_LIMIT and len(self.stderr_bytes) <= HISTORY_OUTPUT_LIMIT:
+            return self
+        return replace(
+            self,
+            stdout_bytes=self.stdout_bytes[:HISTORY_OUTPUT_LIMIT],
+            stderr_bytes=self.stderr_bytes[:HISTORY_OUTPUT_LIMIT]
+        )
 
 
 class SecureCommandExecutor:
@@ -54,9 +179,7 @@ class SecureCommandExecutor:
         
         # File operations
         "ls": [],
-        "dir": [],  # Windows
         "cat": [],
-        "type": [],  # Windows
         "head": [],
         "tail": [],
         "find": [],
@@ -88,10 +211,8 @@ class SecureCommandExecutor:
         "jq": [],
         "yq": [],
         "which": [],
-        "where": [],  # Windows
         "echo": [],
         "pwd": [],
-        "cd": [],
     }
     
     # Dangerous patterns to always block
@@ -117,13 +238,14 @@ class SecureCommandExecutor:
         "chown root",
         "su -",
         "sudo su",
-        "> /dev/null",
-        "2>/dev/null",
-        "&& rm",
-        "; rm",
-        "| rm",
     ]
     
+    # Built once for the class; scans a command in one pass
+    _match_blocked = staticmethod(_build_blocked_matcher(BLOCKED_PATTERNS))
+    
+    # Resolved executable paths by base command, shared across instances
+    _EXECUTABLES: Dict[str, str] = {}
+    
     def __init__(self, base_workspace_path: Union[str, Path] = None):
         """
         Initialize command executor
@@ -133,19 +255,37 @@ class SecureCommandExecutor:
         """
         self.base_workspace_path = Path(base_workspace_path or Path.cwd() / "workspaces")
         self.base_workspace_path.mkdir(exist_ok=True)
+        self._base_resolved = self.base_workspace_path.resolve()
         
-        # Current active workspace (set per task)
+        # Current active workspace (set per task), canonicalized once in set_workspace
         self.current_workspace: Optional[Path] = None
+        self._current_workspace_key: Optional[Tuple[str, str]] = None
+        self._created_workspaces: set = set()
+        self._current_resolved: Optional[Path] = None
+        self._workspace_error: Optional[str] = None
+        self._current_env: Dict[str, str] = {}
+        
+        # AWS credentials exported into _current_env, reset with each workspace
+        self._aws_credentials_loaded = False
+        self._aws_credentials_expiry: Optional[datetime] = None
+        
+        # Background deletions of renamed-away workspaces
+        self._trash_tasks: set = set()
+        self._trash_swept = False
         
-        # Command history for audit
-        self.command_history: List[CommandResult] = []
+        # Recent command history for audit, bounded in length and per-entry size
+        self.command_history: deque = deque(maxlen=COMMAND_HISTORY_MAX)
         
-        logger.info(f"Command executor initialized with base workspace: {self.base_workspace_path}")
+        logger.info("Command executor initialized with base workspace: %s", self.base_workspace_path)
     
     def set_workspace(self, task_id: str, user_id: str = "default") -> Path:
         """
         Set the current workspace for a specific task
         
+        Re-selecting the active workspace is a no-op, and each workspace
+        directory is created once (and again if something else removed it);
+        cleanup_workspace invalidates both.
+        
         Args:
             task_id: Unique task identifier
             user_id: User identifier for isolation
@@ -153,62 +293,133 @@ class SecureCommandExecutor:
         Returns:
             Path to the workspace directory
         """
+        key = (user_id, task_id)
+        if key == self._current_workspace_key:
+            return self.current_workspace
+        
         # Create isolated workspace path
         workspace_name = f"user_{user_id}_task_{task_id}"
         workspace_path = self.base_workspace_path / workspace_name
-        workspace_path.mkdir(parents=True, exist_ok=True)
+        if workspace_name not in self._created_workspaces:
+            workspace_path.mkdir(parents=True, exist_ok=True)
+            self._created_workspaces.add(workspace_name)
         
         self.current_workspace = workspace_path
+        self._current_workspace_key = key
+        self._current_resolved = None
+        self._workspace_error = None
         
-        logger.info(f"Workspace set to: {workspace_path}")
+        # Environment snapshot shared by every command in this workspace
+        self._current_env = {**os.environ, "PWD": str(workspace_path), "AWS_PAGER": ""}
+        self._aws_credentials_loaded = False
+        self._aws_credentials_expiry = None
+        
+        # Reject symlinks before trusting the resolved path for later commands
+        try:
+            mode = os.lstat(workspace_path).st_mode
+        except FileNotFoundError:
+            # Removed outside cleanup_workspace since it was first created
+            workspace_path.mkdir(parents=True, exist_ok=True)
+            mode = os.lstat(workspace_path).st_mode
+        if stat.S_ISLNK(mode):
+            self._workspace_error = "Workspace is a symlink"
+        else:
+            resolved = workspace_path.resolve(strict=True)
+            if resolved.is_relative_to(self._base_resolved):
+                self._current_resolved = resolved
+            else:
+                self._workspace_error = "Workspace outside allowed base path"
+        
+        logger.info("Workspace set to: %s", workspace_path)
         return workspace_path
     
-    def _validate_command(self, command: str) -> Tuple[bool, str]:
+    def _validate_command(self, command: str) -> Tuple[bool, str, List[str]]:
         """
         Validate if command is allowed and safe
         
+        Commands are executed without a shell, so pipes, redirects and
+        command chaining are passed through as literal arguments.
+        
         Args:
             command: Command string to validate
             
         Returns:
-            (is_valid, reason)
+            (is_valid, reason, argv)
         """
-        # Check for blocked patterns
-        command_lower = command.lower()
-        for pattern in self.BLOCKED_PATTERNS:
-            if pattern in command_lower:
-                return False, f"Blocked dangerous pattern: {pattern}"
+        is_valid, reason, parts = self._validate_command_cached(command)
+        if not is_valid:
+            return False, reason, []
+        
+        # Workspace-dependent check stays outside the cache
+        if ".." in command and self._escapes_workspace(parts[1:]):
+            return False, "Path traversal attempt detected", []
         
-        # Parse command
+        # Resolve the executable once per base command
+        base_command = parts[0]
+        executable = self._EXECUTABLES.get(base_command)
+        if executable is None:
+            executable = shutil.which(base_command)
+            if executable is None:
+                return False, f"Command '{base_command}' not found on PATH", []
+            self._EXECUTABLES[base_command] = executable
+        
+        return True, "Command validated", [executable, *parts[1:]]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=2048)
+    def _validate_command_cached(cls, command: str) -> Tuple[bool, str, Tuple[str, ...]]:
+        """Whitelist and pattern checks; pure in the command string, so memoized"""
+        # Parse command first; malformed input fails before any scanning
         try:
-            parts = shlex.split(command)
+            parts = tuple(shlex.split(command))
         except ValueError as e:
-            return False, f"Invalid command syntax: {e}"
+            return False, f"Invalid command syntax: {e}", ()
         
         if not parts:
-            return False, "Empty command"
+            return False, "Empty command", ()
+        
+        # Check for blocked patterns in the argv as it will be executed
+        pattern = cls._match_blocked(" ".join(parts).lower())
+        if pattern:
+            return False, f"Blocked dangerous pattern: {pattern}", ()
         
         base_command = parts[0]
         
         # Check if base command is allowed
-        if base_command not in self.ALLOWED_COMMANDS:
-            return False, f"Command '{base_command}' not in whitelist"
+        if base_command not in cls.ALLOWED_COMMANDS:
+            return False, f"Command '{base_command}' not in whitelist", ()
         
         # Check subcommands for specific commands
-        allowed_subcommands = self.ALLOWED_COMMANDS[base_command]
+        allowed_subcommands = cls.ALLOWED_COMMANDS[base_command]
         if allowed_subcommands and len(parts) > 1:
             subcommand = parts[1]
             if subcommand not in allowed_subcommands:
-                return False, f"Subcommand '{subcommand}' not allowed for '{base_command}'"
-        
-        # Additional security checks
-        if ".." in command:
-            return False, "Path traversal attempt detected"
+                return False, f"Subcommand '{subcommand}' not allowed for '{base_command}'", ()
         
-        if "|" in command and any(danger in command for danger in ["rm", "del", "format"]):
-            return False, "Potentially dangerous pipe command"
+        return True, "Command validated", parts
+    
+    @classmethod
+    def clear_validation_cache(cls) -> None:
+        """Forget memoized validations, e.g. after changing the whitelist at runtime"""
+        cls._validate_command_cached.cache_clear()
+        cls._EXECUTABLES.clear()
+    
+    def _escapes_workspace(self, args: List[str]) -> bool:
+        """Whether any '..' argument may resolve outside the current workspace"""
+        workspace = self._current_resolved
+        if workspace is None:
+            return True
         
-        return True, "Command validated"
+        for arg in args:
+            if ".." not in arg:
+                continue
+            # Options with an attached path (-o../x, --output=../x) can't be
+            # resolved as a bare path, so any '..' in them is rejected
+            if arg.startswith("-") or "=" in arg:
+                return True
+            if not (workspace / arg).resolve().is_relative_to(workspace):
+                return True
+        return False
     
     def _validate_workspace(self) -> Tuple[bool, str]:
         """
@@ -220,14 +431,12 @@ class SecureCommandExecutor:
         if not self.current_workspace:
             return False, "No workspace set - call set_workspace() first"
         
-        if not self.current_workspace.exists():
-            return False, f"Workspace does not exist: {self.current_workspace}"
+        # Symlink and base-path checks ran once in set_workspace
+        if self._workspace_error:
+            return False, self._workspace_error
         
-        # Ensure workspace is within base path (prevent escape)
-        try:
-            self.current_workspace.resolve().relative_to(self.base_workspace_path.resolve())
-        except ValueError:
-            return False, "Workspace outside allowed base path"
+        if not self._current_resolved.exists():
+            return False, f"Workspace does not exist: {self.current_workspace}"
         
         return True, "Workspace validated"
     
@@ -236,7 +445,9 @@ class SecureCommandExecutor:
         command: str,
         timeout: int = 30,
         user_id: int = None,
-        task_id: int = None
+        task_id: int = None,
+        *,
+        options: Tuple[str, ...] = ()
     ) -> CommandResult:
         """
         Execute a command securely within the current workspace
@@ -246,114 +457,114 @@ class SecureCommandExecutor:
             timeout: Timeout in seconds
             user_id: User ID for logging
             task_id: Task ID for logging
+            options: Global options inserted right after the executable
+                (e.g. aws --profile), so subcommand checks still see argv[1]
             
         Returns:
             CommandResult with execution details
         """
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
+        cwd_str = str(self.current_workspace) if self.current_workspace else "None"
         
         # Validate command
-        is_valid_cmd, cmd_reason = self._validate_command(command)
+        is_valid_cmd, cmd_reason, argv = self._validate_command(command)
+        if is_valid_cmd and options:
+            pattern = self._match_blocked(" ".join(options).lower())
+            if pattern:
+                is_valid_cmd, cmd_reason = False, f"Blocked dangerous pattern: {pattern}"
+            else:
+                argv[1:1] = options
         if not is_valid_cmd:
-            logger.error(f"Command validation failed: {cmd_reason}")
+            logger.error("Command validation failed: %s", cmd_reason)
             return CommandResult(
                 success=False,
-                stdout="",
-                stderr=f"Command validation failed: {cmd_reason}",
+                stdout_bytes=b"",
+                stderr_bytes=f"Command validation failed: {cmd_reason}".encode(),
                 return_code=-1,
                 execution_time_ms=0,
                 command=command,
-                working_directory=str(self.current_workspace) if self.current_workspace else "None"
+                working_directory=cwd_str
             )
         
         # Validate workspace
         is_valid_ws, ws_reason = self._validate_workspace()
         if not is_valid_ws:
-            logger.error(f"Workspace validation failed: {ws_reason}")
+            logger.error("Workspace validation failed: %s", ws_reason)
             return CommandResult(
                 success=False,
-                stdout="",
-                stderr=f"Workspace validation failed: {ws_reason}",
+                stdout_bytes=b"",
+                stderr_bytes=f"Workspace validation failed: {ws_reason}".encode(),
                 return_code=-1,
                 execution_time_ms=0,
                 command=command,
-                working_directory=str(self.current_workspace) if self.current_workspace else "None"
+                working_directory=cwd_str
             )
         
-        # Prepare environment
-        env = os.environ.copy()
-        env["PWD"] = str(self.current_workspace)
-        
         try:
-            logger.info(f"Executing command in {self.current_workspace}: {command}")
+            logger.info("Executing command in %s: %s", self.current_workspace, command)
             
-            # Execute command
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.current_workspace,
-                env=env
+            # Execute command directly, without an intermediate shell
+            process, stdout_reader, stderr_reader = await _spawn_in_executor(
+                argv, self.current_workspace, self._current_env
             )
+            loop = asyncio.get_running_loop()
             
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), 
+                stdout_bytes, stderr_bytes, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_stream(stdout_reader),
+                        _read_stream(stderr_reader),
+                        loop.run_in_executor(None, process.wait)
+                    ),
                     timeout=timeout
                 )
             except asyncio.TimeoutError:
                 process.kill()
-                await process.wait()
+                await loop.run_in_executor(None, process.wait)
                 
-                end_time = datetime.utcnow()
-                execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+                execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
                 
                 result = CommandResult(
                     success=False,
-                    stdout="",
-                    stderr=f"Command timed out after {timeout} seconds",
+                    stdout_bytes=b"",
+                    stderr_bytes=f"Command timed out after {timeout} seconds".encode(),
                     return_code=-1,
                     execution_time_ms=execution_time_ms,
                     command=command,
-                    working_directory=str(self.current_workspace)
+                    working_directory=cwd_str
                 )
                 
-                self.command_history.append(result)
+                self.command_history.append(result.truncated_for_history())
                 return result
             
-            end_time = datetime.utcnow()
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
-            
-            # Decode output
-            stdout_str = stdout.decode('utf-8', errors='replace') if stdout else ""
-            stderr_str = stderr.decode('utf-8', errors='replace') if stderr else ""
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             result = CommandResult(
                 success=process.returncode == 0,
-                stdout=stdout_str,
-                stderr=stderr_str,
+                stdout_bytes=stdout_bytes,
+                stderr_bytes=stderr_bytes,
                 return_code=process.returncode,
                 execution_time_ms=execution_time_ms,
                 command=command,
-                working_directory=str(self.current_workspace)
+                working_directory=cwd_str
             )
             
             # Log result
-            self.command_history.append(result)
+            self.command_history.append(result.truncated_for_history())
             
             if result.success:
-                logger.info(f"Command executed successfully: {command}")
+                logger.info("Command executed successfully: %s", command)
             else:
-                logger.warning(f"Command failed with code {result.return_code}: {command}")
+                logger.warning("Command failed with code %s: %s", result.return_code, command)
             
-            # Log to database if user_id provided
+            # Queue the audit row if user_id provided; the writer batches inserts
             if user_id:
-                await log_ai_interaction(
+                interaction_log_writer.enqueue(
                     user_id=user_id,
                     task_id=task_id,
                     interaction_type="command_execution",
                     prompt=command,
-                    response=f"Exit code: {result.return_code}\nSTDOUT: {stdout_str[:500]}\nSTDERR: {stderr_str[:500]}",
+                    response=f"Exit code: {result.return_code}\nSTDOUT: {stdout_bytes[:500].decode('utf-8', errors='replace')}\nSTDERR: {stderr_bytes[:500].decode('utf-8', errors='replace')}",
                     model_used="command_executor",
                     tokens_used=0,
                     cost_usd=0.0,
@@ -363,22 +574,21 @@ class SecureCommandExecutor:
             return result
             
         except Exception as e:
-            end_time = datetime.utcnow()
-            execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
-            logger.error(f"Command execution error: {e}")
+            logger.error("Command execution error: %s", e)
             
             result = CommandResult(
                 success=False,
-                stdout="",
-                stderr=f"Execution error: {str(e)}",
+                stdout_bytes=b"",
+                stderr_bytes=f"Execution error: {str(e)}".encode(),
                 return_code=-1,
                 execution_time_ms=execution_time_ms,
                 command=command,
-                working_directory=str(self.current_workspace)
+                working_directory=cwd_str
             )
             
-            self.command_history.append(result)
+            self.command_history.append(result.truncated_for_history())
             return result
     
     async def execute_aws_command(
@@ -400,43 +610,122 @@ class SecureCommandExecutor:
         Returns:
             CommandResult
         """
-        # Build full AWS command
-        command_parts = ["aws"]
-        
+        await self._ensure_aws_credentials()
+        
+        # Profile/region go in as argv options, so the service name stays the checked subcommand
+        return await self.execute_command(
+            f"aws {aws_command}",
+            options=self._aws_options(profile, region),
+            **kwargs
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _aws_options(profile: Optional[str], region: Optional[str]) -> Tuple[str, ...]:
+        """Prebuilt global option tuple for a profile/region pair"""
+        options = ()
         if profile:
-            command_parts.extend(["--profile", profile])
-        
+            options += ("--profile", profile)
         if region:
-            command_parts.extend(["--region", region])
+            options += ("--region", region)
+        return options
+    
+    async def _ensure_aws_credentials(self) -> None:
+        """
+        Resolve AWS credentials once per workspace and reuse them
+        
+        Exported keys go into the workspace environment, so later aws calls
+        skip the credential chain (SSO, assume-role, config parsing) until
+        AWS_CREDENTIAL_EXPIRATION passes.
+        """
+        if self._aws_credentials_loaded:
+            expiry = self._aws_credentials_expiry
+            if expiry is None or expiry > datetime.now(timezone.utc):
+                return
+        
+        self._aws_credentials_loaded = True
+        self._aws_credentials_expiry = None
         
-        command_parts.append(aws_command)
-        full_command = " ".join(command_parts)
+        executable = self._EXECUTABLES.get("aws") or shutil.which("aws")
+        if executable is None or self.current_workspace is None:
+            return
+        self._EXECUTABLES["aws"] = executable
         
-        return await self.execute_command(full_command, **kwargs)
+        # Exported keys from an earlier run would otherwise be echoed straight back
+        self._current_env = {k: v for k, v in self._current_env.items() if k not in _AWS_EXPORTED_KEYS}
+        
+        try:
+            process, stdout_reader, stderr_reader = await _spawn_in_executor(
+                [executable, "configure", "export-credentials", "--format", "env"],
+                self.current_workspace,
+                self._current_env
+            )
+            output, _, return_code = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_stream(stdout_reader),
+                    _read_stream(stderr_reader),
+                    asyncio.get_running_loop().run_in_executor(None, process.wait)
+                ),
+                timeout=30
+            )
+        except Exception as e:
+            logger.warning("Could not export AWS credentials: %s", e)
+            return
+        
+        if return_code != 0:
+            return
+        
+        exported = dict(_EXPORT_LINE_RE.findall(output.decode('utf-8', errors='replace')))
+        self._current_env.update(exported)
+        
+        expiration = exported.get("AWS_CREDENTIAL_EXPIRATION")
+        if expiration:
+            try:
+                self._aws_credentials_expiry = datetime.fromisoformat(expiration.replace("Z", "+00:00"))
+            except ValueError:
+                # Unknown format: export again on the next call
+                self._aws_credentials_loaded = False
     
-    def get_workspace_files(self, pattern: str = "*") -> List[Path]:
+    def get_workspace_files(self, pattern: str = "*") -> Iterator[Path]:
         """
-        Get list of files in current workspace
+        Iterate over files in current workspace
+        
+        Single-level patterns are matched against names from one os.scandir
+        pass, skipping symlinks; patterns with a path separator (e.g.
+        '**/*.py') fall back to Path.glob. Wrap in list() for a list.
         
         Args:
             pattern: Glob pattern to match files
             
-        Returns:
-            List of file paths
+        Yields:
+            Matching file paths
         """
-        if not self.current_workspace or not self.current_workspace.exists():
-            return []
+        workspace = self.current_workspace
+        if not workspace:
+            return
         
         try:
-            return list(self.current_workspace.glob(pattern))
+            if "/" in pattern:
+                yield from workspace.glob(pattern)
+                return
+            
+            match = _glob_matcher(pattern)
+            with os.scandir(workspace) as entries:
+                for entry in entries:
+                    if match(entry.name) and not entry.is_symlink():
+                        yield workspace / entry.name
+        except FileNotFoundError:
+            return
         except Exception as e:
-            logger.error(f"Error listing workspace files: {e}")
-            return []
+            logger.error("Error listing workspace files: %s", e)
     
-    def cleanup_workspace(self, task_id: str, user_id: str = "default") -> bool:
+    async def cleanup_workspace(self, task_id: str, user_id: str = "default") -> bool:
         """
         Clean up workspace for a specific task
         
+        The workspace is renamed aside immediately and deleted in the
+        background, so callers only wait for a single rename.
+        
         Args:
             task_id: Task identifier
             user_id: User identifier
@@ -447,22 +736,50 @@ class SecureCommandExecutor:
         workspace_name = f"user_{user_id}_task_{task_id}"
         workspace_path = self.base_workspace_path / workspace_name
         
+        # The next set_workspace for this task must recreate the directory
+        self._created_workspaces.discard(workspace_name)
+        if self._current_workspace_key == (user_id, task_id):
+            self._current_workspace_key = None
+        
+        # Leftovers from a previous run are removed the first time cleanup is used
+        if not self._trash_swept:
+            self._trash_swept = True
+            for leftover in self.base_workspace_path.glob("*.trash.*"):
+                self._delete_in_background(leftover)
+        
         try:
             if workspace_path.exists():
-                shutil.rmtree(workspace_path)
-                logger.info(f"Cleaned up workspace: {workspace_path}")
+                trash_path = workspace_path.with_name(
+                    f"{workspace_name}.trash.{os.getpid()}.{time.monotonic_ns()}"
+                )
+                await asyncio.to_thread(os.rename, workspace_path, trash_path)
+                self._delete_in_background(trash_path)
+                logger.info("Cleaned up workspace: %s", workspace_path)
             return True
         except Exception as e:
-            logger.error(f"Error cleaning up workspace {workspace_path}: {e}")
+            logger.error("Error cleaning up workspace %s: %s", workspace_path, e)
             return False
     
+    def _delete_in_background(self, path: Path) -> None:
+        """Remove a directory tree off the event loop"""
+        task = asyncio.create_task(asyncio.to_thread(shutil.rmtree, path, ignore_errors=True))
+        self._trash_tasks.add(task)
+        task.add_done_callback(self._trash_tasks.discard)
+    
     def get_command_history(self, limit: int = 50) -> List[CommandResult]:
         """Get recent command history"""
-        return self.command_history[-limit:]
+        return list(itertools.islice(reversed(self.command_history), limit))[::-1]
     
-    def get_allowed_commands(self) -> Dict[str, List[str]]:
-        """Get list of allowed commands"""
-        return self.ALLOWED_COMMANDS.copy()
+    def get_allowed_commands(self) -> Mapping[str, FrozenSet[str]]:
+        """Get allowed commands (read-only mapping, no copy needed)"""
+        return self.ALLOWED_COMMANDS
+
+
+# Read-only whitelist with frozenset subcommands for O(1) membership checks
+SecureCommandExecutor.ALLOWED_COMMANDS = MappingProxyType({
+    command: frozenset(subcommands)
+    for command, subcommands in SecureCommandExecutor.ALLOWED_COMMANDS.items()
+})
 
 
 # Global command executor instance
@@ -4,7 +4,8 @@ Uses env.py for public configs and .env for secrets
 """
 
 import os
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -92,6 +93,7 @@ class Settings(BaseSettings):
     enable_web_scraping: bool = Field(default=DEFAULT_ENABLE_WEB_SCRAPING, alias="ENABLE_WEB_SCRAPING")
     enable_file_uploads: bool = Field(default=DEFAULT_ENABLE_FILE_UPLOADS, alias="ENABLE_FILE_UPLOADS")
     enable_system_commands: bool = Field(default=DEFAULT_ENABLE_SYSTEM_COMMANDS, alias="ENABLE_SYSTEM_COMMANDS")
+    enable_sync_db: bool = Field(default=DEFAULT_ENABLE_SYNC_DB, alias="ENABLE_SYNC_DB")
     
     class Config:
         env_file = ".env"
@@ -154,10 +156,10 @@ def validate_environment() -> tuple[bool, list[str]]:
         missing.append("SECRET_KEY")
     
     # Validate token formats (from env.py)
-    if settings.slack_bot_token and not settings.slack_bot_token.startswith(TOKEN_FORMATS["slack_bot"]):
+    if settings.slack_bot_token and classify_token(settings.slack_bot_token) != "slack_bot":
         missing.append("SLACK_BOT_TOKEN (invalid format - should start with 'xoxb-')")
     
-    if settings.openrouter_api_key and not settings.openrouter_api_key.startswith(TOKEN_FORMATS["openrouter"]):
+    if settings.openrouter_api_key and classify_token(settings.openrouter_api_key) != "openrouter":
         missing.append("OPENROUTER_API_KEY (invalid format - should start with 'sk-or-')")
     
     # Validate secret key length (from env.py)
@@ -214,15 +216,18 @@ def get_cors_config() -> dict:
     }
 
 
-def get_model_cost(model_name: str) -> dict:
+_DEFAULT_MODEL_COST = MappingProxyType({
+    "input_cost_per_token": 0.000001,  # Default fallback
+    "output_cost_per_token": 0.000002,
+})
+
+
+def get_model_cost(model_name: str) -> Mapping[str, float]:
     """Get cost information for AI model from env.py"""
-    return MODEL_COSTS.get(model_name, {
-        "input_cost_per_token": 0.000001,  # Default fallback
-        "output_cost_per_token": 0.000002,
-    })
+    return MODEL_COSTS.get(model_name, _DEFAULT_MODEL_COST)
 
 
-def get_api_endpoints() -> dict:
+def get_api_endpoints() -> Mapping[str, str]:
     """Get API endpoints from env.py"""
     return API_ENDPOINTS
 
@@ -6,19 +6,25 @@ Entry point that ties together all components
 import asyncio
 import logging
 import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import settings, validate_environment, get_openrouter_config
-from .database import init_database, db_manager, get_or_create_user, get_active_tasks
+from .database import (
+    init_database, db_manager, db_session, get_or_create_user, create_task,
+    get_active_tasks_with_total, stream_active_tasks, count_users, count_active_tasks,
+    interaction_log_writer
+)
 from .ai_client import ai_client, ask_ai
 from .slack_handler import slack_handler
 from .utils import setup_logging, get_system_info
@@ -42,21 +48,22 @@ async def lifespan(app: FastAPI):
         logger.error(f"Environment validation failed. Missing: {missing}")
         sys.exit(1)
     
-    # Initialize database
-    try:
-        init_database()
-        logger.info("Database initialized")
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+    # Initialize database and test AI connection concurrently; both are I/O bound
+    db_result, ai_result = await asyncio.gather(
+        init_database(),
+        ai_client.ask_claude("Hello, are you working?"),
+        return_exceptions=True
+    )
+    
+    if isinstance(db_result, BaseException):
+        logger.error(f"Database initialization failed: {db_result}")
         sys.exit(1)
+    logger.info("Database initialized")
     
-    # Test AI connection
-    try:
-        test_response = await ai_client.ask_claude("Hello, are you working?")
-        logger.info(f"AI connection test successful: {test_response.content[:50]}...")
-    except Exception as e:
-        logger.error(f"AI connection test failed: {e}")
+    if isinstance(ai_result, BaseException):
+        logger.error(f"AI connection test failed: {ai_result}")
         sys.exit(1)
+    logger.info(f"AI connection test successful: {ai_result.content[:50]}...")
     
     # Start Slack handler in background
     if settings.slack_bot_token:
@@ -74,6 +81,9 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Jace Berelen POC...")
+    
+    # Flush AI interaction rows still waiting in the batch writer
+    await interaction_log_writer.stop()
 
 
 # Create FastAPI app
@@ -81,7 +91,8 @@ app = FastAPI(
     title="Jace Berelen POC",
     description="AI-driven workflow automation platform for overemployment support",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -94,6 +105,21 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def log_requests(request: Request, call_next):
+    """Time every request and log failures in one place"""
+    start_ns = time.perf_counter_ns()
+    try:
+        return await call_next(request)
+    except Exception:
+        # general_exception_handler builds the 500 response
+        logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(f"{request.method} {request.url.path} took {elapsed_ms:.1f}ms")
+
+
 # ============================================================================
 # MODELS
 # ============================================================================
@@ -114,6 +140,23 @@ class TaskRequest(BaseModel):
     job_id: int = None
 
 
+class TaskOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    title: str
+    description: Optional[str] = None
+    status: str
+    priority: str
+    created_at: datetime
+    due_date: Optional[datetime] = None
+
+
+class TaskListResponse(BaseModel):
+    tasks: List[TaskOut]
+    total: int
+
+
 class AIRequest(BaseModel):
     prompt: str
     system_prompt: str = None
@@ -132,36 +175,38 @@ class AIResponse(BaseModel):
 # ROUTES
 # ============================================================================
 
-@app.get("/", response_model=Dict[str, Any])
+# Static part of the root response, built once; only the timestamp varies
+_ROOT_INFO = {
+    "name": "Jace Berelen POC",
+    "version": "0.1.0",
+    "description": "AI-driven workflow automation platform for overemployment support",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "ai": "/ai/chat",
+        "tasks": "/tasks",
+        "docs": "/docs"
+    }
+}
+
+
+@app.get("/")
 async def root():
     """Root endpoint with basic info"""
-    return {
-        "name": "Jace Berelen POC",
-        "version": "0.1.0",
-        "description": "AI-driven workflow automation platform for overemployment support",
-        "status": "running",
-        "timestamp": datetime.utcnow().isoformat(),
-        "endpoints": {
-            "health": "/health",
-            "ai": "/ai/chat",
-            "tasks": "/tasks",
-            "docs": "/docs"
-        }
-    }
+    return ORJSONResponse({**_ROOT_INFO, "timestamp": datetime.utcnow()})
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    # Test database connection
-    db_connected = await db_manager.health_check()
-    
-    # Test AI connection
-    ai_connected = True
-    try:
-        await ai_client.ask_claude("ping", temperature=0.0)
-    except Exception:
-        ai_connected = False
+    # Probe database and AI concurrently
+    db_connected, ai_result = await asyncio.gather(
+        db_manager.health_check(),
+        ai_client.ask_claude("ping", temperature=0.0),
+        return_exceptions=True
+    )
+    db_connected = db_connected is True
+    ai_connected = not isinstance(ai_result, Exception)
     
     return HealthResponse(
         status="healthy" if db_connected and ai_connected else "degraded",
@@ -186,148 +231,116 @@ async def system_info():
 @app.post("/ai/chat", response_model=AIResponse)
 async def chat_with_ai(request: AIRequest):
     """Chat with AI assistant"""
-    try:
-        response = await ai_client.ask_claude(
-            prompt=request.prompt,
-            system_prompt=request.system_prompt,
-            temperature=request.temperature
-        )
-        
-        return AIResponse(
-            content=response.content,
-            model_used=response.model_used,
-            tokens_used=response.tokens_used,
-            cost_usd=response.cost_usd,
-            response_time_ms=response.response_time_ms
-        )
+    response = await ai_client.ask_claude(
+        prompt=request.prompt,
+        system_prompt=request.system_prompt,
+        temperature=request.temperature
+    )
     
-    except Exception as e:
-        logger.error(f"AI chat error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return AIResponse(
+        content=response.content,
+        model_used=response.model_used,
+        tokens_used=response.tokens_used,
+        cost_usd=response.cost_usd,
+        response_time_ms=response.response_time_ms
+    )
 
 
 @app.post("/ai/code-help")
 async def get_code_help(request: dict):
     """Get AI help with code"""
-    try:
-        code_request = request.get("code_request")
-        language = request.get("language", "python")
-        context = request.get("context", "")
-        
-        if not code_request:
-            raise HTTPException(status_code=400, detail="code_request is required")
-        
-        response = await ai_client.code_assistant(
-            code_request=code_request,
-            language=language,
-            context=context
-        )
-        
-        return AIResponse(
-            content=response.content,
-            model_used=response.model_used,
-            tokens_used=response.tokens_used,
-            cost_usd=response.cost_usd,
-            response_time_ms=response.response_time_ms
-        )
+    code_request = request.get("code_request")
+    language = request.get("language", "python")
+    context = request.get("context", "")
+    
+    if not code_request:
+        raise HTTPException(status_code=400, detail="code_request is required")
+    
+    response = await ai_client.code_assistant(
+        code_request=code_request,
+        language=language,
+        context=context
+    )
     
-    except Exception as e:
-        logger.error(f"Code help error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return AIResponse(
+        content=response.content,
+        model_used=response.model_used,
+        tokens_used=response.tokens_used,
+        cost_usd=response.cost_usd,
+        response_time_ms=response.response_time_ms
+    )
 
 
 @app.post("/ai/task-breakdown")
 async def break_down_task(request: dict):
     """Break down a complex task using AI"""
-    try:
-        task_description = request.get("task_description")
-        time_estimate = request.get("time_estimate")
-        priority = request.get("priority", "medium")
-        
-        if not task_description:
-            raise HTTPException(status_code=400, detail="task_description is required")
-        
-        response = await ai_client.task_decomposition(
-            task_description=task_description,
-            time_estimate=time_estimate,
-            priority=priority
-        )
-        
-        return AIResponse(
-            content=response.content,
-            model_used=response.model_used,
-            tokens_used=response.tokens_used,
-            cost_usd=response.cost_usd,
-            response_time_ms=response.response_time_ms
-        )
+    task_description = request.get("task_description")
+    time_estimate = request.get("time_estimate")
+    priority = request.get("priority", "medium")
     
-    except Exception as e:
-        logger.error(f"Task breakdown error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if not task_description:
+        raise HTTPException(status_code=400, detail="task_description is required")
+    
+    response = await ai_client.task_decomposition(
+        task_description=task_description,
+        time_estimate=time_estimate,
+        priority=priority
+    )
+    
+    return AIResponse(
+        content=response.content,
+        model_used=response.model_used,
+        tokens_used=response.tokens_used,
+        cost_usd=response.cost_usd,
+        response_time_ms=response.response_time_ms
+    )
 
 
 # ============================================================================
 # TASK MANAGEMENT ENDPOINTS
 # ============================================================================
 
-@app.post("/tasks")
-async def create_task_endpoint(request: TaskRequest):
+@app.post("/tasks", response_model=TaskOut)
+async def create_task_endpoint(request: TaskRequest, session: AsyncSession = Depends(db_session)):
     """Create a new task"""
-    try:
-        # For POC, we'll use a default user
-        # In production, this would be extracted from authentication
-        user = await get_or_create_user("default_user", "poc_user")
-        
-        task = await create_task(
-            user_id=user.id,
-            title=request.title,
-            description=request.description,
-            priority=request.priority,
-            job_id=request.job_id
-        )
-        
-        return {
-            "id": task.id,
-            "title": task.title,
-            "description": task.description,
-            "status": task.status,
-            "priority": task.priority,
-            "created_at": task.created_at.isoformat()
-        }
+    # For POC, we'll use a default user
+    # In production, this would be extracted from authentication
+    user = await get_or_create_user("default_user", "poc_user", session=session)
     
-    except Exception as e:
-        logger.error(f"Task creation error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    task = await create_task(
+        user_id=user.id,
+        title=request.title,
+        description=request.description,
+        priority=request.priority,
+        job_id=request.job_id,
+        session=session
+    )
+    
+    return task
 
 
-@app.get("/tasks")
-async def get_tasks():
+@app.get("/tasks", response_model=TaskListResponse)
+async def get_tasks(session: AsyncSession = Depends(db_session)):
     """Get active tasks"""
-    try:
-        # For POC, we'll use a default user
-        user = await get_or_create_user("default_user", "poc_user")
-        
-        tasks = await get_active_tasks(user.id, limit=20)
-        
-        return {
-            "tasks": [
-                {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "status": task.status,
-                    "priority": task.priority,
-                    "created_at": task.created_at.isoformat(),
-                    "due_date": task.due_date.isoformat() if task.due_date else None
-                }
-                for task in tasks
-            ],
-            "total": len(tasks)
-        }
+    # For POC, we'll use a default user
+    user = await get_or_create_user("default_user", "poc_user", session=session)
+    
+    tasks, total = await get_active_tasks_with_total(user.id, limit=20, session=session)
+    
+    return {"tasks": tasks, "total": total}
+
+
+@app.get("/tasks/stream")
+async def stream_tasks():
+    """Stream all active tasks as newline-delimited JSON"""
+    # For POC, we'll use a default user
+    user = await get_or_create_user("default_user", "poc_user")
+    
+    async def generate():
+        async for row in stream_active_tasks(user.id):
+            yield TaskOut.model_validate(row).model_dump_json() + "\n"
     
-    except Exception as e:
-        logger.error(f"Task retrieval error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 # ============================================================================
@@ -337,37 +350,34 @@ async def get_tasks():
 @app.get("/metrics/usage")
 async def get_usage_metrics():
     """Get AI usage metrics"""
-    try:
-        today_stats = ai_client.get_usage_stats()
-        total_cost = ai_client.get_total_cost()
-        
-        return {
-            "today": today_stats,
-            "total_cost_today": total_cost,
-            "budget_remaining": settings.monthly_budget_limit - total_cost,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    today_stats = ai_client.get_usage_stats()
+    total_cost = ai_client.get_total_cost()
     
-    except Exception as e:
-        logger.error(f"Metrics error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "today": today_stats,
+        "total_cost_today": total_cost,
+        "budget_remaining": settings.monthly_budget_limit - total_cost,
+        "timestamp": datetime.utcnow()
+    }
 
 
 @app.get("/metrics/performance")
 async def get_performance_metrics():
     """Get system performance metrics"""
-    try:
-        return {
-            "database_health": await db_manager.health_check(),
-            "ai_client_status": "connected",
-            "active_tasks": 0,  # TODO: Implement
-            "total_users": 1,   # TODO: Implement
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    db_ok, active_tasks, total_users = await asyncio.gather(
+        db_manager.health_check(),
+        count_active_tasks(),
+        count_users(),
+        return_exceptions=True
+    )
     
-    except Exception as e:
-        logger.error(f"Performance metrics error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "database_health": db_ok is True,
+        "ai_client_status": "connected",
+        "active_tasks": None if isinstance(active_tasks, Exception) else active_tasks,
+        "total_users": None if isinstance(total_users, Exception) else total_users,
+        "timestamp": datetime.utcnow()
+    }
 
 
 # ============================================================================
@@ -395,11 +405,11 @@ async def github_webhook(request: dict):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "path": str(request.url)
         }
     )
@@ -407,13 +417,12 @@ async def http_exception_handler(request, exc):
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    """Handle general exceptions (logged by the log_requests middleware)"""
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "path": str(request.url)
         }
     )
@@ -430,5 +439,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.environment == "development",
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="auto"  # uvloop when installed, asyncio otherwise (e.g. Windows)
     )
\ No newline at end of file
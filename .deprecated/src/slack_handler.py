@@ -4,12 +4,15 @@ Processes user commands and provides AI-powered responses
 """
 
 import asyncio
-import json
 import logging
+import random
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 
+import orjson
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from slack_bolt.async_app import AsyncApp
@@ -19,11 +22,258 @@ from slack_bolt.response import BoltResponse
 
 from .config import get_slack_config, settings
 from .ai_client import ai_client, AIResponse
-from .database import get_or_create_user, create_task, log_ai_interaction, get_active_tasks, User, Task
-from .utils import format_task_list, parse_time_estimate, extract_priority
+from .database import get_or_create_user, create_task, interaction_log_writer, get_active_tasks, User, Task
+from .utils import format_task_list, parse_time_estimate, extract_priority, strip_task_keywords
 
 logger = logging.getLogger(__name__)
 
+# Retries for Slack API calls rejected with HTTP 429 or 5xx
+SLACK_MAX_RETRIES = 3
+SLACK_BACKOFF_BASE_SECONDS = 0.5
+
+# Slack profiles rarely change, so users.info results are reused for an hour
+USER_INFO_TTL_SECONDS = 3600
+USER_INFO_CACHE_SIZE = 1024
+
+# /tasks results are reused briefly; creating a task invalidates the entry
+ACTIVE_TASKS_TTL_SECONDS = 10
+ACTIVE_TASKS_CACHE_SIZE = 1024
+
+# User mention markup, e.g. <@U012AB3CD>
+_MENTION_RE = re.compile(r'<@[A-Z0-9]+>')
+
+# Leading DM keyword; one anchored match replaces a chain of lower()+startswith()
+_DM_COMMAND_RE = re.compile(r'(create task|help|status)', re.IGNORECASE)
+
+# ============================================================================
+# SYSTEM PROMPTS
+# ============================================================================
+
+# Bump when any prompt below changes; logged with each interaction
+PROMPT_VERSION = "1"
+
+_SYSTEM_PROMPT_GENERAL = "You are Jace Berelen, an AI assistant specialized in overemployment support. Help the user manage multiple jobs efficiently."
+
+_SYSTEM_PROMPT_ASSISTANT = """You are Jace Berelen, an expert AI assistant for overemployed professionals. 
+You help people manage multiple jobs simultaneously by providing:
+- Task prioritization strategies
+- Time management techniques
+- Automation suggestions
+- Communication templates
+- Productivity hacks
+
+Be concise, practical, and actionable in your responses."""
+
+_SYSTEM_PROMPT_CHANNEL = "You are Jace Berelen, helping with overemployment in a Slack channel. Be helpful but concise since others can see this."
+
+_SYSTEM_PROMPT_TASK_PARSER = "You are a task parsing expert. Extract structured data from natural language requests."
+
+# Local task parsing (skips the AI round-trip for simple requests)
+_CREATE_TASK_PREFIX_RE = re.compile(r'^\s*create task\s*[:\-]?\s*', re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
+_RELATIVE_DATE_RE = re.compile(r'\b(today|tomorrow)\b', re.IGNORECASE)
+_DUE_DATE_TOKEN_RE = re.compile(r'\b(?:(?:due|by|on)\s+)?(?:\d{4}-\d{2}-\d{2}|today|tomorrow)\b', re.IGNORECASE)
+
+
+def _parse_due_date(text: str) -> Optional[datetime]:
+    """Extract an explicit or relative due date from text"""
+    match = _ISO_DATE_RE.search(text)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y-%m-%d")
+        except ValueError:
+            return None
+    
+    match = _RELATIVE_DATE_RE.search(text)
+    if match:
+        today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        return today + timedelta(days=1 if match.group(1).lower() == "tomorrow" else 0)
+    
+    return None
+
+
+def _try_parse_task_local(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a task creation request without calling the AI
+    
+    Only requests carrying a priority, estimate or due date are parsed
+    locally; the matched words are removed from the title. Anything else
+    returns None and the caller falls back to AI parsing.
+    """
+    title = _CREATE_TASK_PREFIX_RE.sub('', text).strip()
+    if not title:
+        return None
+    
+    # Dates first, so the digits of an ISO date are not read as a time estimate
+    due_date = _parse_due_date(title)
+    if due_date is not None:
+        title = _DUE_DATE_TOKEN_RE.sub(' ', title)
+    
+    # extract_priority falls back to "medium" only when no priority keyword is present
+    priority = extract_priority(title)
+    has_priority = priority != "medium"
+    estimated_hours = parse_time_estimate(title)
+    if not (has_priority or estimated_hours is not None or due_date is not None):
+        return None
+    
+    title = strip_task_keywords(title)
+    if not title:
+        return None
+    
+    return {
+        "title": title,
+        "description": "",
+        "priority": priority,
+        "estimated_hours": estimated_hours,
+        "due_date": due_date
+    }
+
+# ============================================================================
+# STATIC BLOCK KIT PAYLOADS (built once, never mutated)
+# ============================================================================
+
+# Maximum tasks rendered individually in a task list
+TASK_LIST_DISPLAY_LIMIT = 5
+
+_DIVIDER = {"type": "divider"}
+
+_PRIORITY_EMOJI = {
+    "low": "🔵",
+    "medium": "🟡",
+    "high": "🟠",
+    "urgent": "🔴"
+}
+
+_STATUS_LABEL = {
+    "pending": "PENDING",
+    "in_progress": "IN_PROGRESS",
+    "completed": "DONE",
+    "failed": "FAILED",
+    "cancelled": "CANCELLED"
+}
+
+# Human-readable status, e.g. "in_progress" -> "In Progress"
+_STATUS_DISPLAY = {status: status.replace('_', ' ').title() for status in _STATUS_LABEL}
+
+_HELP_TEXT = """
+        *Jace Berelen - Your Overemployment AI Assistant*
+
+*Available Commands:*
+• `/jace help` - Show this help message
+• `/jace create [task description]` - Create a new task
+• `/jace status` - Show your current status
+• `/tasks` - View your active tasks
+• `/ai [question]` - Ask me anything about overemployment
+
+*Direct Message Commands:*
+• `create task [description]` - Create a task via DM
+• `help` - Get help
+• `status` - Check your status
+• Just ask me anything naturally!
+
+*Tips:*
+• I can help you prioritize tasks across multiple jobs
+• Ask me for automation suggestions
+• I provide time management strategies
+• Mention me in channels with `@jace [question]`
+
+*Examples:*
+• "How do I manage 3 different codebases efficiently?"
+• "Create task: Review pull requests for Project Alpha"
+• "What's the best way to handle overlapping meetings?"
+"""
+
+_HELP_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": _HELP_TEXT
+        }
+    }
+]
+
+_EMPTY_TASKS_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "*No active tasks!*\n\nYou're all caught up. Ready to take on new challenges?"
+        }
+    },
+    {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Create New Task"
+                },
+                "action_id": "create_task_modal",
+                "style": "primary"
+            }
+        ]
+    }
+]
+
+_TASK_LIST_FOOTER_BLOCKS = [
+    _DIVIDER,
+    {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Create New Task"
+                },
+                "action_id": "create_task_modal",
+                "style": "primary"
+            },
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "Get AI Help"
+                },
+                "action_id": "get_ai_task_help"
+            }
+        ]
+    }
+]
+
+
+class ChannelTokenBucket:
+    """
+    Per-channel token bucket for outgoing messages
+    
+    Slack allows roughly one message per second per channel; callers wait
+    for a token instead of bursting into 429 responses.
+    """
+    
+    def __init__(self, capacity: float = 1.0, refill_rate: float = 1.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self._buckets: Dict[str, tuple] = {}  # channel -> (tokens, last_refill)
+        self._locks: Dict[str, asyncio.Lock] = {}
+    
+    async def acquire(self, channel_id: str):
+        """Wait until a message may be sent to channel_id"""
+        lock = self._locks.setdefault(channel_id, asyncio.Lock())
+        
+        async with lock:
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(channel_id, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+            
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.refill_rate)
+                tokens = 1.0
+                now = time.monotonic()
+            
+            self._buckets[channel_id] = (tokens - 1, now)
+
 
 class SlackHandler:
     """
@@ -38,6 +288,18 @@ class SlackHandler:
             signing_secret=self.config["signing_secret"]
         )
         self.client = AsyncWebClient(token=self.config["bot_token"])
+        self.rate_limiter = ChannelTokenBucket()
+        
+        # users.info cache: slack user id -> (fetched_at, user payload), LRU-bounded;
+        # a refresh lock exists only while that user's fetch is in flight
+        self._user_cache: OrderedDict = OrderedDict()
+        self._user_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Active tasks cache: db user id -> (fetched_at, tasks), LRU-bounded
+        self._tasks_cache: OrderedDict = OrderedDict()
+        
+        # Strong references to deferred handler work until it finishes
+        self._background_tasks: set = set()
         
         # Command registry
         self.commands = {}
@@ -63,6 +325,95 @@ class SlackHandler:
         
         logger.info("Slack handlers setup complete")
     
+    async def _slack_call(self, method: Callable, *args, **kwargs):
+        """
+        Call a Slack Web API method, retrying transient failures
+        
+        429 responses wait for the Retry-After header; 5xx responses back off
+        exponentially with jitter. Anything else is raised immediately.
+        """
+        for attempt in range(SLACK_MAX_RETRIES + 1):
+            try:
+                return await method(*args, **kwargs)
+            except SlackApiError as e:
+                status = e.response.status_code
+                if attempt == SLACK_MAX_RETRIES or not (status == 429 or status >= 500):
+                    raise
+                
+                if status == 429:
+                    delay = float(e.response.headers.get("Retry-After", 1))
+                else:
+                    delay = SLACK_BACKOFF_BASE_SECONDS * (2 ** attempt) * (1 + random.random())
+                
+                logger.warning("Slack API returned %s, retrying in %.1fs", status, delay)
+                await asyncio.sleep(delay)
+    
+    async def post_message(self, channel: str, **kwargs):
+        """Send a message through the per-channel rate limiter"""
+        await self.rate_limiter.acquire(channel)
+        return await self._slack_call(self.client.chat_postMessage, channel=channel, **kwargs)
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run handler work in the background, off the Slack ack path"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def get_user_info(self, user_id: str) -> dict:
+        """Get a Slack user's profile, served from cache when fresh"""
+        cached = self._user_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < USER_INFO_TTL_SECONDS:
+            self._user_cache.move_to_end(user_id)
+            return cached[1]
+        
+        # One refresh per user at a time; concurrent callers reuse its result
+        lock = self._user_locks.setdefault(user_id, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._user_cache.get(user_id)
+                if cached and time.monotonic() - cached[0] < USER_INFO_TTL_SECONDS:
+                    return cached[1]
+                
+                user_info = await self._slack_call(self.client.users_info, user=user_id)
+                self._user_cache[user_id] = (time.monotonic(), user_info["user"])
+                self._user_cache.move_to_end(user_id)
+                
+                if len(self._user_cache) > USER_INFO_CACHE_SIZE:
+                    self._user_cache.popitem(last=False)
+                
+                return user_info["user"]
+        finally:
+            if self._user_locks.get(user_id) is lock:
+                del self._user_locks[user_id]
+    
+    async def resolve_user(self, user_id: str) -> User:
+        """Get or create the database user for a Slack user id"""
+        slack_user = await self.get_user_info(user_id)
+        username = slack_user["name"]
+        email = slack_user["profile"].get("email", f"{username}@example.com")
+        return await get_or_create_user(user_id, username, email)
+    
+    async def get_cached_active_tasks(self, user_id: int) -> List[Task]:
+        """Get a user's active tasks, reusing a recent result"""
+        cached = self._tasks_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < ACTIVE_TASKS_TTL_SECONDS:
+            self._tasks_cache.move_to_end(user_id)
+            return cached[1]
+        
+        tasks = await get_active_tasks(user_id, limit=10)
+        self._tasks_cache[user_id] = (time.monotonic(), tasks)
+        self._tasks_cache.move_to_end(user_id)
+        
+        if len(self._tasks_cache) > ACTIVE_TASKS_CACHE_SIZE:
+            self._tasks_cache.popitem(last=False)
+        
+        return tasks
+    
+    def invalidate_active_tasks(self, user_id: int):
+        """Drop a user's cached active tasks after they change"""
+        self._tasks_cache.pop(user_id, None)
+    
     async def handle_message(self, message: dict, context: AsyncBoltContext):
         """Handle direct messages and mentions"""
         try:
@@ -75,48 +426,35 @@ class SlackHandler:
                 return
             
             # Get or create user
-            user_info = await self.client.users_info(user=user_id)
-            username = user_info["user"]["name"]
-            email = user_info["user"]["profile"].get("email", f"{username}@example.com")
-            
-            user = await get_or_create_user(user_id, username, email)
+            user = await self.resolve_user(user_id)
             
             # Check if it's a DM
             if channel_id.startswith("D"):
                 await self.handle_direct_message(user, text, channel_id)
             
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
             await self.send_error_message(message.get("channel"), str(e))
     
     async def handle_direct_message(self, user: User, text: str, channel_id: str):
         """Handle direct messages with AI assistance"""
         try:
-            # Log the interaction
-            await log_ai_interaction(
-                user_id=user.id,
-                interaction_type="direct_message",
-                prompt=text,
-                response="",  # Will update after AI response
-                model_used="",
-                tokens_used=0,
-                cost_usd=0.0,
-                response_time_ms=0
-            )
-            
             # Check for specific commands
-            if text.lower().startswith("create task"):
+            match = _DM_COMMAND_RE.match(text)
+            command = match.group(1).lower() if match else None
+            
+            if command == "create task":
                 await self.handle_create_task_from_text(user, text, channel_id)
-            elif text.lower().startswith("help"):
+            elif command == "help":
                 await self.send_help_message(channel_id)
-            elif text.lower().startswith("status"):
+            elif command == "status":
                 await self.send_status_update(user, channel_id)
             else:
-                # General AI assistance
-                await self.handle_ai_conversation(user, text, channel_id)
+                # General AI assistance, deferred so the event is acked promptly
+                self._spawn(self.handle_ai_conversation(user, text, channel_id))
                 
         except Exception as e:
-            logger.error(f"Error handling DM: {e}")
+            logger.error("Error handling DM: %s", e)
             await self.send_error_message(channel_id, "Sorry, I encountered an error processing your message.")
     
     async def handle_jace_command(self, ack, body: dict, context: AsyncBoltContext):
@@ -129,10 +467,7 @@ class SlackHandler:
             command_text = body.get("text", "").strip()
             
             # Get user
-            user_info = await self.client.users_info(user=user_id)
-            username = user_info["user"]["name"]
-            email = user_info["user"]["profile"].get("email", f"{username}@example.com")
-            user = await get_or_create_user(user_id, username, email)
+            user = await self.resolve_user(user_id)
             
             if not command_text or command_text == "help":
                 await self.send_jace_help(channel_id)
@@ -146,10 +481,10 @@ class SlackHandler:
                 # AI assistance for any other query
                 response = await ai_client.ask_claude(
                     prompt=command_text,
-                    system_prompt="You are Jace Berelen, an AI assistant specialized in overemployment support. Help the user manage multiple jobs efficiently."
+                    system_prompt=_SYSTEM_PROMPT_GENERAL
                 )
                 
-                await self.client.chat_postMessage(
+                await self.post_message(
                     channel=channel_id,
                     text=response.content,
                     blocks=[
@@ -173,7 +508,7 @@ class SlackHandler:
                 )
                 
                 # Log interaction
-                await log_ai_interaction(
+                interaction_log_writer.enqueue(
                     user_id=user.id,
                     interaction_type="slash_command",
                     prompt=command_text,
@@ -181,11 +516,12 @@ class SlackHandler:
                     model_used=response.model_used,
                     tokens_used=response.tokens_used,
                     cost_usd=response.cost_usd,
-                    response_time_ms=response.response_time_ms
+                    response_time_ms=response.response_time_ms,
+                    context={"prompt_version": PROMPT_VERSION}
                 )
         
         except Exception as e:
-            logger.error(f"Error handling /jace command: {e}")
+            logger.error("Error handling /jace command: %s", e)
             await self.send_error_message(channel_id, "Error processing command")
     
     async def handle_tasks_command(self, ack, body: dict, context: AsyncBoltContext):
@@ -197,51 +533,27 @@ class SlackHandler:
             channel_id = body["channel_id"]
             
             # Get user
-            user_info = await self.client.users_info(user=user_id)
-            username = user_info["user"]["name"]
-            user = await get_or_create_user(user_id, username)
+            user = await self.resolve_user(user_id)
             
             # Get active tasks
-            tasks = await get_active_tasks(user.id, limit=10)
+            tasks = await self.get_cached_active_tasks(user.id)
             
             if not tasks:
-                await self.client.chat_postMessage(
+                await self.post_message(
                     channel=channel_id,
                     text="No active tasks! You're all caught up.",
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": "*No active tasks!*\n\nYou're all caught up. Ready to take on new challenges?"
-                            }
-                        },
-                        {
-                            "type": "actions",
-                            "elements": [
-                                {
-                                    "type": "button",
-                                    "text": {
-                                        "type": "plain_text",
-                                        "text": "Create New Task"
-                                    },
-                                    "action_id": "create_task_modal",
-                                    "style": "primary"
-                                }
-                            ]
-                        }
-                    ]
+                    blocks=_EMPTY_TASKS_BLOCKS
                 )
             else:
                 task_blocks = self.build_task_list_blocks(tasks)
-                await self.client.chat_postMessage(
+                await self.post_message(
                     channel=channel_id,
                     text=f"You have {len(tasks)} active tasks",
                     blocks=task_blocks
                 )
         
         except Exception as e:
-            logger.error(f"Error handling /tasks command: {e}")
+            logger.error("Error handling /tasks command: %s", e)
             await self.send_error_message(channel_id, "Error retrieving tasks")
     
     async def handle_ai_command(self, ack, body: dict, context: AsyncBoltContext):
@@ -254,33 +566,24 @@ class SlackHandler:
             command_text = body.get("text", "").strip()
             
             if not command_text:
-                await self.client.chat_postMessage(
+                await self.post_message(
                     channel=channel_id,
                     text="Please provide a question or request. Example: `/ai How do I prioritize tasks across 3 different jobs?`"
                 )
                 return
             
-            # Get user
-            user_info = await self.client.users_info(user=user_id)
-            username = user_info["user"]["name"]
-            user = await get_or_create_user(user_id, username)
-            
-            # Get AI response
-            response = await ai_client.ask_claude(
-                prompt=command_text,
-                system_prompt="""You are Jace Berelen, an expert AI assistant for overemployed professionals. 
-                You help people manage multiple jobs simultaneously by providing:
-                - Task prioritization strategies
-                - Time management techniques
-                - Automation suggestions
-                - Communication templates
-                - Productivity hacks
-                
-                Be concise, practical, and actionable in your responses."""
+            # The user record is only needed for logging, so resolve it
+            # while the AI request is in flight
+            user, response = await asyncio.gather(
+                self.resolve_user(user_id),
+                ai_client.ask_claude(
+                    prompt=command_text,
+                    system_prompt=_SYSTEM_PROMPT_ASSISTANT
+                )
             )
             
             # Send response
-            await self.client.chat_postMessage(
+            await self.post_message(
                 channel=channel_id,
                 text=response.content,
                 blocks=[
@@ -339,7 +642,7 @@ class SlackHandler:
             )
             
             # Log interaction
-            await log_ai_interaction(
+            interaction_log_writer.enqueue(
                 user_id=user.id,
                 interaction_type="ai_command",
                 prompt=command_text,
@@ -347,49 +650,54 @@ class SlackHandler:
                 model_used=response.model_used,
                 tokens_used=response.tokens_used,
                 cost_usd=response.cost_usd,
-                response_time_ms=response.response_time_ms
+                response_time_ms=response.response_time_ms,
+                context={"prompt_version": PROMPT_VERSION}
             )
         
         except Exception as e:
-            logger.error(f"Error handling /ai command: {e}")
+            logger.error("Error handling /ai command: %s", e)
             await self.send_error_message(channel_id, "Error processing AI request")
     
     async def handle_app_mention(self, event: dict, context: AsyncBoltContext):
         """Handle @jace mentions in channels"""
+        # Return right away so Slack gets its ack inside the 3 s window and
+        # does not redeliver the event (which would repeat the AI call)
+        self._spawn(self._process_mention(event))
+    
+    async def _process_mention(self, event: dict):
+        """Answer a mention in its thread"""
         try:
             user_id = event["user"]
             channel_id = event["channel"]
             text = event["text"]
             
             # Remove mention from text
-            text = re.sub(r'<@[A-Z0-9]+>', '', text).strip()
+            text = _MENTION_RE.sub('', text).strip()
             
             if not text:
-                await self.client.chat_postMessage(
+                await self.post_message(
                     channel=channel_id,
                     text="👋 Hi! I'm Jace, your overemployment AI assistant. Try asking me something like 'help me prioritize my tasks' or use `/jace help` for commands."
                 )
                 return
             
-            # Get user
-            user_info = await self.client.users_info(user=user_id)
-            username = user_info["user"]["name"]
-            user = await get_or_create_user(user_id, username)
-            
-            # Process mention as AI request
-            response = await ai_client.ask_claude(
-                prompt=text,
-                system_prompt="You are Jace Berelen, helping with overemployment in a Slack channel. Be helpful but concise since others can see this."
+            # Resolve the user while the mention is processed as an AI request
+            user, response = await asyncio.gather(
+                self.resolve_user(user_id),
+                ai_client.ask_claude(
+                    prompt=text,
+                    system_prompt=_SYSTEM_PROMPT_CHANNEL
+                )
             )
             
-            await self.client.chat_postMessage(
+            await self.post_message(
                 channel=channel_id,
                 text=f"<@{user_id}> {response.content}",
                 thread_ts=event.get("ts")  # Reply in thread if possible
             )
             
             # Log interaction
-            await log_ai_interaction(
+            interaction_log_writer.enqueue(
                 user_id=user.id,
                 interaction_type="mention",
                 prompt=text,
@@ -397,59 +705,39 @@ class SlackHandler:
                 model_used=response.model_used,
                 tokens_used=response.tokens_used,
                 cost_usd=response.cost_usd,
-                response_time_ms=response.response_time_ms
+                response_time_ms=response.response_time_ms,
+                context={"prompt_version": PROMPT_VERSION}
             )
         
         except Exception as e:
-            logger.error(f"Error handling app mention: {e}")
+            logger.error("Error handling app mention: %s", e)
+            await self.post_message(
+                channel=event["channel"],
+                text="Sorry, I encountered an error processing your mention.",
+                thread_ts=event.get("ts")
+            )
     
     async def handle_create_task_from_text(self, user: User, text: str, channel_id: str):
         """Create task from natural language"""
         try:
-            # Use AI to parse the task creation request
-            response = await ai_client.ask_claude(
-                prompt=f"""Parse this task creation request and extract:
-                1. Task title (clear, actionable)
-                2. Task description (details)
-                3. Priority (low, medium, high, urgent)
-                4. Estimated hours (if mentioned)
-                5. Due date (if mentioned)
-                
-                Request: "{text}"
-                
-                Respond in JSON format:
-                {{
-                    "title": "...",
-                    "description": "...",
-                    "priority": "medium",
-                    "estimated_hours": null,
-                    "due_date": null
-                }}""",
-                system_prompt="You are a task parsing expert. Extract structured data from natural language requests."
-            )
+            # Simple requests are parsed locally; only free-form ones need AI
+            task_data = _try_parse_task_local(text)
+            response = None
             
-            try:
-                task_data = json.loads(response.content)
-            except json.JSONDecodeError:
-                # Fallback to simple parsing
-                task_title = text.replace("create task", "").strip()
-                task_data = {
-                    "title": task_title,
-                    "description": "",
-                    "priority": "medium",
-                    "estimated_hours": None,
-                    "due_date": None
-                }
+            if task_data is None:
+                task_data, response = await self._parse_task_with_ai(text)
             
             # Create the task
             task = await create_task(
                 user_id=user.id,
                 title=task_data["title"],
                 description=task_data["description"],
-                priority=task_data["priority"]
+                priority=task_data["priority"],
+                due_date=task_data["due_date"] if isinstance(task_data.get("due_date"), datetime) else None
             )
+            self.invalidate_active_tasks(user.id)
             
-            await self.client.chat_postMessage(
+            await self.post_message(
                 channel=channel_id,
                 text=f"Task created: {task.title}",
                 blocks=[
@@ -487,23 +775,75 @@ class SlackHandler:
                 ]
             )
             
-            # Log AI interaction
-            await log_ai_interaction(
-                user_id=user.id,
-                task_id=task.id,
-                interaction_type="task_creation",
-                prompt=text,
-                response=response.content,
-                model_used=response.model_used,
-                tokens_used=response.tokens_used,
-                cost_usd=response.cost_usd,
-                response_time_ms=response.response_time_ms
-            )
+            # Log interaction (local parses are recorded with zero AI usage)
+            if response is None:
+                interaction_log_writer.enqueue(
+                    user_id=user.id,
+                    task_id=task.id,
+                    interaction_type="task_creation",
+                    prompt=text,
+                    response=orjson.dumps(task_data).decode(),
+                    model_used="local_parser",
+                    tokens_used=0,
+                    cost_usd=0.0,
+                    response_time_ms=0
+                )
+            else:
+                interaction_log_writer.enqueue(
+                    user_id=user.id,
+                    task_id=task.id,
+                    interaction_type="task_creation",
+                    prompt=text,
+                    response=response.content,
+                    model_used=response.model_used,
+                    tokens_used=response.tokens_used,
+                    cost_usd=response.cost_usd,
+                    response_time_ms=response.response_time_ms,
+                    context={"prompt_version": PROMPT_VERSION}
+                )
         
         except Exception as e:
-            logger.error(f"Error creating task from text: {e}")
+            logger.error("Error creating task from text: %s", e)
             await self.send_error_message(channel_id, "Error creating task")
     
+    async def _parse_task_with_ai(self, text: str) -> tuple:
+        """Parse a free-form task request with AI, returning (task_data, response)"""
+        response = await ai_client.ask_claude(
+            prompt=f"""Parse this task creation request and extract:
+            1. Task title (clear, actionable)
+            2. Task description (details)
+            3. Priority (low, medium, high, urgent)
+            4. Estimated hours (if mentioned)
+            5. Due date (if mentioned)
+            
+            Request: "{text}"
+            
+            Respond in JSON format:
+            {{
+                "title": "...",
+                "description": "...",
+                "priority": "medium",
+                "estimated_hours": null,
+                "due_date": null
+            }}""",
+            system_prompt=_SYSTEM_PROMPT_TASK_PARSER
+        )
+        
+        try:
+            task_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Fallback to simple parsing
+            task_title = text.replace("create task", "").strip()
+            task_data = {
+                "title": task_title,
+                "description": "",
+                "priority": "medium",
+                "estimated_hours": None,
+                "due_date": None
+            }
+        
+        return task_data, response
+    
     def build_task_list_blocks(self, tasks: List[Task]) -> List[Dict]:
         """Build Slack blocks for task list display"""
         blocks = [
@@ -516,131 +856,62 @@ class SlackHandler:
             }
         ]
         
-        for i, task in enumerate(tasks[:5]):  # Show max 5 tasks
-            priority_emoji = {
-                "low": "🔵",
-                "medium": "🟡", 
-                "high": "🟠",
-                "urgent": "🔴"
-            }.get(task.priority, "⚪")
-            
-            status_emoji = {
-                                  "pending": "PENDING",
-                  "in_progress": "IN_PROGRESS",
-                  "completed": "DONE",
-                  "failed": "FAILED",
-                  "cancelled": "CANCELLED"
-              }.get(task.status, "UNKNOWN")
+        shown = tasks[:TASK_LIST_DISPLAY_LIMIT]
+        last = len(shown) - 1
+        
+        for i, task in enumerate(shown):
+            priority_emoji = _PRIORITY_EMOJI.get(task.priority, "⚪")
+            status_emoji = _STATUS_LABEL.get(task.status, "UNKNOWN")
+            status_display = _STATUS_DISPLAY.get(task.status) or task.status.replace('_', ' ').title()
             
-            blocks.extend([
-                {
-                    "type": "section",
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"{priority_emoji} *{task.title}*\n{status_emoji} {status_display}"
+                },
+                "accessory": {
+                    "type": "button",
                     "text": {
-                        "type": "mrkdwn",
-                        "text": f"{priority_emoji} *{task.title}*\n{status_emoji} {task.status.replace('_', ' ').title()}"
+                        "type": "plain_text",
+                        "text": "View Details"
                     },
-                    "accessory": {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "View Details"
-                        },
-                        "action_id": "view_task_details",
-                        "value": str(task.id)
-                    }
+                    "action_id": "view_task_details",
+                    "value": str(task.id)
                 }
-            ])
+            })
             
-            if i < len(tasks) - 1:
-                blocks.append({"type": "divider"})
+            # Divider only between rendered tasks; the footer brings its own
+            if i < last:
+                blocks.append(_DIVIDER)
         
-        if len(tasks) > 5:
+        if len(tasks) > TASK_LIST_DISPLAY_LIMIT:
             blocks.append({
                 "type": "context",
                 "elements": [
                     {
                         "type": "mrkdwn",
-                        "text": f"... and {len(tasks) - 5} more tasks. Use `/tasks all` to see everything."
+                        "text": f"... and {len(tasks) - TASK_LIST_DISPLAY_LIMIT} more tasks. Use `/tasks all` to see everything."
                     }
                 ]
             })
         
         # Add action buttons
-        blocks.extend([
-            {"type": "divider"},
-            {
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Create New Task"
-                        },
-                        "action_id": "create_task_modal",
-                        "style": "primary"
-                    },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Get AI Help"
-                        },
-                        "action_id": "get_ai_task_help"
-                    }
-                ]
-            }
-        ])
+        blocks.extend(_TASK_LIST_FOOTER_BLOCKS)
         
         return blocks
     
     async def send_help_message(self, channel_id: str):
         """Send help information"""
-        help_text = """
-        *Jace Berelen - Your Overemployment AI Assistant*
-
-*Available Commands:*
-• `/jace help` - Show this help message
-• `/jace create [task description]` - Create a new task
-• `/jace status` - Show your current status
-• `/tasks` - View your active tasks
-• `/ai [question]` - Ask me anything about overemployment
-
-*Direct Message Commands:*
-• `create task [description]` - Create a task via DM
-• `help` - Get help
-• `status` - Check your status
-• Just ask me anything naturally!
-
-*Tips:*
-• I can help you prioritize tasks across multiple jobs
-• Ask me for automation suggestions
-• I provide time management strategies
-• Mention me in channels with `@jace [question]`
-
-*Examples:*
-• "How do I manage 3 different codebases efficiently?"
-• "Create task: Review pull requests for Project Alpha"
-• "What's the best way to handle overlapping meetings?"
-"""
-        
-        await self.client.chat_postMessage(
+        await self.post_message(
             channel=channel_id,
-            text=help_text,
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": help_text
-                    }
-                }
-            ]
+            text=_HELP_TEXT,
+            blocks=_HELP_BLOCKS
         )
     
     async def send_error_message(self, channel_id: str, error_message: str):
         """Send user-friendly error message"""
-        await self.client.chat_postMessage(
+        await self.post_message(
             channel=channel_id,
                 text=f"Error: {error_message}",
             blocks=[
@@ -657,10 +928,10 @@ class SlackHandler:
     async def start_server(self, port: int = 3000):
         """Start the Slack app server"""
         try:
-            logger.info(f"Starting Slack app server on port {port}")
+            logger.info("Starting Slack app server on port %s", port)
             await self.app.async_start(port=port)
         except Exception as e:
-            logger.error(f"Failed to start Slack server: {e}")
+            logger.error("Failed to start Slack server: %s", e)
             raise
 
 
@@ -673,18 +944,57 @@ async def send_notification(user_id: str, message: str, channel: str = None):
     try:
         target_channel = channel or user_id  # DM if no channel specified
         
-        await slack_handler.client.chat_postMessage(
+        await slack_handler.post_message(
             channel=target_channel,
             text=message
         )
         
-        logger.info(f"Sent notification to {user_id}: {message[:50]}...")
+        logger.info("Sent notification to %s: %.50s...", user_id, message)
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
+
+
+# Concurrent posts during a notification fan-out
+NOTIFICATION_CONCURRENCY = 5
+
+
+async def send_notifications(items: List[tuple], channel: str = None) -> int:
+    """
+    Send many notifications at once
+    
+    Args:
+        items: (user_id, message) pairs
+        channel: Post everything to this channel instead of DMing each user
+        
+    Returns:
+        Number of messages successfully posted
+    """
+    # Messages bound for the same target are merged into one post
+    grouped: Dict[str, List[str]] = {}
+    for user_id, message in items:
+        grouped.setdefault(channel or user_id, []).append(message)
+    
+    semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+    
+    async def post(target: str, messages: List[str]) -> bool:
+        async with semaphore:
+            try:
+                await slack_handler.post_message(channel=target, text="\n\n".join(messages))
+                return True
+            except Exception as e:
+                logger.error("Failed to send notification to %s: %s", target, e)
+                return False
+    
+    results = await asyncio.gather(*(post(target, messages) for target, messages in grouped.items()))
+    sent = sum(results)
+    
+    logger.info("Sent %s/%s notification messages for %s items", sent, len(grouped), len(items))
+    return sent
 
 
 __all__ = [
     "SlackHandler",
     "slack_handler",
-    "send_notification"
+    "send_notification",
+    "send_notifications"
 ] 
\ No newline at end of file
@@ -3,32 +3,134 @@ Utility functions for the Jace Berelen POC
 Logging, formatting, parsing, and system helpers
 """
 
+import io
 import logging
 import os
 import platform
 import psutil
 import re
-import json
-from datetime import datetime, timedelta
+import string
+import time
+import orjson
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.logging import RichHandler
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 
 from .config import settings
 
 console = Console()
 
+# get_system_info() result is reused for this long under polling
+SYSTEM_INFO_TTL_SECONDS = 5
+_system_info_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+
+# Prime psutil's CPU sampler so later non-blocking reads are meaningful
+psutil.cpu_percent(interval=None)
+
+# Log file for this process, named once at startup
+_LOG_DIR = Path("logs")
+_LOG_FILE_PATH = _LOG_DIR / f"jace_{datetime.now():%Y%m%d}.log"
+
+# Last formatted UTC timestamp as (epoch second, ISO string)
+_last_timestamp = (0, "")
+
+# Precompiled text patterns
+_SLACK_TOKENS_RE = re.compile(r'<@[A-Z0-9]+>|<#[A-Z0-9]+\|[^>]+>|<http[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_URL_RE = re.compile(r'https?://[^\s<>"\']+[^\s<>"\'.,;:!?]')
+_MASK_RE = re.compile(
+    r'(?P<apikey>sk-[a-zA-Z0-9]{32,})'
+    r'|(?P<email>(?P<user>[a-zA-Z0-9._%+-]+)@(?P<domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))'
+    r'|(?P<slacktok>xoxb-[a-zA-Z0-9-]+)'
+)
+
+# Characters not allowed in filenames map to '_'
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Deletion tables: translate() leaves only the characters not allowed
+_EMAIL_LOCAL_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '._%+-')
+_EMAIL_HOST_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '.-')
+
+# Priority keywords and the bucket each one selects
+_PRIORITY_RE = re.compile(
+    r'\b(urgent|critical|asap|emergency|high|important|priority|low|minor|later)\b',
+    re.IGNORECASE
+)
+_PRIORITY_MAP = {
+    "urgent": "urgent", "critical": "urgent", "asap": "urgent", "emergency": "urgent",
+    "high": "high", "important": "high", "priority": "high",
+    "low": "low", "minor": "low", "later": "low",
+}
+
+# Entries kept per memoized text parser
+PARSE_CACHE_SIZE = 2048
+
+# Fixed render width for text task lists
+TASK_TABLE_WIDTH = 120
+
+# Rich markup colors for task list cells
+_PRIORITY_COLOR = {
+    "low": "blue",
+    "medium": "yellow",
+    "high": "orange1",
+    "urgent": "red"
+}
+_STATUS_COLOR = {
+    "pending": "yellow",
+    "in_progress": "blue",
+    "completed": "green",
+    "failed": "red",
+    "cancelled": "dim"
+}
+
+# Prebuilt bodies for the default 20-wide progress bar, indexed by filled cells
+PROGRESS_BAR_WIDTH = 20
+_PROGRESS_BARS = [
+    "█" * i + "░" * (PROGRESS_BAR_WIDTH - i) for i in range(PROGRESS_BAR_WIDTH + 1)
+]
+
+# Relative time units as (seconds per unit, name), largest first
+_RELATIVE_TIME_UNITS = [
+    (86400, "day"),
+    (3600, "hour"),
+    (60, "minute"),
+]
+
+# Time estimate patterns with their multiplier to hours
+_TIME_PATTERNS = [
+    (re.compile(r'(\d+(?:\.\d+)?)\s*h(?:ours?)?'), 1),
+    (re.compile(r'(\d+(?:\.\d+)?)\s*hrs?'), 1),
+    (re.compile(r'(\d+)\s*m(?:ins?|inutes?)'), 1 / 60),  # minutes
+    (re.compile(r'(\d+)\s*d(?:ays?)?'), 8),  # 8 hours/day
+    (re.compile(r'(\d+)\s*w(?:eeks?)?'), 40),  # 40 hours/week
+]
+
+# The same patterns without case folding, for removing an estimate from mixed-case text
+_TIME_STRIP_PATTERNS = [re.compile(pattern.pattern, re.IGNORECASE) for pattern, _ in _TIME_PATTERNS]
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second"""
+    global _last_timestamp
+    
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _last_timestamp[1]
+
 
 def setup_logging():
     """Setup logging configuration with Rich formatting"""
     
     # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    _LOG_DIR.mkdir(exist_ok=True)
     
     # Configure logging
     logging.basicConfig(
@@ -44,7 +146,7 @@ def setup_logging():
                 rich_tracebacks=True
             ),
             logging.FileHandler(
-                log_dir / f"jace_{datetime.now().strftime('%Y%m%d')}.log",
+                _LOG_FILE_PATH,
                 mode='a',
                 encoding='utf-8'
             )
@@ -57,6 +159,11 @@ def setup_logging():
     logging.getLogger("slack_sdk").setLevel(logging.WARNING)
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     
+    # Skip LogRecord fields no handler here formats
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     logger = logging.getLogger(__name__)
     logger.info("Logging system initialized")
 
@@ -64,10 +171,18 @@ def setup_logging():
 def get_system_info() -> Dict[str, Any]:
     """Get comprehensive system information"""
     
+    now = time.monotonic()
+    if _system_info_cache["data"] is not None and now - _system_info_cache["ts"] < SYSTEM_INFO_TTL_SECONDS:
+        return _system_info_cache["data"]
+    
     try:
+        # One syscall each; the values below are derived from these snapshots
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
         # Basic system info
         system_info = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_timestamp(),
             "platform": {
                 "system": platform.system(),
                 "release": platform.release(),
@@ -78,13 +193,14 @@ def get_system_info() -> Dict[str, Any]:
             },
             "hardware": {
                 "cpu_count": psutil.cpu_count(),
-                "cpu_percent": psutil.cpu_percent(interval=1),
-                "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-                "memory_used_gb": round(psutil.virtual_memory().used / (1024**3), 2),
-                "memory_percent": psutil.virtual_memory().percent,
-                "disk_total_gb": round(psutil.disk_usage('/').total / (1024**3), 2),
-                "disk_used_gb": round(psutil.disk_usage('/').used / (1024**3), 2),
-                "disk_percent": psutil.disk_usage('/').percent
+                # Non-blocking: CPU usage since the previous call
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_total_gb": round(memory.total / (1024**3), 2),
+                "memory_used_gb": round(memory.used / (1024**3), 2),
+                "memory_percent": memory.percent,
+                "disk_total_gb": round(disk.total / (1024**3), 2),
+                "disk_used_gb": round(disk.used / (1024**3), 2),
+                "disk_percent": disk.percent
             },
             "environment": {
                 "environment": settings.environment,
@@ -96,21 +212,37 @@ def get_system_info() -> Dict[str, Any]:
             }
         }
         
+        _system_info_cache["ts"] = now
+        _system_info_cache["data"] = system_info
         return system_info
         
     except Exception as e:
-        logging.error(f"Error getting system info: {e}")
+        logging.error("Error getting system info: %s", e)
         return {
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_timestamp()
         }
 
 
-def format_task_list(tasks: List[Any], show_details: bool = False) -> str:
-    """Format task list for display"""
+def _task_row(task: Any) -> tuple:
+    """ID, title, status and priority cells for one task"""
     
-    if not tasks:
-        return "No tasks found."
+    title = task.title
+    status = task.status
+    priority = task.priority
+    status_color = _STATUS_COLOR.get(status, "white")
+    priority_color = _PRIORITY_COLOR.get(priority, "white")
+    
+    return (
+        str(task.id),
+        title if len(title) <= 40 else title[:40] + "...",
+        f"[{status_color}]{status}[/{status_color}]",
+        f"[{priority_color}]{priority}[/{priority_color}]"
+    )
+
+
+def build_task_table(tasks: List[Any], show_details: bool = False) -> Table:
+    """Build the task list as a Rich Table without rendering it"""
     
     table = Table(title="Task List")
     table.add_column("ID", style="cyan", no_wrap=True)
@@ -122,88 +254,71 @@ def format_task_list(tasks: List[Any], show_details: bool = False) -> str:
         table.add_column("Created", style="dim")
         table.add_column("Due Date", style="red")
     
-    for task in tasks:
-        priority_color = {
-            "low": "blue",
-            "medium": "yellow", 
-            "high": "orange1",
-            "urgent": "red"
-        }.get(task.priority, "white")
-        
-        status_color = {
-            "pending": "yellow",
-            "in_progress": "blue",
-            "completed": "green",
-            "failed": "red",
-            "cancelled": "dim"
-        }.get(task.status, "white")
-        
-        row = [
-            str(task.id),
-            task.title[:40] + "..." if len(task.title) > 40 else task.title,
-            f"[{status_color}]{task.status}[/{status_color}]",
-            f"[{priority_color}]{task.priority}[/{priority_color}]"
-        ]
-        
-        if show_details:
-            row.extend([
+    rows = [_task_row(task) for task in tasks]
+    
+    if show_details:
+        rows = [
+            row + (
                 task.created_at.strftime("%m/%d %H:%M"),
                 task.due_date.strftime("%m/%d") if task.due_date else "None"
-            ])
-        
+            )
+            for row, task in zip(rows, tasks)
+        ]
+    
+    for row in rows:
         table.add_row(*row)
     
-    # Render table to string
-    with console.capture() as capture:
-        console.print(table)
+    return table
+
+
+def format_task_list(tasks: List[Any], show_details: bool = False) -> str:
+    """Format task list for display"""
     
-    return capture.get()
+    if not tasks:
+        return "No tasks found."
+    
+    # Render straight into a string buffer
+    text_console = Console(file=io.StringIO(), width=TASK_TABLE_WIDTH)
+    text_console.print(build_task_table(tasks, show_details))
+    return text_console.file.getvalue()
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_time_estimate(text: str) -> Optional[float]:
     """Parse time estimate from text"""
     
-    # Common patterns
-    patterns = [
-        r'(\d+(?:\.\d+)?)\s*h(?:ours?)?',
-        r'(\d+(?:\.\d+)?)\s*hrs?',
-        r'(\d+)\s*m(?:ins?|inutes?)',
-        r'(\d+)\s*d(?:ays?)?',
-        r'(\d+)\s*w(?:eeks?)?'
-    ]
-    
     text = text.lower()
     
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern, multiplier in _TIME_PATTERNS:
+        match = pattern.search(text)
         if match:
-            value = float(match.group(1))
-            
-            if 'h' in pattern:
-                return value
-            elif 'm' in pattern:
-                return value / 60  # Convert minutes to hours
-            elif 'd' in pattern:
-                return value * 8  # Convert days to hours (8 hours/day)
-            elif 'w' in pattern:
-                return value * 40  # Convert weeks to hours (40 hours/week)
+            return float(match.group(1)) * multiplier
     
     return None
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def extract_priority(text: str) -> str:
     """Extract priority from text"""
     
-    text = text.lower()
+    found = {_PRIORITY_MAP[word.lower()] for word in _PRIORITY_RE.findall(text)}
     
-    if any(word in text for word in ['urgent', 'critical', 'asap', 'emergency']):
-        return 'urgent'
-    elif any(word in text for word in ['high', 'important', 'priority']):
-        return 'high'
-    elif any(word in text for word in ['low', 'minor', 'later']):
-        return 'low'
-    else:
-        return 'medium'
+    # Strongest keyword wins regardless of position
+    for priority in ('urgent', 'high', 'low'):
+        if priority in found:
+            return priority
+    return 'medium'
+
+
+def strip_task_keywords(text: str) -> str:
+    """Remove priority keywords and the time estimate that extract_priority/parse_time_estimate read"""
+    
+    text = _PRIORITY_RE.sub(' ', text)
+    for pattern in _TIME_STRIP_PATTERNS:
+        text, count = pattern.subn(' ', text, count=1)
+        if count:
+            break
+    return _WS_RE.sub(' ', text).strip(' ,;:-')
 
 
 def format_currency(amount: float) -> str:
@@ -216,12 +331,13 @@ def format_duration(seconds: int) -> str:
     
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{seconds // 60}m {seconds % 60}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
+    
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
 
 
 def truncate_text(text: str, max_length: int = 100) -> str:
@@ -236,57 +352,59 @@ def truncate_text(text: str, max_length: int = 100) -> str:
 def clean_slack_text(text: str) -> str:
     """Clean Slack-formatted text"""
     
-    # Remove user mentions
-    text = re.sub(r'<@[A-Z0-9]+>', '', text)
-    
-    # Remove channel mentions
-    text = re.sub(r'<#[A-Z0-9]+\|[^>]+>', '', text)
-    
-    # Remove links
-    text = re.sub(r'<http[^>]+>', '', text)
+    # Remove user mentions, channel mentions and links in one pass
+    text = _SLACK_TOKENS_RE.sub('', text)
     
     # Clean up extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
+    return _WS_RE.sub(' ', text).strip()
 
 
-def parse_slack_command(text: str) -> Dict[str, Any]:
-    """Parse Slack command text into structured data"""
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_slack_command_cached(text: str) -> Optional[tuple]:
+    """Hashable (command, args, options) parse of a command string"""
     
     # Split into words
     words = text.strip().split()
     
     if not words:
-        return {"command": None, "args": [], "options": {}}
+        return None
     
     command = words[0].lower()
-    args = words[1:]
+    args = []
     options = {}
     
-    # Parse options (--key value or --flag)
-    i = 0
-    while i < len(args):
-        if args[i].startswith('--'):
-            key = args[i][2:]
-            
-            # Check if next arg is a value
-            if i + 1 < len(args) and not args[i + 1].startswith('--'):
-                options[key] = args[i + 1]
+    # Split positional args from options (--key value or --flag) in one pass
+    i = 1
+    n = len(words)
+    while i < n:
+        word = words[i]
+        if word.startswith('--'):
+            # Check if next word is a value
+            if i + 1 < n and not words[i + 1].startswith('--'):
+                options[word[2:]] = words[i + 1]
                 i += 2
             else:
-                options[key] = True
+                options[word[2:]] = True
                 i += 1
         else:
+            args.append(word)
             i += 1
     
-    # Remove options from args
-    args = [arg for arg in args if not arg.startswith('--')]
+    return command, tuple(args), tuple(options.items())
+
+
+def parse_slack_command(text: str) -> Dict[str, Any]:
+    """Parse Slack command text into structured data"""
     
+    parsed = _parse_slack_command_cached(text)
+    if parsed is None:
+        return {"command": None, "args": [], "options": {}}
+    
+    command, args, options = parsed
     return {
         "command": command,
-        "args": args,
-        "options": options,
+        "args": list(args),
+        "options": dict(options),
         "raw_text": text
     }
 
@@ -294,27 +412,28 @@ def parse_slack_command(text: str) -> Dict[str, Any]:
 def validate_email(email: str) -> bool:
     """Validate email address format"""
     
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    local, at, domain = email.rpartition('@')
+    if not at or not local or local.translate(_EMAIL_LOCAL_TABLE):
+        return False
+    
+    host, dot, tld = domain.rpartition('.')
+    if not dot or not host or host.translate(_EMAIL_HOST_TABLE):
+        return False
+    
+    return len(tld) >= 2 and tld.isascii() and tld.isalpha()
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file system usage"""
     
-    # Remove/replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(' .')
+    # Replace invalid characters, then remove leading/trailing spaces and dots
+    filename = filename.translate(_FILENAME_TABLE).strip(' .')
     
     # Limit length
-    if len(filename) > 255:
-        filename = filename[:255]
-    
-    return filename
+    return filename[:255] if len(filename) > 255 else filename
 
 
-def create_progress_bar(current: int, total: int, width: int = 20) -> str:
+def create_progress_bar(current: int, total: int, width: int = PROGRESS_BAR_WIDTH) -> str:
     """Create a text progress bar"""
     
     if total == 0:
@@ -322,7 +441,10 @@ def create_progress_bar(current: int, total: int, width: int = 20) -> str:
     
     progress = current / total
     filled = int(width * progress)
-    bar = "█" * filled + "░" * (width - filled)
+    if width == PROGRESS_BAR_WIDTH and 0 <= filled <= width:
+        bar = _PROGRESS_BARS[filled]
+    else:
+        bar = "█" * filled + "░" * (width - filled)
     
     return f"{bar} {current}/{total} ({progress:.1%})"
 
@@ -331,60 +453,76 @@ def parse_json_safely(text: str) -> Optional[Dict[str, Any]]:
     """Safely parse JSON from text"""
     
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Try to extract JSON from markdown code blocks
-        json_match = re.search(r'```json\s*\n(.*?)\n```', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    
+    # Try to extract JSON from ```json or plain ``` code blocks
+    start = text.find('```')
+    while start >= 0:
+        line_end = text.find('\n', start)
+        if line_end < 0:
+            return None
+        end = text.find('```', line_end)
+        if end < 0:
+            return None
         
-        # Try to extract JSON from regular code blocks
-        code_match = re.search(r'```\s*\n(.*?)\n```', text, re.DOTALL)
-        if code_match:
+        if text[start + 3:line_end].strip() in ('', 'json'):
             try:
-                return json.loads(code_match.group(1))
-            except json.JSONDecodeError:
+                return orjson.loads(text[line_end + 1:end])
+            except orjson.JSONDecodeError:
                 pass
         
+        start = text.find('```', end + 3)
+    
+    return None
+
+
+def get_file_stat(file_path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a file once so callers can read size, mtime, etc. together"""
+    
+    try:
+        return os.stat(file_path)
+    except OSError:
         return None
 
 
 def get_file_size_mb(file_path: Union[str, Path]) -> float:
     """Get file size in MB"""
     
-    try:
-        return os.path.getsize(file_path) / (1024 * 1024)
-    except OSError:
-        return 0.0
+    stat = get_file_stat(file_path)
+    return stat.st_size / (1 << 20) if stat else 0.0
+
+
+@lru_cache(maxsize=256)
+def _ensure_directory_cached(path: str) -> Path:
+    """Create a directory once per process; existence is assumed to persist"""
+    
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
 
 
 def ensure_directory(path: Union[str, Path]) -> Path:
     """Ensure directory exists, create if necessary"""
     
-    path = Path(path)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return _ensure_directory_cached(os.fspath(path))
 
 
 def get_relative_time(timestamp: datetime) -> str:
     """Get relative time string (e.g., '2 hours ago')"""
     
-    now = datetime.utcnow()
-    diff = now - timestamp
-    
-    if diff.days > 0:
-        return f"{diff.days} day{'s' if diff.days != 1 else ''} ago"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif diff.seconds > 60:
-        minutes = diff.seconds // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    else:
-        return "just now"
+    # Naive timestamps are UTC throughout the app
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    elapsed = time.time() - timestamp.timestamp()
+    
+    for unit_seconds, name in _RELATIVE_TIME_UNITS:
+        if elapsed >= unit_seconds:
+            count = int(elapsed // unit_seconds)
+            return f"{count} {name}{'s' if count != 1 else ''} ago"
+    
+    return "just now"
 
 
 def highlight_code(code: str, language: str = "python") -> str:
@@ -398,29 +536,27 @@ def highlight_code(code: str, language: str = "python") -> str:
 def extract_urls(text: str) -> List[str]:
     """Extract URLs from text"""
     
-    url_pattern = r'https?://[^\s<>"\']+[^\s<>"\'.,;:!?]'
-    return re.findall(url_pattern, text)
+    return _URL_RE.findall(text)
+
+
+def _mask_match(match: re.Match) -> str:
+    """Replacement for one API key, email address or Slack token"""
+    
+    kind = match.lastgroup
+    if kind == 'apikey':
+        return match.group(0)[:8] + '***'
+    if kind == 'email':
+        return f"{match.group('user')}***@{match.group('domain')}"
+    return match.group(0)[:10] + '***'
 
 
 def mask_sensitive_data(text: str) -> str:
     """Mask sensitive data in text"""
     
-    # Mask API keys
-    text = re.sub(r'(sk-[a-zA-Z0-9]{32,})', r'\1[:8]***', text)
-    
-    # Mask email addresses
-    text = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'\1***@\2', text)
-    
-    # Mask tokens
-    text = re.sub(r'(xoxb-[a-zA-Z0-9-]+)', r'\1[:10]***', text)
-    
-    return text
+    return _MASK_RE.sub(_mask_match, text)
 
 
-def display_startup_banner():
-    """Display startup banner"""
-    
-    banner = """
+_BANNER_TEXT = """
     ╔═══════════════════════════════════════════════════════════════╗
     ║                                                               ║
     ║                      JACE BERELEN POC                         ║
@@ -432,18 +568,29 @@ def display_startup_banner():
     ║                                                               ║
     ╚═══════════════════════════════════════════════════════════════╝
     """
+
+# Built once at import; settings are resolved by then
+_BANNER_RENDERABLE = Group(
+    Panel(_BANNER_TEXT, style="bold blue"),
+    Text.from_markup(f"Starting in [bold]{settings.environment}[/bold] mode"),
+    Text.from_markup(f"Log level: [bold]{settings.log_level}[/bold]"),
+    Text.from_markup(f"Database: [bold]{settings.database_url.split('://')[0]}[/bold]"),
+    Text.from_markup(f"AI Model: [bold]{settings.ai_model_primary}[/bold]"),
+    Text(""),
+)
+
+
+def display_startup_banner():
+    """Display startup banner"""
     
-    console.print(Panel(banner, style="bold blue"))
-    console.print(f"Starting in [bold]{settings.environment}[/bold] mode")
-    console.print(f"Log level: [bold]{settings.log_level}[/bold]")
-    console.print(f"Database: [bold]{settings.database_url.split('://')[0]}[/bold]")
-    console.print(f"AI Model: [bold]{settings.ai_model_primary}[/bold]")
-    console.print("")
+    console.print(_BANNER_RENDERABLE, soft_wrap=True)
 
 
 __all__ = [
     "setup_logging",
     "get_system_info",
+    "utc_timestamp",
+    "build_task_table",
     "format_task_list",
     "parse_time_estimate",
     "extract_priority",
@@ -456,6 +603,7 @@ __all__ = [
     "sanitize_filename",
     "create_progress_bar",
     "parse_json_safely",
+    "get_file_stat",
     "get_file_size_mb",
     "ensure_directory",
     "get_relative_time",
@@ -0,0 +1,17 @@
+import os
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+# Make `scripts` importable however pytest is invoked
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def fast_tmpdir():
+    """Factory for temporary directories, on tmpfs when the platform has a writable one"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    return partial(tempfile.TemporaryDirectory, dir=base)
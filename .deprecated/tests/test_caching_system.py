@@ -5,10 +5,9 @@ import tempfile
 import time
 from pathlib import Path
 import shutil
-import hashlib
 
-# Import the caching system (to be implemented)
-# from scripts.caching_system import CachingSystem, CacheSimilarityDetector
+# Import the caching system
+from scripts.caching_system import CachingSystem, CacheSimilarityDetector, _task_fingerprint
 
 # Test data
 SAMPLE_TASK1 = """---
@@ -79,17 +78,17 @@ SAMPLE_ANALYSIS3 = {
 
 class TestCachingSystem:
     @pytest.fixture
-    def temp_cache_dir(self):
+    def temp_cache_dir(self, fast_tmpdir):
         """Create a temporary directory for cache testing"""
-        with tempfile.TemporaryDirectory() as tmpdirname:
+        with fast_tmpdir() as tmpdirname:
             cache_dir = Path(tmpdirname) / "cache"
             cache_dir.mkdir()
             yield cache_dir
     
-    @pytest.fixture
-    def temp_task_dir(self):
-        """Create a temporary directory structure for tasks"""
-        with tempfile.TemporaryDirectory() as tmpdirname:
+    @pytest.fixture(scope="module")
+    def temp_task_dir(self, fast_tmpdir):
+        """Create a temporary directory structure for tasks, shared by the module's tests"""
+        with fast_tmpdir() as tmpdirname:
             # Create directory structure
             task_dir = Path(tmpdirname)
             todo_dir = task_dir / "TASKS" / "TODO"
@@ -160,8 +159,8 @@ class TestCachingSystem:
         # detector = CacheSimilarityDetector(cache)
         # 
         # # Store some analyses
-        # cache.store(f"analysis_{hashlib.md5(SAMPLE_TASK1.encode()).hexdigest()}", SAMPLE_ANALYSIS1)
-        # cache.store(f"analysis_{hashlib.md5(SAMPLE_TASK3.encode()).hexdigest()}", SAMPLE_ANALYSIS3)
+        # cache.store(f"analysis_{_task_fingerprint(SAMPLE_TASK1)}", SAMPLE_ANALYSIS1)
+        # cache.store(f"analysis_{_task_fingerprint(SAMPLE_TASK3)}", SAMPLE_ANALYSIS3)
         # 
         # # Check similarity
         # similar_task = detector.find_similar_task(SAMPLE_TASK2)
@@ -182,6 +181,48 @@ class TestCachingSystem:
         # assert similar_task is None
         assert True  # Placeholder until implementation
     
+    def test_cache_task_analysis_updates_index(self, temp_cache_dir):
+        """Test that caching an analysis updates the similarity index in place"""
+        cache = CachingSystem(cache_dir=temp_cache_dir)
+        detector = CacheSimilarityDetector(cache)
+        detector.cache_task_analysis(SAMPLE_TASK1, SAMPLE_ANALYSIS1)
+        detector.find_similar_task(SAMPLE_TASK2)  # Builds the index
+        
+        detector.cache_task_analysis(SAMPLE_TASK3, SAMPLE_ANALYSIS3)
+        
+        # Index already reflects the new task, so the next lookup won't rebuild it
+        assert detector._index_version == cache._version
+        assert _task_fingerprint(SAMPLE_TASK3) in detector._index
+        assert len(detector._length_hashes) == 2
+    
+    def test_cache_task_analysis_replaces_index_entry(self, temp_cache_dir):
+        """Test that re-caching the same task keeps the length index consistent"""
+        cache = CachingSystem(cache_dir=temp_cache_dir)
+        detector = CacheSimilarityDetector(cache)
+        detector.cache_task_analysis(SAMPLE_TASK1, SAMPLE_ANALYSIS1)
+        detector.cache_task_analysis(SAMPLE_TASK3, SAMPLE_ANALYSIS3)
+        detector.find_similar_task(SAMPLE_TASK2)  # Builds the index
+        
+        # Same fingerprint, so the existing index entry is replaced rather than duplicated
+        task_hash = _task_fingerprint(SAMPLE_TASK1)
+        detector.cache_task_analysis(SAMPLE_TASK1, SAMPLE_ANALYSIS3)
+        
+        assert detector._index_version == cache._version
+        assert detector._length_hashes.count(task_hash) == 1
+        assert detector._lengths == sorted(detector._lengths)
+        assert len(detector._lengths) == len(detector._index) == 2
+        i = detector._length_hashes.index(task_hash)
+        assert detector._lengths[i] == len(detector._index[task_hash][0])
+        assert detector._index[task_hash][0] == SAMPLE_TASK1.split("---", 2)[2].strip()
+        assert cache.retrieve(f"analysis_{task_hash}") == SAMPLE_ANALYSIS3
+    
+    def test_task_fingerprint_uses_raw_content(self):
+        """Test that tasks differing only in case, spacing or front-matter get distinct keys"""
+        fingerprint = _task_fingerprint(SAMPLE_TASK1)
+        assert _task_fingerprint(SAMPLE_TASK1.lower()) != fingerprint
+        assert _task_fingerprint(SAMPLE_TASK1.replace("- Must", "-   Must")) != fingerprint
+        assert _task_fingerprint(SAMPLE_TASK1.replace("sample_task1", "other_task")) != fingerprint
+    
     def test_token_savings_tracking(self, temp_cache_dir):
         """Test tracking of token savings"""
         # cache = CachingSystem(cache_dir=temp_cache_dir)
@@ -202,15 +243,94 @@ class TestCachingSystem:
     
     def test_cache_persistence(self, temp_cache_dir):
         """Test that cache persists between instances"""
-        # # First instance
-        # cache1 = CachingSystem(cache_dir=temp_cache_dir)
-        # cache1.store("persistent_key", {"data": "should persist"})
-        # 
-        # # Second instance
-        # cache2 = CachingSystem(cache_dir=temp_cache_dir)
-        # retrieved = cache2.retrieve("persistent_key")
-        # assert retrieved == {"data": "should persist"}
-        assert True  # Placeholder until implementation
+        # First instance
+        cache1 = CachingSystem(cache_dir=temp_cache_dir)
+        cache1.store("persistent_key", {"data": "should persist"})
+        cache1.flush()
+        
+        # Second instance
+        cache2 = CachingSystem(cache_dir=temp_cache_dir)
+        retrieved = cache2.retrieve("persistent_key")
+        assert retrieved == {"data": "should persist"}
+        
+        # Changes are replayed from the write-ahead log, not just the snapshot
+        cache2.invalidate("persistent_key")
+        cache2.store("wal_key", {"data": "from the log"})
+        cache2.flush()
+        cache3 = CachingSystem(cache_dir=temp_cache_dir)
+        assert cache3.retrieve("persistent_key") is None
+        assert cache3.retrieve("wal_key") == {"data": "from the log"}
+    
+    def test_cache_wal_compaction(self, temp_cache_dir):
+        """Test that compaction folds the log into the snapshot"""
+        cache = CachingSystem(cache_dir=temp_cache_dir)
+        cache.store("analysis_abc", {"data": 1})
+        cache.store("plain", {"data": 2})
+        cache.flush()
+        assert cache.wal_path.stat().st_size > 0
+        
+        cache._compact()
+        assert cache.wal_path.stat().st_size == 0
+        snapshot = json.loads(cache.cache_db_path.read_text())
+        assert set(snapshot) == {"analysis_abc", "plain"}  # Flat keys on disk
+        
+        reloaded = CachingSystem(cache_dir=temp_cache_dir)
+        assert reloaded.retrieve("analysis_abc") == {"data": 1}
+        assert reloaded.retrieve("plain") == {"data": 2}
+    
+    def test_cache_wal_torn_last_line(self, temp_cache_dir):
+        """Test that a partially written final log record is ignored"""
+        cache = CachingSystem(cache_dir=temp_cache_dir)
+        cache.store("complete_key", {"data": "kept"})
+        cache.flush()
+        
+        # Simulate a crash in the middle of appending the next record
+        with open(cache.wal_path, "ab") as f:
+            f.write(b'{"op": "put", "k": "torn_key", "v": {"da')
+        
+        reloaded = CachingSystem(cache_dir=temp_cache_dir)
+        assert reloaded.retrieve("complete_key") == {"data": "kept"}
+        assert reloaded.retrieve("torn_key") is None
+    
+    def test_cache_invalidate_namespace(self, temp_cache_dir):
+        """Test that invalidating one key prefix survives a reload"""
+        cache = CachingSystem(cache_dir=temp_cache_dir)
+        cache.store("analysis_a", {"data": "a"})
+        cache.store("analysis_b", {"data": "b"})
+        cache.store("task_a", "task text")
+        cache.flush()
+        cache._compact()
+        
+        # The clear is logged, so it applies on top of the snapshot
+        cache.invalidate_all("analysis")
+        cache.flush()
+        assert cache.retrieve("analysis_a") is None
+        
+        reloaded = CachingSystem(cache_dir=temp_cache_dir)
+        assert reloaded.retrieve("analysis_a") is None
+        assert reloaded.retrieve("analysis_b") is None
+        assert reloaded.retrieve("task_a") == "task text"
+    
+    def test_cache_wal_compaction_keeps_other_writers(self, temp_cache_dir):
+        """Test that compacting does not drop records another instance appended"""
+        cache_a = CachingSystem(cache_dir=temp_cache_dir)
+        cache_b = CachingSystem(cache_dir=temp_cache_dir)
+        cache_a.store("analysis_a", {"data": "a"})
+        cache_a.flush()
+        cache_b.store("analysis_x", {"data": "x"})
+        cache_b.flush()
+        
+        cache_a._compact()
+        assert cache_a.retrieve("analysis_x") == {"data": "x"}
+        
+        # B keeps appending to the truncated log after A's compaction
+        cache_b.store("analysis_y", {"data": "y"})
+        cache_b.flush()
+        
+        reloaded = CachingSystem(cache_dir=temp_cache_dir)
+        assert reloaded.retrieve("analysis_a") == {"data": "a"}
+        assert reloaded.retrieve("analysis_x") == {"data": "x"}
+        assert reloaded.retrieve("analysis_y") == {"data": "y"}
     
     def test_automatic_cache_cleanup(self, temp_cache_dir):
         """Test automatic cleanup of old cache entries"""
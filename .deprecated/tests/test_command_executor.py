@@ -0,0 +1,119 @@
+import asyncio
+import importlib
+import sys
+import types
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+@pytest.fixture
+def command_executor(monkeypatch):
+    """Import src.command_executor without loading settings or the database"""
+    monkeypatch.setitem(sys.modules, "src.config", types.SimpleNamespace(settings=None, validate_environment=None))
+    monkeypatch.setitem(sys.modules, "src.database", types.SimpleNamespace(interaction_log_writer=None))
+    return importlib.import_module("src.command_executor")
+
+
+@pytest.fixture
+def executor(command_executor, fast_tmpdir):
+    with fast_tmpdir() as tmpdir:
+        executor = command_executor.SecureCommandExecutor(tmpdir)
+        executor.set_workspace("task1", "user1")
+        yield executor
+
+
+def _fake_export(monkeypatch, command_executor, output):
+    """Make `aws configure export-credentials` print `output`; returns the envs it was spawned with"""
+    spawned_envs = []
+
+    async def fake_spawn(argv, cwd, env):
+        spawned_envs.append(dict(env))
+        stdout, stderr = asyncio.StreamReader(), asyncio.StreamReader()
+        stdout.feed_data(output.encode())
+        stdout.feed_eof()
+        stderr.feed_eof()
+        return types.SimpleNamespace(wait=lambda: 0), stdout, stderr
+
+    monkeypatch.setattr(command_executor, "_spawn_in_executor", fake_spawn)
+    monkeypatch.setitem(command_executor.SecureCommandExecutor._EXECUTABLES, "aws", "/usr/bin/aws")
+    return spawned_envs
+
+
+def test_expired_aws_credentials_are_scrubbed_before_refresh(monkeypatch, command_executor, executor):
+    """A refresh must not hand the CLI the keys it exported last time"""
+    expired = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+    _fake_export(monkeypatch, command_executor, (
+        "export AWS_ACCESS_KEY_ID=OLDKEY\n"
+        "export AWS_SECRET_ACCESS_KEY=oldsecret\n"
+        "export AWS_SESSION_TOKEN=oldtoken\n"
+        f"export AWS_CREDENTIAL_EXPIRATION={expired}\n"
+    ))
+    asyncio.run(executor._ensure_aws_credentials())
+    assert executor._current_env["AWS_ACCESS_KEY_ID"] == "OLDKEY"
+
+    # Second export returns fresh long-lived keys without a session token
+    spawned_envs = _fake_export(monkeypatch, command_executor, (
+        "export AWS_ACCESS_KEY_ID=NEWKEY\n"
+        "export AWS_SECRET_ACCESS_KEY=newsecret\n"
+    ))
+    asyncio.run(executor._ensure_aws_credentials())
+
+    assert len(spawned_envs) == 1
+    for key in command_executor._AWS_EXPORTED_KEYS:
+        assert key not in spawned_envs[0]
+    assert executor._current_env["AWS_ACCESS_KEY_ID"] == "NEWKEY"
+    assert executor._current_env["AWS_SECRET_ACCESS_KEY"] == "newsecret"
+    assert "AWS_SESSION_TOKEN" not in executor._current_env
+    assert "AWS_CREDENTIAL_EXPIRATION" not in executor._current_env
+    assert executor._aws_credentials_expiry is None
+
+
+def test_unexpired_aws_credentials_are_reused(monkeypatch, command_executor, executor):
+    expires = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    spawned_envs = _fake_export(monkeypatch, command_executor, (
+        "export AWS_ACCESS_KEY_ID=KEY\n"
+        f"export AWS_CREDENTIAL_EXPIRATION={expires}\n"
+    ))
+    asyncio.run(executor._ensure_aws_credentials())
+    asyncio.run(executor._ensure_aws_credentials())
+
+    assert len(spawned_envs) == 1
+    assert executor._current_env["AWS_ACCESS_KEY_ID"] == "KEY"
+
+
+def test_read_stream_keeps_head_and_tail(monkeypatch, command_executor):
+    monkeypatch.setattr(command_executor, "STREAM_OUTPUT_LIMIT", 1000)
+    data = bytes(range(256)) * 40
+
+    async def read(payload):
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        reader.feed_eof()
+        return await command_executor._read_stream(reader)
+
+    assert asyncio.run(read(data[:1000])) == data[:1000]
+
+    output = asyncio.run(read(data))
+    assert output.startswith(data[:500])
+    assert output.endswith(data[-500:])
+    assert b"[%d bytes omitted]" % (len(data) - 1000) in output
+    assert len(output) < 1100
+
+
+def test_set_workspace_recreates_removed_directory(executor):
+    workspace = executor.current_workspace
+    executor.set_workspace("task2", "user1")
+    workspace.rmdir()
+
+    assert executor.set_workspace("task1", "user1") == workspace
+    assert workspace.is_dir()
+    assert executor._workspace_error is None
+
+
+def test_shell_builtins_are_not_whitelisted(executor):
+    # Commands are exec'd without a shell, so builtins have no binary to run
+    for command in ("cd subdir", "dir", "type notes.txt", "where python"):
+        allowed, reason, _ = executor._validate_command(command)
+        assert not allowed
+        assert "not in whitelist" in reason
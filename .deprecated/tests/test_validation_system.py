@@ -2,6 +2,7 @@ import pytest
 import os
 import json
 import tempfile
+import shutil
 from pathlib import Path
 
 # Import the validation system (to be implemented)
@@ -53,10 +54,10 @@ def sonnet_about_python():
 """
 
 class TestValidationSystem:
-    @pytest.fixture
-    def temp_task_dir(self):
-        """Create a temporary directory structure for tasks"""
-        with tempfile.TemporaryDirectory() as tmpdirname:
+    @pytest.fixture(scope="module")
+    def temp_task_dir(self, fast_tmpdir):
+        """Create a temporary directory structure for tasks, shared by the module's tests"""
+        with fast_tmpdir() as tmpdirname:
             # Create directory structure
             task_dir = Path(tmpdirname)
             todo_dir = task_dir / "TASKS" / "TODO"
@@ -77,6 +78,14 @@ class TestValidationSystem:
             
             yield task_dir
     
+    @pytest.fixture
+    def scratch_task_dir(self, fast_tmpdir, temp_task_dir):
+        """Private copy of the task tree for tests that write into it"""
+        with fast_tmpdir() as tmpdirname:
+            task_dir = Path(tmpdirname) / "task"
+            shutil.copytree(temp_task_dir, task_dir)
+            yield task_dir
+    
     def test_validation_runner_initialization(self, temp_task_dir):
         """Test that the validation runner initializes correctly"""
         # validator = ValidationRunner(temp_task_dir)
@@ -85,10 +94,10 @@ class TestValidationSystem:
         # assert validator.done_dir == temp_task_dir / "TASKS" / "DONE"
         assert True  # Placeholder until implementation
     
-    def test_test_execution(self, temp_task_dir):
+    def test_test_execution(self, scratch_task_dir):
         """Test that tests are executed and results captured"""
         # Create a dummy test file
-        test_dir = temp_task_dir / "tests"
+        test_dir = scratch_task_dir / "tests"
         test_dir.mkdir(exist_ok=True)
         
         test_file = test_dir / "test_dummy.py"
@@ -100,7 +109,7 @@ def test_failing():
     assert False
 """)
         
-        # validator = ValidationRunner(temp_task_dir)
+        # validator = ValidationRunner(scratch_task_dir)
         # results = validator.run_tests("test_dummy")
         # assert results['total'] == 2
         # assert results['passed'] == 1
@@ -124,9 +133,9 @@ def test_failing():
         # assert all('satisfied' in req for req in tracing)
         assert True  # Placeholder until implementation
     
-    def test_validation_report_generation(self, temp_task_dir):
+    def test_validation_report_generation(self, scratch_task_dir):
         """Test that validation reports are correctly generated"""
-        # validator = ValidationRunner(temp_task_dir)
+        # validator = ValidationRunner(scratch_task_dir)
         # report = validator.generate_report("test_task")
         # assert 'task_id' in report
         # assert 'validation_status' in report
@@ -135,22 +144,22 @@ def test_failing():
         # assert 'requirements' in report
         assert True  # Placeholder until implementation
     
-    def test_validation_failure_handling(self, temp_task_dir):
+    def test_validation_failure_handling(self, scratch_task_dir):
         """Test that validation failures are correctly handled"""
         # Create a bad implementation
-        bad_impl_file = temp_task_dir / "src" / "bad_task.py"
+        bad_impl_file = scratch_task_dir / "src" / "bad_task.py"
         bad_impl_file.parent.mkdir(exist_ok=True)
         bad_impl_file.write_text("def bad_function(): syntax error here")
         
-        # validator = ValidationRunner(temp_task_dir)
+        # validator = ValidationRunner(scratch_task_dir)
         # result = validator.validate_task("bad_task")
         # assert result['validation_status'] == 'failed'
         # assert 'syntax error' in result['errors'][0].lower()
         assert True  # Placeholder until implementation
     
-    def test_full_validation_workflow(self, temp_task_dir):
+    def test_full_validation_workflow(self, scratch_task_dir):
         """Test the full validation workflow"""
-        # validator = ValidationRunner(temp_task_dir)
+        # validator = ValidationRunner(scratch_task_dir)
         # result = validator.run_validation("test_task")
         # assert result['task_id'] == 'test_task'
         # assert 'validation_status' in result